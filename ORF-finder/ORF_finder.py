@@ -1,11 +1,14 @@
+import hashlib
 import os
-from typing import Tuple, List, Dict
+import re
+from itertools import groupby
+from typing import Tuple, Iterator, Iterable
 
 # Import helper functions
 # Can be found in my GitHub repository "Codetoolbox".
 from Utility.fasta_reader import read_fasta
 from Utility.reverse_complement import reverse_complement
-from Utility.condon_mapper import codon_mapping
+from Utility.condon_mapper import translate_sequence
 
 class ORFFinder:
     """
@@ -24,11 +27,9 @@ class ORFFinder:
         output_path (str): Path to the output result file.
         raw_sequence (str): Raw DNA sequence read from the input file.
         rev_complement (str): Reverse complement of the raw DNA sequence.
-        sequences (Dict[str, str]): Dictionary to store sequence names and their respective DNA sequences.
-        start_dictionary (Dict[str, List[int]]): Dictionary to store start codon positions for each sequence.
-        stop_dictionary (Dict[str, List[int]]): Dictionary to store stop codon positions for each sequence.
-        orf_positions (Dict[str, Dict[int, int]]): Dictionary to store ORF positions for each sequence.
+        orf_positions (List[Tuple[str, int, int, int]]): List of ORFs as (strand, frame, start, end) tuples.
         translated_orf (List[str]): List to store translated protein sequences from identified ORFs.
+        min_length (int): Minimum length of reported proteins in amino acids.
     """
     
     # Class constants
@@ -38,13 +39,14 @@ class ORFFinder:
     STOP_CODONS = ["TAG", "TGA", "TAA"]
    
     
-    def __init__(self, input_path: str = None, output_path:str = None) -> None:
+    def __init__(self, input_path: str = None, output_path:str = None, min_length: int = 1) -> None:
         """
         Initializes an ORFFinder object with optional custom input and output paths.
 
         Args:
             input_path (str, optional): Path to the input data file. Defaults to None.
             output_path (str, optional): Path to the output result file. Defaults to None.
+            min_length (int, optional): Minimum length of reported proteins in amino acids. Defaults to 1.
 
         Returns:
             None
@@ -53,11 +55,9 @@ class ORFFinder:
         self.output_path = output_path or self.DEFAULT_OUTPUT_PATH
         self.raw_sequence = None
         self.rev_complement = None
-        self.sequences = {}
-        self.start_dictionary = {}
-        self.stop_dictionary = {}
-        self.orf_positions = {}
+        self.orf_positions = []
         self.translated_orf = []
+        self.min_length = min_length
     
     def read_sequence(self) -> None:
         """
@@ -97,111 +97,111 @@ class ORFFinder:
         # Transform DNA sequence in reverse complement
         self.rev_complement = reverse_complement(dna_sequence=self.raw_sequence)
     
-    def generate_reading_frames(self) -> None:
+    def scan_strand(self, sequence: str, strand: str) -> Iterator[Tuple[str, int, int, int]]:
         """
-        Generates reading frames for both forward and reverse strands.
+        Scans one strand for Open Reading Frames in a single pass over all three frames.
 
-        Updates the 'sequences' attribute of the class with reading frames on the
-        forward and reverse strands.
+        A regular expression finds every start and stop codon position. Starts are collected per
+        frame until the next stop codon of the same frame, which closes all of them, so the runtime
+        is linear in the sequence length plus the number of ORFs.
 
-        Returns:
-            None
+        Args:
+            sequence (str): DNA sequence of the strand.
+            strand (str): Name of the strand, "+" or "-".
+
+        Yields:
+            Tuple[str, int, int, int]: ORF as (strand, frame, start, end), where start is the position
+                of the start codon and end the position of the stop codon on the strand.
         """
-        # Create reading frames on forward strand
-        self.sequences["for_1"] = self.raw_sequence
-        self.sequences["for_2"] = self.raw_sequence[1:]
-        self.sequences["for_3"] = self.raw_sequence[2:]
-        # Create reading frames on reverse strand
-        self.sequences["rev_1"] = self.rev_complement
-        self.sequences["rev_2"] = self.rev_complement[1:]
-        self.sequences["rev_3"] = self.rev_complement[2:]
+        codon_pattern = re.compile(f"(?=({'|'.join([self.START_CODON] + self.STOP_CODONS)}))")
+        open_starts = ([], [], [])
+        for match in codon_pattern.finditer(sequence):
+            position = match.start()
+            frame = position % 3
+            if match.group(1) == self.START_CODON:
+                open_starts[frame].append(position)
+            else:
+                for start in open_starts[frame]:
+                    yield strand, frame, start, position
+                open_starts[frame].clear()
     
-    def find_start(self) -> None:
+    def scan_orfs(self) -> Iterator[Tuple[str, int, int, int]]:
         """
-        Finds start codon positions in each reading frame.
+        Scans the forward strand and its reverse complement for Open Reading Frames.
 
-        Updates the 'start_dictionary' attribute of the class with the positions of
-        start codons in each reading frame.
-
-        Returns:
-            None
+        Yields:
+            Tuple[str, int, int, int]: ORF as (strand, frame, start, end), see 'scan_strand'.
+                Positions on the "-" strand refer to the reverse complement.
         """
-        for name, sequence in self.sequences.items():
-            start_positions = [step for step in range(0, len(sequence), 3) if sequence[step:step+3] == self.START_CODON]
-            self.start_dictionary[name] = start_positions
+        yield from self.scan_strand(self.raw_sequence, "+")
+        yield from self.scan_strand(self.rev_complement, "-")
     
-    def find_stop(self) -> None:
+    def find_orf(self) -> None:
         """
-        Finds stop codon positions in each reading frame.
+        Finds Open Reading Frames (ORFs) on both strands and stores them in the 'orf_positions' attribute.
 
-        Updates the 'stop_dictionary' attribute of the class with the positions of
-        stop codons in each reading frame.
+        Each start codon is paired with the first stop codon of the same frame downstream of it.
 
         Returns:
             None
         """
-        for name, sequence in self.sequences.items():
-            stop_positions = [step for step in range(0, len(sequence), 3) if sequence[step:step+3] in self.STOP_CODONS]
-            self.stop_dictionary[name] = stop_positions
-    
-    def find_orf(self) -> None:
+        self.orf_positions = list(self.scan_orfs())
+        
+    def iterate_proteins(self, orfs: Iterable[Tuple[str, int, int, int]] = None) -> Iterator[str]:
         """
-        Finds Open Reading Frames (ORFs) in each reading frame and stores their positions in the 'orf_positions' attribute.
+        Lazily translates Open Reading Frames (ORFs) into protein sequences.
 
-        Uses the sorted lists of start and stop positions from 'start_dictionary' and 'stop_dictionary' respectively.
-        Iterates through start and stop positions to identify the first valid start-stop codon pair for each reading frame.
+        Nested ORFs share their stop codon, so consecutive ORFs with the same strand, frame and end
+        are grouped. The region from the first start codon of a group to the stop codon is translated
+        once and the proteins of the nested ORFs are derived as suffixes of it. Proteins shorter than
+        'min_length' are skipped.
 
-        Returns:
-            None
+        Args:
+            orfs (Iterable[Tuple[str, int, int, int]], optional): ORFs as (strand, frame, start, end)
+                tuples. Defaults to a new scan of both strands.
+
+        Yields:
+            str: The protein sequence of every ORF.
         """
-        for key in self.sequences:
-            orf_dict = {}
-             # Sort start and stop positions
-            start_pos = sorted(self.start_dictionary[key])
-            stop_pos = sorted(self.stop_dictionary[key])
-            # Iterate over start positions
-            for st_pos in start_pos:
-                # Iterate over stop positions
-                for sp_pos in stop_pos:
-                    # Check if stop position is greater than start position
-                    if sp_pos > st_pos:
-                        # Save ORF
-                        orf_dict[st_pos] = sp_pos
-                        # Break loop to only save the first start-stop-codon pair
-                        break
-            self.orf_positions[key] = orf_dict
-        
+        if orfs is None:
+            orfs = self.scan_orfs()
+        strands = {"+": self.raw_sequence, "-": self.rev_complement}
+        for (strand, _, stop_pos), group in groupby(orfs, key=lambda orf: (orf[0], orf[1], orf[3])):
+            start_positions = sorted(orf[2] for orf in group)
+            first_start = start_positions[0]
+            # The region contains no stop codon in frame, so it is translated completely
+            region_protein = translate_sequence(strands[strand][first_start:stop_pos], mode="DNA")
+            for start_pos in start_positions:
+                protein_sequence = region_protein[(start_pos - first_start) // 3:]
+                if len(protein_sequence) < self.min_length:
+                    # Later starts only give shorter proteins
+                    break
+                yield protein_sequence
+    
     def translate_orf(self) -> None:
         """
         Translate Open Reading Frames (ORFs) in amino acid sequences using codon mapping.
 
-        This method iterates over the ORF dictionary stored in the object and translates
-        each ORF sequence to a protein sequence using codon mapping. The translated
+        This method translates the ORFs stored in the object with 'iterate_proteins'. The translated
         protein sequences are appended to the `translated_orf` list in the object.
 
         Returns:
             None
         """
-        # Iterate over orf dictionary and continue only with filled dictionaries
-        for seq, orf in self.orf_positions.items():
-            for start_pos, stop_pos in orf.items():
-                dna_sequence = self.sequences[seq][start_pos:stop_pos]
-                protein_sequence = codon_mapping(sequence=dna_sequence, mode="DNA")
-                
-                self.translated_orf.append(protein_sequence)
+        self.translated_orf.extend(self.iterate_proteins(self.orf_positions))
     
     def remove_duplicates(self) -> None:
         """
         Remove duplicate protein sequences from the translated ORF list.
 
-        This method utilizes a set to remove duplicate protein sequences from the
-        `translated_orf` list in the object. After applying this method, the list
-        will only contain unique protein sequences.
+        This method keeps the first occurrence of every protein sequence in the
+        `translated_orf` list in the object, so the order of the proteins is the
+        scan order written by 'stream_result' as well.
 
         Returns:
             None
         """
-        self.translated_orf = set(self.translated_orf)
+        self.translated_orf = list(dict.fromkeys(self.translated_orf))
     
     def write_result(self) -> None:
         """
@@ -217,17 +217,33 @@ class ORFFinder:
             for orf in self.translated_orf:
                 file.write(f"{orf}\n")
     
+    def stream_result(self) -> None:
+        """
+        Write unique ORF protein sequences to the output file as they are found.
+
+        The ORFs of both strands are scanned, translated and written one by one without
+        storing them. Duplicates are recognized by a 16 byte digest of every written protein,
+        so memory does not grow with the length of the proteins.
+
+        Returns:
+            None
+        """
+        written_digests = set()
+        with open(self.output_path, "w") as file:
+            for protein_sequence in self.iterate_proteins():
+                digest = hashlib.blake2b(protein_sequence.encode("ascii"), digest_size=16).digest()
+                if digest not in written_digests:
+                    written_digests.add(digest)
+                    file.write(f"{protein_sequence}\n")
 
-        
 
 def main():
     """
     Main function to execute the Open Reading Frame (ORF) analysis pipeline.
 
     This function creates an instance of the ORFFinder class, reads the DNA sequence
-    from the input file, transforms the sequence, generates reading frames, identifies
-    start and stop codons, finds ORFs, translates ORFs into protein sequences, and
-    writes the results to the output file.
+    from the input file, transforms the sequence, and streams the unique proteins of all
+    ORFs on both strands to the output file.
 
     Returns:
         None
@@ -235,13 +251,7 @@ def main():
     orf_finder = ORFFinder()
     orf_finder.read_sequence()
     orf_finder.transform_sequence()
-    orf_finder.generate_reading_frames()
-    orf_finder.find_start()
-    orf_finder.find_stop()
-    orf_finder.find_orf()
-    orf_finder.translate_orf()
-    orf_finder.remove_duplicates()
-    orf_finder.write_result()
+    orf_finder.stream_result()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
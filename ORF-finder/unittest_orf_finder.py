@@ -30,62 +30,54 @@ class TestORFFinder(unittest.TestCase):
         result = tester.rev_complement
         self.assertEqual(result, expected_seq)
     
-    def test_generate_reading_frames(self):
-        """Test the generation of reading frames and their equality for forward and reverse strands."""
+    def test_scan_strand_codons(self):
+        """Test that the start codon and every stop codon are recognized in each frame."""
         tester = ORFFinder()
-        # Test if reading frames are correct and equal for forward and reverse
-        tester.raw_sequence = "CCGCTGCCCTGGCGCCGCTGGGCGGCGGTG"
-        tester.rev_complement = tester.raw_sequence
-        tester.generate_reading_frames()
-        sequences = tester.sequences
-        # Check if sequences are equal
-        self.assertEqual(sequences["for_1"], sequences["rev_1"])
-        self.assertEqual(sequences["for_2"], sequences["rev_2"])
-        self.assertEqual(sequences["for_3"], sequences["rev_3"])
+        for stop_codon in tester.STOP_CODONS:
+            for frame in range(3):
+                sequence = "C" * frame + "ATG" + stop_codon
+                self.assertListEqual(list(tester.scan_strand(sequence, "+")), [("+", frame, frame, frame + 3)])
+        # Without stop codon no ORF is found
+        self.assertListEqual(list(tester.scan_strand("ATGA", "+")), [])
     
-    def test_find_start(self):
-        """Test the identification of start codons in a DNA sequence."""
+    def test_scan_orfs(self):
+        """Test that nested ORFs sharing a stop codon are found on both strands in one pass."""
         tester = ORFFinder()
-        tester.raw_sequence = "ATGA"
+        tester.raw_sequence = "ATGATGTAGCTACAT"
         tester.transform_sequence()
-        tester.generate_reading_frames()
-        tester.find_start()
-        found_starts = 0
-        for values in tester.start_dictionary.values():
-            found_starts += len(values)
-        self.assertEqual(found_starts, 1)
+        expected_orfs = [("+", 0, 0, 6), ("+", 0, 3, 6), ("-", 0, 0, 3)]
+        self.assertListEqual(list(tester.scan_orfs()), expected_orfs)
     
-    def test_find_stop(self):
-        """Test the identification of stop codons in a DNA sequence."""
-        tester = ORFFinder()
-        tester.raw_sequence = "TAGTGATAA"
+    def test_iterate_proteins(self):
+        """Test that nested proteins are derived from one translation and filtered by length."""
+        tester = ORFFinder(input_path=integration_path, min_length=2)
+        tester.read_sequence()
         tester.transform_sequence()
-        tester.generate_reading_frames()
-        tester.find_stop()
-        found_stops = 0
-        for values in tester.stop_dictionary.values():
-            found_stops += len(values)
-        
-        self.assertEqual(found_stops, 3)
+        expected_proteins = sorted(["MLLGSFRLIPKETLIQVAGSSPCNLS", "MGMTPRLGLESLLE", "MTPRLGLESLLE"])
+        self.assertListEqual(sorted(set(tester.iterate_proteins())), expected_proteins)
     
     def test_intergation(self):
         """Test the complete functionality of the ORFFinder class on an input DNA sequence."""
-        expected_lines = sorted(["MLLGSFRLIPKETLIQVAGSSPCNLS", "M", "MGMTPRLGLESLLE", "MTPRLGLESLLE"])
+        with open(integration_output, "r") as file:
+            expected_lines = [line.strip() for line in file]
         tester = ORFFinder(input_path=integration_path, output_path=integration_output)
         tester.read_sequence()
         tester.transform_sequence()
-        tester.generate_reading_frames()
-        tester.find_start()
-        tester.find_stop()
         tester.find_orf()
         tester.translate_orf()
         tester.remove_duplicates()
         tester.write_result()
         
         with open(integration_output, "r") as file:
-            actual_lines = sorted([line.strip() for line in file])
+            actual_lines = [line.strip() for line in file]
             
+        self.assertListEqual(sorted(actual_lines), sorted(["MLLGSFRLIPKETLIQVAGSSPCNLS", "M", "MGMTPRLGLESLLE", "MTPRLGLESLLE"]))
+        # Output order is deterministic and equals the committed fixture
         self.assertListEqual(actual_lines, expected_lines, "Output lines do not match expected lines.")
+        # Streaming writes the same lines in the same order
+        tester.stream_result()
+        with open(integration_output, "r") as file:
+            self.assertListEqual([line.strip() for line in file], expected_lines)
             
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,62 @@
+import random
+import time
+import condon_mapper
+from condon_mapper import CODON_TABLE, translate_frames
+
+# Sequence lengths of the benchmark
+SEQUENCE_LENGTHS = [10**4, 10**5, 10**6, 10**7]
+# The codon by codon dictionary lookup is only timed up to this length
+DICTIONARY_LIMIT = 10**6
+
+# Former dictionary of codons, built from the shared codon table
+CODON_DICTIONARY = {
+    first + second + third: CODON_TABLE[16 * i + 4 * j + k]
+    for i, first in enumerate("ACGT") for j, second in enumerate("ACGT") for k, third in enumerate("ACGT")
+}
+
+def dictionary_frames(sequence: str) -> tuple:
+    """
+    Translates the three reading frames by slicing every codon and looking it up in a dictionary.
+    """
+
+    return tuple(
+        "".join(CODON_DICTIONARY[sequence[pos:pos + 3]] for pos in range(frame, len(sequence) - 2, 3))
+        for frame in range(3)
+    )
+
+def bytes_frames(sequence: str) -> tuple:
+    """
+    Translates the three reading frames with bytes.translate, even if NumPy is installed.
+    """
+
+    numpy_module = condon_mapper.np
+    condon_mapper.np = None
+    try:
+        return translate_frames(sequence)
+    finally:
+        condon_mapper.np = numpy_module
+
+def time_function(function, sequence: str) -> float:
+    """
+    Returns the runtime of a translation in seconds.
+    """
+
+    start = time.perf_counter()
+    function(sequence)
+    return time.perf_counter() - start
+
+def main():
+    print(f"{'length':>10} {'dict [s]':>10} {'bytes [s]':>10} {'numpy [s]':>10} {'bytes [MB/s]':>13}")
+    for sequence_length in SEQUENCE_LENGTHS:
+        sequence = "".join(random.Random(0).choices("ACGT", k=sequence_length))
+        dictionary_time = "-"
+        if sequence_length <= DICTIONARY_LIMIT:
+            assert dictionary_frames(sequence) == bytes_frames(sequence)
+            dictionary_time = f"{time_function(dictionary_frames, sequence):.4f}"
+        bytes_time = time_function(bytes_frames, sequence)
+        numpy_time = f"{time_function(translate_frames, sequence):.4f}" if condon_mapper.np is not None else "-"
+        throughput = sequence_length / bytes_time / 1e6
+        print(f"{sequence_length:>10} {dictionary_time:>10} {bytes_time:>10.4f} {numpy_time:>10} {throughput:>13.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+import os
+import random
+import tempfile
+import time
+import fasta_reader
+
+# File sizes of the benchmark in bytes
+FILE_SIZES = [10**7, 10**8, 10**9, 4 * 10**9]
+# Bases per record and per line of the generated files
+RECORD_LENGTH = 10**6
+LINE_LENGTH = 60
+# The former line concatenation and the dictionary are only timed up to this file size,
+# larger files are only streamed
+DICTIONARY_LIMIT = 10**9
+
+def concatenation_read_fasta(file_path: str) -> dict:
+    """
+    Reads a FASTA file line by line with string concatenation like the former tools.
+    """
+
+    current_id = ""
+    current_seq = ""
+    sequence_dict = {}
+    with open(file_path) as file:
+        for line in file:
+            line = line.strip()
+            if line.startswith(">"):
+                if current_id:
+                    sequence_dict[current_id] = current_seq.upper()
+                current_id = line.split(">")[-1]
+                current_seq = ""
+            else:
+                current_seq += line
+        if current_id:
+            sequence_dict[current_id] = current_seq.upper()
+    return sequence_dict
+
+def write_fasta(file_path: str, file_size: int) -> None:
+    """
+    Writes a FASTA file of about file_size bytes. One random record is repeated under new
+    identifiers, so large files are written quickly.
+    """
+
+    bases = "".join(random.Random(0).choices("ACGT", k=RECORD_LENGTH))
+    record = "\n".join(bases[start:start + LINE_LENGTH] for start in range(0, RECORD_LENGTH, LINE_LENGTH)) + "\n"
+    with open(file_path, "w") as file:
+        for record_number in range(max(file_size // len(record), 1)):
+            file.write(f">Rosalind_{record_number}\n")
+            file.write(record)
+
+def stream_fasta(file_path: str) -> int:
+    """
+    Streams all records and returns the total sequence length.
+    """
+
+    return sum(len(sequence) for _, sequence in fasta_reader.iterate_fasta(file_path))
+
+def time_function(function, file_path: str) -> float:
+    """
+    Returns the runtime of one call in seconds.
+    """
+
+    start = time.perf_counter()
+    function(file_path)
+    return time.perf_counter() - start
+
+def main():
+    readers = [
+        ("concatenation", concatenation_read_fasta),
+        ("read_fasta", fasta_reader.read_fasta),
+        ("iterate_fasta", stream_fasta),
+    ]
+    print(f"{'bytes':>12} " + " ".join(f"{name + ' [s]':>18}" for name, _ in readers) + f" {'stream [MB/s]':>14}")
+    with tempfile.TemporaryDirectory() as directory:
+        file_path = os.path.join(directory, "benchmark.fasta")
+        for file_size in FILE_SIZES:
+            write_fasta(file_path, file_size)
+            if file_size <= DICTIONARY_LIMIT:
+                assert fasta_reader.read_fasta(file_path) == concatenation_read_fasta(file_path)
+            runtimes = []
+            for name, function in readers:
+                if name != "iterate_fasta" and file_size > DICTIONARY_LIMIT:
+                    runtimes.append("-")
+                    continue
+                runtimes.append(time_function(function, file_path))
+            throughput = os.path.getsize(file_path) / runtimes[-1] / 10**6
+            print(f"{file_size:>12} " + " ".join(
+                f"{runtime:>18}" if runtime == "-" else f"{runtime:>18.3f}" for runtime in runtimes
+            ) + f" {throughput:>14.1f}")
+            os.remove(file_path)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+import random
+import time
+import tracemalloc
+from kmer_graph import KmerGraph
+
+# Number of k-mers read from a random genome and k-mer size
+KMER_COUNTS = [10**4, 10**5, 10**6]
+K_MER_SIZE = 31
+
+def random_kmers(kmer_count: int, k_mer_size: int, seed: int = 0) -> list:
+    """
+    Creates all overlapping k-mers of a random genome with kmer_count + k_mer_size - 1 bases.
+    """
+
+    rng = random.Random(seed)
+    genome = "".join(rng.choice("ACGT") for _ in range(kmer_count + k_mer_size - 1))
+    return [genome[pos:pos + k_mer_size] for pos in range(kmer_count)]
+
+def dict_of_lists(k_mers: list) -> dict:
+    """
+    Builds the adjacency dictionary like the string based tools.
+    """
+
+    edges = {}
+    for k_mer in k_mers:
+        edges.setdefault(k_mer[:-1], []).append(k_mer[1:])
+    return {key: sorted(values) for key, values in sorted(edges.items())}
+
+def measure(build, k_mers: list) -> tuple:
+    """
+    Returns the retained memory, peak memory in MB and runtime in seconds of a graph build.
+    """
+
+    # Time without tracing since tracemalloc slows down every allocation
+    start = time.perf_counter()
+    graph = build(k_mers)
+    runtime = time.perf_counter() - start
+    del graph
+
+    tracemalloc.start()
+    graph = build(k_mers)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del graph
+    return current / 2**20, peak / 2**20, runtime
+
+def main():
+    print(f"{'k-mers':>10} {'form':>14} {'retained [MB]':>14} {'peak [MB]':>10} {'time [s]':>9}")
+    for kmer_count in KMER_COUNTS:
+        k_mers = random_kmers(kmer_count, K_MER_SIZE)
+        for name, build in (("dict of lists", dict_of_lists), ("KmerGraph", KmerGraph.from_kmers)):
+            retained, peak, runtime = measure(build, k_mers)
+            print(f"{kmer_count:>10} {name:>14} {retained:>14.1f} {peak:>10.1f} {runtime:>9.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+import random
+import time
+import reverse_complement
+from reverse_complement import IUPAC_COMPLEMENTS
+
+# Sequence lengths of the benchmark
+SEQUENCE_LENGTHS = [10**3, 10**5, 10**7, 10**8]
+# The per character dictionary mapping is only timed up to this length
+DICTIONARY_LIMIT = 10**7
+
+def dictionary_reverse_complement(dna_sequence: str) -> str:
+    """
+    Computes the reverse complement with a dictionary lookup per character like the former tools.
+    """
+
+    return "".join([IUPAC_COMPLEMENTS[char] for char in dna_sequence[::-1]])
+
+
+def time_function(function, dna_sequence: str) -> float:
+    """
+    Returns the best runtime of three calls in seconds.
+    """
+
+    best_time = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        function(dna_sequence)
+        best_time = min(best_time, time.perf_counter() - start)
+    return best_time
+
+def main():
+    # Name, function and whether the function takes bytes instead of a string
+    backends = [
+        ("dict", dictionary_reverse_complement, False),
+        ("str.translate", reverse_complement.reverse_complement, False),
+        ("bytes.translate", reverse_complement.reverse_complement, True),
+    ]
+    if reverse_complement.np is not None:
+        backends.append(("numpy", lambda sequence: reverse_complement.reverse_complement(sequence, backend="numpy"), True))
+
+    print(f"{'length':>10} " + " ".join(f"{name + ' [s]':>19}" for name, _, _ in backends))
+    for sequence_length in SEQUENCE_LENGTHS:
+        dna_sequence = "".join(random.Random(0).choices("ACGT", k=sequence_length))
+        expected = dictionary_reverse_complement(dna_sequence[:DICTIONARY_LIMIT])
+        runtimes = []
+        for name, function, takes_bytes in backends:
+            if name == "dict" and sequence_length > DICTIONARY_LIMIT:
+                runtimes.append("-")
+                continue
+            sequence = dna_sequence.encode("ascii") if takes_bytes else dna_sequence
+            if sequence_length <= DICTIONARY_LIMIT:
+                result = function(sequence)
+                assert (result.decode("ascii") if takes_bytes else result) == expected
+            runtimes.append(f"{time_function(function, sequence):.5f}")
+        print(f"{sequence_length:>10} " + " ".join(f"{runtime:>19}" for runtime in runtimes))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Amino acid of every codon indexed by its 2-bit encoding 16 * first + 4 * second + third
+# with A=0, C=1, G=2 and T/U=3, stop codons are translated to "*"
+CODON_TABLE = "KNKNTTTTRSRSIIMIQHQHPPPPRRRRLLLLEDEDAAAAGGGGVVVV*Y*YSSSS*CWCLFLF"
+STOP_SYMBOL = "*"
+# Amino acid of codons containing characters outside the alphabet
+UNKNOWN_SYMBOL = "X"
+ALPHABETS = {"DNA": "ACGT", "RNA": "ACGU"}
+
+
+def _nucleotide_tables(alphabet: str) -> tuple:
+    """
+    Builds the byte tables mapping every character to its 2-bit code and to an invalid flag.
+    """
+    codes = bytearray(256)
+    invalid = bytearray([1]) * 256
+    for code, nucleotide in enumerate(alphabet):
+        for char in (nucleotide, nucleotide.lower()):
+            codes[ord(char)] = code
+            invalid[ord(char)] = 0
+    return bytes(codes), bytes(invalid)
+
+
+NUCLEOTIDE_TABLES = {mode: _nucleotide_tables(alphabet) for mode, alphabet in ALPHABETS.items()}
+# Codon indexes above 63 carry the number of invalid characters in the two highest bits
+AMINO_ACID_TABLE = (CODON_TABLE + UNKNOWN_SYMBOL * 192).encode("ascii")
+
+
+def encode_codon(codon: str) -> int:
+    """
+    Encodes a DNA or RNA codon as its index in CODON_TABLE.
+
+    Parameters:
+    - codon (str): Codon of three nucleotides.
+
+    Returns:
+    int: The 2-bit encoding of the codon.
+
+    Example:
+    >>> encode_codon("AUG"), CODON_TABLE[encode_codon("ATG")]
+    (14, 'M')
+    """
+    index = 0
+    for nucleotide in codon.upper().replace("U", "T"):
+        index = (index << 2) | ALPHABETS["DNA"].index(nucleotide)
+    return index
+
+
+def codon_indexes(data: bytes, mode: str = "DNA", frame: int = 0) -> bytes:
+    """
+    Computes the index of every complete codon of a reading frame in one byte each.
+
+    The nucleotides are mapped to their 2-bit codes with bytes.translate. The first, second and third
+    positions of all codons are then read as three big integers with one code per byte and combined
+    with shifts, so no Python code runs per codon. Codons containing characters outside the alphabet
+    get an index above 63.
+
+    Parameters:
+    - data (bytes): The sequence as ASCII bytes.
+    - mode (str): Alphabet of the sequence, "DNA" or "RNA".
+    - frame (int): Offset of the reading frame, 0, 1 or 2.
+
+    Returns:
+    bytes: The codon index of every codon.
+    """
+    if mode not in NUCLEOTIDE_TABLES:
+        raise ValueError(f"Unknown mode: {mode}")
+    code_table, invalid_table = NUCLEOTIDE_TABLES[mode]
+    codon_number = max((len(data) - frame) // 3, 0)
+    if codon_number == 0:
+        return b""
+    end = frame + 3 * codon_number
+
+    codes = data.translate(code_table)
+    first, second, third = (int.from_bytes(codes[offset:end:3], "big") for offset in range(frame, frame + 3))
+    indexes = (first << 4) | (second << 2) | third
+
+    invalid = data.translate(invalid_table)
+    if 1 in invalid:
+        # Count invalid characters per codon, at most 3 fit into the two highest bits
+        invalid_count = sum(int.from_bytes(invalid[offset:end:3], "big") for offset in range(frame, frame + 3))
+        indexes |= invalid_count << 6
+
+    return indexes.to_bytes(codon_number, "big")
+
+
+def _numpy_translation(data: bytes, mode: str, frame: int) -> str:
+    """
+    Translates a reading frame by gathering amino acids from the codon table with NumPy.
+    """
+    if mode not in NUCLEOTIDE_TABLES:
+        raise ValueError(f"Unknown mode: {mode}")
+    code_table, invalid_table = NUCLEOTIDE_TABLES[mode]
+    codon_number = max((len(data) - frame) // 3, 0)
+    end = frame + 3 * codon_number
+
+    codes = np.frombuffer(data.translate(code_table), dtype=np.uint8)
+    indexes = codes[frame:end:3] << 4
+    indexes |= codes[frame + 1:end:3] << 2
+    indexes |= codes[frame + 2:end:3]
+
+    invalid = data.translate(invalid_table)
+    if 1 in invalid:
+        flags = np.frombuffer(invalid, dtype=np.uint8)
+        indexes |= (flags[frame:end:3] + flags[frame + 1:end:3] + flags[frame + 2:end:3]) << 6
+
+    amino_acids = np.frombuffer(AMINO_ACID_TABLE, dtype=np.uint8)
+    return amino_acids[indexes].tobytes().decode("ascii")
+
+
+def _translate(data: bytes, mode: str, frame: int) -> str:
+    """
+    Translates a reading frame of ASCII bytes with the fastest available backend.
+    """
+    if np is not None:
+        return _numpy_translation(data, mode, frame)
+    return codon_indexes(data, mode, frame).translate(AMINO_ACID_TABLE).decode("ascii")
+
+
+def translate_sequence(sequence: str, mode: str = "DNA", frame: int = 0) -> str:
+    """
+    Translates all complete codons of a reading frame, including stop codons as "*".
+
+    Uses a NumPy gather if NumPy is installed and bytes.translate otherwise. Codons containing
+    characters outside the alphabet are translated to "X", an incomplete last codon is ignored.
+
+    Parameters:
+    - sequence (str): DNA or RNA sequence, upper or lower case.
+    - mode (str): Alphabet of the sequence, "DNA" or "RNA".
+    - frame (int): Offset of the reading frame, 0, 1 or 2.
+
+    Returns:
+    str: The amino acid sequence.
+
+    Example:
+    >>> translate_sequence("AUGGCCUAAGG", mode="RNA")
+    'MA*'
+    """
+    return _translate(sequence.encode("ascii"), mode, frame)
+
+
+def translate_frames(sequence: str, mode: str = "DNA") -> tuple:
+    """
+    Translates the three reading frames of a sequence in one call.
+
+    Parameters:
+    - sequence (str): DNA or RNA sequence, upper or lower case.
+    - mode (str): Alphabet of the sequence, "DNA" or "RNA".
+
+    Returns:
+    tuple: The amino acid sequences of frames 0, 1 and 2, with stop codons as "*".
+
+    Example:
+    >>> translate_frames("ATGGCCTAA")
+    ('MA*', 'WP', 'GL')
+    """
+    data = sequence.encode("ascii")
+    return tuple(_translate(data, mode, frame) for frame in range(3))
+
+
+def codon_mapping(sequence: str, mode: str = "DNA") -> str:
+    """
+    Translates a sequence from its first codon up to the first stop codon.
+
+    Parameters:
+    - sequence (str): DNA or RNA sequence, upper or lower case.
+    - mode (str): Alphabet of the sequence, "DNA" or "RNA".
+
+    Returns:
+    str: The protein sequence without the stop codon.
+
+    Example:
+    >>> codon_mapping("ATGGCCATGGCGCCCAGAACTGAGATCAATAGTACCCGTATTAACGGGTGA", mode="DNA")
+    'MAMAPRTEINSTRING'
+    """
+    return translate_sequence(sequence, mode=mode).partition(STOP_SYMBOL)[0]
@@ -0,0 +1,91 @@
+import os
+from typing import Dict, Iterator, Tuple
+
+# Number of bytes read from the file at once
+CHUNK_SIZE = 1 << 22
+# Translation table converting lower case letters to upper case, used together with deleting whitespace
+UPPER_CASE_TABLE = bytes.maketrans(b"abcdefghijklmnopqrstuvwxyz", b"ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+
+
+def iterate_fasta(file_path: str, chunk_size: int = CHUNK_SIZE) -> Iterator[Tuple[str, str]]:
+    """
+    Lazily yields the records of a FASTA file one at a time.
+
+    The file is read in binary chunks of chunk_size bytes that are split at record starts ("\\n>").
+    A single bytes.translate per chunk converts the sequence to upper case and deletes whitespace,
+    and the pieces of a record are joined and decoded once when it is complete. So no Python code
+    runs per line and memory is bounded by the largest record plus one chunk. Text before the first
+    header is ignored.
+
+    Parameters:
+    - file_path (str): The path to the FASTA file.
+    - chunk_size (int): Number of bytes read at once. Defaults to 4 Mi.
+
+    Returns:
+    Iterator[Tuple[str, str]]: The identifier (header without the '>' symbol) and the sequence in
+                               uppercase of every record.
+
+    Raises:
+    FileNotFoundError: If the file does not exist.
+
+    Example:
+    For a file with the lines ">Rosalind_1", "acgt", "TT", ">Rosalind_2" and "GG" the records
+    ("Rosalind_1", "ACGTTT") and ("Rosalind_2", "GG") are yielded.
+    """
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"Input file not found: {file_path}")
+
+    # Header pieces of the current record, None before the first header
+    header = None
+    sequence = []
+    in_header = False
+    at_line_start = True
+
+    with open(file_path, "rb") as file:
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                break
+            parts = chunk.split(b"\n>")
+            # A header at the very start of the chunk is not preceded by a newline in this chunk
+            starts_record = at_line_start and parts[0].startswith(b">")
+            if starts_record:
+                parts[0] = parts[0][1:]
+
+            for index, part in enumerate(parts):
+                if index > 0 or starts_record:
+                    if header is not None:
+                        yield b"".join(header).decode().strip(), b"".join(sequence).decode()
+                    header, sequence, in_header = [], [], True
+                elif header is None:
+                    continue
+                # The header ends at the first newline, which may only come in a later chunk
+                if in_header:
+                    line, newline, part = part.partition(b"\n")
+                    header.append(line)
+                    if not newline:
+                        continue
+                    in_header = False
+                sequence.append(part.translate(UPPER_CASE_TABLE, b" \t\r\n"))
+
+            at_line_start = chunk.endswith(b"\n")
+
+    if header is not None:
+        yield b"".join(header).decode().strip(), b"".join(sequence).decode()
+
+
+def read_fasta(file_path: str) -> Dict[str, str]:
+    """
+    Read DNA sequences from a FASTA file and return a dictionary of sequence identifiers and sequences.
+
+    Parameters:
+    - file_path (str): The path to the FASTA file.
+
+    Returns:
+    dict: A dictionary where keys are sequence identifiers (without the '>' symbol) and values are
+          corresponding DNA sequences in uppercase.
+
+    Raises:
+    FileNotFoundError: If the file does not exist.
+    """
+    return dict(iterate_fasta(file_path))
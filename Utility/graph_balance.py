@@ -0,0 +1,89 @@
+from collections import Counter
+
+
+class GraphBalance:
+    """
+    A class to compute the in- and out-degree of every node of a directed graph in one pass.
+
+    Attributes:
+    ----------
+    in_degree : Counter
+        Number of incoming edges per node.
+    out_degree : Counter
+        Number of outgoing edges per node.
+    start_node : str or None
+        Node with one more outgoing than incoming edge, i.e. the start of an Eulerian path.
+    end_node : str or None
+        Node with one more incoming than outgoing edge, i.e. the end of an Eulerian path.
+    violations : list
+        Nodes that prevent an Eulerian path, e.g. a degree difference above 1 or a second start node.
+
+    Methods:
+    -------
+    balance_dict() -> dict
+        Returns the balance as a dictionary with nodes as keys and [incoming, outgoing] as values.
+    is_eulerian() -> bool
+        Checks if the graph is balanced enough to contain an Eulerian path or cycle.
+    """
+
+    def __init__(self, graph: dict):
+        """
+        Counts incoming and outgoing edges of the graph.
+
+        Parameters:
+        ----------
+        graph : dict
+            Dictionary representing the directed graph with nodes as keys and lists of successors as values.
+        """
+
+        self.in_degree = Counter()
+        self.out_degree = Counter()
+        for node, successors in graph.items():
+            self.out_degree[node] += len(successors)
+            self.in_degree.update(successors)
+
+        self.start_node = None
+        self.end_node = None
+        self.violations = []
+        self._classify_nodes()
+
+    def _classify_nodes(self) -> None:
+        """
+        Determines start node, end node and violating nodes from the degree difference.
+        """
+
+        for node in self.out_degree.keys() | self.in_degree.keys():
+            difference = self.out_degree[node] - self.in_degree[node]
+            if difference == 0:
+                continue
+            elif difference == 1 and self.start_node is None:
+                self.start_node = node
+            elif difference == -1 and self.end_node is None:
+                self.end_node = node
+            else:
+                self.violations.append(node)
+
+    def balance_dict(self) -> dict:
+        """
+        Returns the balance of each node in the graph.
+
+        Returns:
+        -------
+        dict
+            A dictionary with nodes as keys and their balance (incoming and outgoing edges) as values.
+        """
+
+        nodes = self.out_degree.keys() | self.in_degree.keys()
+        return {node: [self.in_degree[node], self.out_degree[node]] for node in nodes}
+
+    def is_eulerian(self) -> bool:
+        """
+        Checks if the graph is balanced enough to contain an Eulerian path or cycle.
+
+        Returns:
+        -------
+        bool
+            True if there are no violations and start and end node are either both present or both absent.
+        """
+
+        return not self.violations and (self.start_node is None) == (self.end_node is None)
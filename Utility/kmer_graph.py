@@ -0,0 +1,463 @@
+from array import array
+from bisect import bisect_left
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+# NumPy is optional and only speeds up the mapping of k-mer codes to node ids
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Nodes are packed with 2 bits per base into signed 64-bit integers
+MAX_NODE_LENGTH = 31
+NUCLEOTIDES = "ACGT"
+ENCODING_TABLE = str.maketrans(NUCLEOTIDES, "0123")
+
+
+def encode_kmer(k_mer: str) -> int:
+    """
+    Encodes a DNA k-mer with 2 bits per base (A=0, C=1, G=2, T=3).
+
+    The encoding preserves the lexicographic order of k-mers with equal length.
+
+    Parameters:
+    ----------
+    k_mer : str
+        The DNA k-mer to encode.
+
+    Returns:
+    -------
+    int
+        The integer code of the k-mer.
+
+    Raises:
+    ------
+    ValueError
+        If the k-mer contains characters other than A, C, G and T.
+
+    Example:
+    >>> encode_kmer("ACGT")
+    27
+    """
+
+    try:
+        return int(k_mer.translate(ENCODING_TABLE), 4)
+    except ValueError:
+        raise ValueError(f"Invalid k-mer: {k_mer}") from None
+
+
+def decode_kmer(code: int, length: int) -> str:
+    """
+    Decodes an integer code back to a DNA k-mer of the given length.
+
+    Parameters:
+    ----------
+    code : int
+        The integer code of the k-mer.
+    length : int
+        The length of the k-mer.
+
+    Returns:
+    -------
+    str
+        The decoded k-mer.
+
+    Example:
+    >>> decode_kmer(27, 4)
+    'ACGT'
+    """
+
+    return "".join(NUCLEOTIDES[(code >> shift) & 3] for shift in range(2 * (length - 1), -1, -2))
+
+
+class KmerGraph:
+    """
+    A class to represent a directed multigraph with integer node ids in CSR form.
+
+    Successors of node i are stored in targets[offsets[i]:offsets[i + 1]]. Node labels are
+    either packed k-mer codes, which are decoded only on output, or a list of arbitrary labels.
+
+    Attributes:
+    ----------
+    node_count : int
+        Number of nodes in the graph.
+    offsets : array
+        Start position of the successors of every node in targets, with node_count + 1 entries.
+    targets : array
+        Node ids of all edge targets grouped by source node.
+    node_codes : array or None
+        Sorted 2-bit codes of the node k-mers, node ids are positions in this array.
+    node_length : int or None
+        Length of the node k-mers.
+    labels : list or None
+        Labels of the nodes if the graph is not built from k-mers.
+
+    Methods:
+    -------
+    from_kmers(k_mers: Iterable[str]) -> KmerGraph
+        Builds a De Bruijn graph with one edge per k-mer from prefix to suffix.
+    from_overlaps(nodes: Iterable[str]) -> KmerGraph
+        Builds a graph connecting all nodes whose suffix equals the prefix of another node.
+    from_edges(edges: Iterable[Tuple[str, str]]) -> KmerGraph
+        Builds a graph from labelled edges, keeping their order.
+    label(node: int) -> str
+        Returns the label of a node.
+    successors(node: int) -> array
+        Returns the successor node ids of a node.
+    items() -> Iterator[Tuple[str, List[str]]]
+        Yields decoded nodes with their successors like dict.items() of an adjacency dictionary.
+    balance_dict() -> dict
+        Returns the balance of each node as [incoming, outgoing] edges.
+    eulerian_path() -> array
+        Walks the graph with Hierholzer's algorithm and returns the node ids of an Eulerian path.
+    spell_path(path: Iterable[int]) -> str
+        Reconstructs the sequence spelled by a path of k-mer nodes.
+    """
+
+    def __init__(self, node_count: int, sources: array, targets: array, sort_successors: bool = False,
+                 node_codes: Optional[array] = None, node_length: Optional[int] = None,
+                 labels: Optional[List[str]] = None):
+        """
+        Builds the CSR adjacency from parallel arrays of edge sources and targets by counting sort.
+
+        Parameters:
+        ----------
+        node_count : int
+            Number of nodes in the graph.
+        sources : array
+            Node ids of the edge sources.
+        targets : array
+            Node ids of the edge targets.
+        sort_successors : bool, optional
+            Sort the successors of every node by node id (default is False).
+        node_codes : array, optional
+            Sorted 2-bit codes of the node k-mers.
+        node_length : int, optional
+            Length of the node k-mers.
+        labels : list, optional
+            Labels of the nodes if the graph is not built from k-mers.
+        """
+
+        self.node_count = node_count
+        self.node_codes = node_codes
+        self.node_length = node_length
+        self.labels = labels
+
+        # Count outgoing edges and turn counts into offsets
+        offsets = array("q", bytes(8 * (node_count + 1)))
+        for source in sources:
+            offsets[source + 1] += 1
+        for node in range(node_count):
+            offsets[node + 1] += offsets[node]
+
+        # Place every target in the slot of its source
+        csr_targets = array("q", bytes(8 * len(targets)))
+        fill = offsets[:-1]
+        for source, target in zip(sources, targets):
+            csr_targets[fill[source]] = target
+            fill[source] += 1
+
+        if sort_successors:
+            for node in range(node_count):
+                start, end = offsets[node], offsets[node + 1]
+                if end - start > 1:
+                    csr_targets[start:end] = array("q", sorted(csr_targets[start:end]))
+
+        self.offsets = offsets
+        self.targets = csr_targets
+
+    @staticmethod
+    def _node_ids(codes: array, node_codes: array) -> array:
+        """
+        Maps k-mer codes to their positions in the sorted node codes.
+        """
+
+        if np is not None:
+            positions = np.searchsorted(np.frombuffer(node_codes, dtype=np.int64), np.frombuffer(codes, dtype=np.int64))
+            return array("q", positions.astype(np.int64).tobytes())
+        return array("q", (bisect_left(node_codes, code) for code in codes))
+
+    @classmethod
+    def from_kmers(cls, k_mers: Iterable[str]) -> "KmerGraph":
+        """
+        Builds a De Bruijn graph with one edge per k-mer from its prefix to its suffix.
+
+        Parameters:
+        ----------
+        k_mers : Iterable[str]
+            DNA k-mers of equal length, duplicates result in parallel edges.
+
+        Returns:
+        -------
+        KmerGraph
+            The De Bruijn graph with sorted successors.
+
+        Raises:
+        ------
+        ValueError
+            If the k-mers differ in length or nodes are longer than MAX_NODE_LENGTH.
+        """
+
+        prefix_codes = array("q")
+        suffix_codes = array("q")
+        k_mer_size = None
+        for k_mer in k_mers:
+            if k_mer_size is None:
+                k_mer_size = len(k_mer)
+                if not 1 < k_mer_size <= MAX_NODE_LENGTH + 1:
+                    raise ValueError(f"k-mer size has to be between 2 and {MAX_NODE_LENGTH + 1}")
+                suffix_mask = (1 << 2 * (k_mer_size - 1)) - 1
+            elif len(k_mer) != k_mer_size:
+                raise ValueError("All k-mers need to have the same length")
+            code = encode_kmer(k_mer)
+            prefix_codes.append(code >> 2)
+            suffix_codes.append(code & suffix_mask)
+
+        node_codes = array("q", sorted(set(prefix_codes).union(suffix_codes)))
+        return cls(
+            node_count=len(node_codes),
+            sources=cls._node_ids(prefix_codes, node_codes),
+            targets=cls._node_ids(suffix_codes, node_codes),
+            sort_successors=True,
+            node_codes=node_codes,
+            node_length=(k_mer_size - 1) if k_mer_size else 0,
+        )
+
+    @classmethod
+    def from_overlaps(cls, nodes: Iterable[str]) -> "KmerGraph":
+        """
+        Builds a graph connecting every node to all nodes whose prefix equals its suffix.
+
+        All nodes sharing a prefix occupy one contiguous range of the sorted codes, so the
+        successors of a node are found with two binary searches. Nodes of length 1 have an empty
+        suffix, so every node is a successor of every node.
+
+        Parameters:
+        ----------
+        nodes : Iterable[str]
+            DNA strings of equal length.
+
+        Returns:
+        -------
+        KmerGraph
+            The overlap graph with sorted successors.
+
+        Raises:
+        ------
+        ValueError
+            If the nodes differ in length or are longer than MAX_NODE_LENGTH.
+        """
+
+        codes = set()
+        node_length = None
+        for node in nodes:
+            if node_length is None:
+                node_length = len(node)
+                if not 0 < node_length <= MAX_NODE_LENGTH:
+                    raise ValueError(f"Node length has to be between 1 and {MAX_NODE_LENGTH}")
+            elif len(node) != node_length:
+                raise ValueError("All nodes need to have the same length")
+            codes.add(encode_kmer(node))
+        node_codes = array("q", sorted(codes))
+        if not node_codes:
+            return cls(node_count=0, sources=array("q"), targets=array("q"), node_codes=node_codes, node_length=0)
+
+        suffix_mask = (1 << 2 * (node_length - 1)) - 1
+        sources = array("q")
+        targets = array("q")
+        for node, code in enumerate(node_codes):
+            # Successors have codes in [suffix << 2, (suffix << 2) + 3]
+            lowest = (code & suffix_mask) << 2
+            first = bisect_left(node_codes, lowest)
+            last = bisect_left(node_codes, lowest + 4, first)
+            for successor in range(first, last):
+                sources.append(node)
+                targets.append(successor)
+
+        return cls(node_count=len(node_codes), sources=sources, targets=targets,
+                   node_codes=node_codes, node_length=node_length)
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[Tuple[str, str]]) -> "KmerGraph":
+        """
+        Builds a graph from labelled edges, keeping the order of first appearance of nodes and edges.
+
+        Parameters:
+        ----------
+        edges : Iterable[Tuple[str, str]]
+            Pairs of source and target labels.
+
+        Returns:
+        -------
+        KmerGraph
+            The graph with arbitrary node labels.
+        """
+
+        node_ids = {}
+        sources = array("q")
+        targets = array("q")
+        for source, target in edges:
+            sources.append(node_ids.setdefault(source, len(node_ids)))
+            targets.append(node_ids.setdefault(target, len(node_ids)))
+
+        return cls(node_count=len(node_ids), sources=sources, targets=targets, labels=list(node_ids))
+
+    def __len__(self) -> int:
+        """
+        Returns the number of nodes with outgoing edges, like the length of an adjacency dictionary.
+        """
+
+        return sum(1 for node in range(self.node_count) if self.offsets[node] != self.offsets[node + 1])
+
+    def label(self, node: int) -> str:
+        """
+        Returns the label of a node.
+
+        Parameters:
+        ----------
+        node : int
+            The node id.
+
+        Returns:
+        -------
+        str
+            The decoded k-mer or the label of the node.
+        """
+
+        if self.labels is not None:
+            return self.labels[node]
+        return decode_kmer(self.node_codes[node], self.node_length)
+
+    def successors(self, node: int) -> array:
+        """
+        Returns the successor node ids of a node.
+
+        Parameters:
+        ----------
+        node : int
+            The node id.
+
+        Returns:
+        -------
+        array
+            Node ids of the successors.
+        """
+
+        return self.targets[self.offsets[node]:self.offsets[node + 1]]
+
+    def items(self) -> Iterator[Tuple[str, List[str]]]:
+        """
+        Yields decoded nodes with their successors like dict.items() of an adjacency dictionary.
+
+        Nodes without outgoing edges are skipped.
+
+        Returns:
+        -------
+        Iterator[Tuple[str, List[str]]]
+            Pairs of node label and list of successor labels in node id order.
+        """
+
+        for node in range(self.node_count):
+            start, end = self.offsets[node], self.offsets[node + 1]
+            if start != end:
+                yield self.label(node), [self.label(successor) for successor in self.targets[start:end]]
+
+    def degrees(self) -> Tuple[array, array]:
+        """
+        Counts incoming and outgoing edges of every node.
+
+        Returns:
+        -------
+        Tuple[array, array]
+            Incoming and outgoing edge counts indexed by node id.
+        """
+
+        in_degree = array("q", bytes(8 * self.node_count))
+        for target in self.targets:
+            in_degree[target] += 1
+        out_degree = array("q", (self.offsets[node + 1] - self.offsets[node] for node in range(self.node_count)))
+        return in_degree, out_degree
+
+    def balance_dict(self) -> dict:
+        """
+        Returns the balance of each node in the graph.
+
+        Returns:
+        -------
+        dict
+            A dictionary with node labels as keys and their balance (incoming and outgoing edges) as values.
+        """
+
+        in_degree, out_degree = self.degrees()
+        return {self.label(node): [in_degree[node], out_degree[node]] for node in range(self.node_count)}
+
+    def eulerian_path(self) -> array:
+        """
+        Walks the graph with Hierholzer's algorithm and returns an Eulerian path.
+
+        The walk starts at the node with one more outgoing than incoming edge, or at the first
+        node with edges if the graph is balanced, in which case the path is a cycle.
+
+        Returns:
+        -------
+        array
+            Node ids of the Eulerian path.
+
+        Raises:
+        ------
+        ValueError
+            If the node balance does not allow an Eulerian path or edges cannot be reached.
+        """
+
+        in_degree, out_degree = self.degrees()
+        start_nodes = [node for node in range(self.node_count) if out_degree[node] - in_degree[node] == 1]
+        end_nodes = [node for node in range(self.node_count) if in_degree[node] - out_degree[node] == 1]
+        unbalanced = [node for node in range(self.node_count) if abs(out_degree[node] - in_degree[node]) > 1]
+        if unbalanced or len(start_nodes) > 1 or len(start_nodes) != len(end_nodes):
+            raise ValueError("Graph has no Eulerian path")
+        if not self.targets:
+            return array("q")
+
+        if start_nodes:
+            start_node = start_nodes[0]
+        else:
+            start_node = next(node for node in range(self.node_count) if out_degree[node])
+
+        # Walk unused edges through per-node cursors and splice detours via the stack
+        cursors = self.offsets[:-1]
+        stack = array("q", [start_node])
+        path = array("q")
+        while stack:
+            node = stack[-1]
+            cursor = cursors[node]
+            if cursor < self.offsets[node + 1]:
+                cursors[node] = cursor + 1
+                stack.append(self.targets[cursor])
+            else:
+                path.append(stack.pop())
+        path.reverse()
+
+        if len(path) != len(self.targets) + 1:
+            raise ValueError("Graph contains edges that cannot be reached!")
+        return path
+
+    def spell_path(self, path: Iterable[int]) -> str:
+        """
+        Reconstructs the sequence spelled by a path of k-mer nodes.
+
+        Parameters:
+        ----------
+        path : Iterable[int]
+            Node ids of consecutive overlapping k-mers.
+
+        Returns:
+        -------
+        str
+            The first node followed by the last base of every further node.
+        """
+
+        nodes = iter(path)
+        first_node = next(nodes, None)
+        if first_node is None:
+            return ""
+        return self.label(first_node) + "".join(NUCLEOTIDES[self.node_codes[node] & 3] for node in nodes)
@@ -0,0 +1,40 @@
+from itertools import islice
+from typing import Iterable, TextIO
+
+# Number of lines joined into one write
+CHUNK_SIZE = 4096
+# Buffer size in bytes for output files opened by the tools
+BUFFER_SIZE = 1 << 20
+
+
+def write_lines(lines: Iterable[str], file: TextIO, chunk_size: int = CHUNK_SIZE) -> int:
+    """
+    Writes lines to a file object in chunks, so a lazily generated output is never stored as a whole.
+
+    Every chunk of chunk_size lines is joined and passed to a single write call, which saves the
+    overhead of one call per line.
+
+    Parameters:
+    - lines (Iterable[str]): The lines to write, each terminated by a newline.
+    - file (TextIO): The text file object to write to.
+    - chunk_size (int): Number of lines per write. Defaults to 4096.
+
+    Returns:
+    int: The number of written lines.
+
+    Example:
+    >>> import io
+    >>> file = io.StringIO()
+    >>> write_lines((f"{number}\\n" for number in range(3)), file)
+    3
+    >>> file.getvalue()
+    '0\\n1\\n2\\n'
+    """
+    lines = iter(lines)
+    written = 0
+    while True:
+        chunk = list(islice(lines, chunk_size))
+        if not chunk:
+            return written
+        file.write("".join(chunk))
+        written += len(chunk)
@@ -0,0 +1,101 @@
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Complement of every nucleotide and IUPAC ambiguity code
+IUPAC_COMPLEMENTS = {
+    "A": "T", "C": "G", "G": "C", "T": "A", "U": "A",
+    "R": "Y", "Y": "R", "S": "S", "W": "W", "K": "M", "M": "K",
+    "B": "V", "V": "B", "D": "H", "H": "D", "N": "N", "-": "-",
+}
+
+
+def _complement_mapping() -> dict:
+    """
+    Extends the IUPAC complements by their lower case forms.
+    """
+    mapping = dict(IUPAC_COMPLEMENTS)
+    mapping.update({code.lower(): complement_code.lower() for code, complement_code in IUPAC_COMPLEMENTS.items()})
+    return mapping
+
+
+# Translation tables for str.translate and bytes.translate, other characters are kept unchanged
+STR_COMPLEMENT_TABLE = str.maketrans(_complement_mapping())
+BYTES_COMPLEMENT_TABLE = bytes.maketrans(
+    "".join(_complement_mapping()).encode("ascii"),
+    "".join(_complement_mapping().values()).encode("ascii"),
+)
+
+
+def complement(dna_sequence):
+    """
+    Complements a DNA sequence without reversing it.
+
+    Parameters:
+    - dna_sequence (str or bytes): DNA sequence with IUPAC codes.
+
+    Returns:
+    str or bytes: The complement of the sequence in the type of the input.
+
+    Example:
+    >>> complement("ATGCn")
+    'TACGn'
+    """
+    if isinstance(dna_sequence, (bytes, bytearray)):
+        return dna_sequence.translate(BYTES_COMPLEMENT_TABLE)
+    return dna_sequence.translate(STR_COMPLEMENT_TABLE)
+
+
+def reverse_complement_array(codes):
+    """
+    Reverse complements a NumPy uint8 array of ASCII codes with a lookup table.
+
+    Parameters:
+    - codes (np.ndarray): DNA sequence as uint8 array, e.g. from a memory mapped file.
+
+    Returns:
+    np.ndarray: The reverse complement as new uint8 array.
+
+    Raises:
+    ImportError: If NumPy is not installed.
+    """
+    if np is None:
+        raise ImportError("NumPy is required for reverse_complement_array")
+    lookup = np.frombuffer(BYTES_COMPLEMENT_TABLE, dtype=np.uint8)
+    return lookup[codes[::-1]]
+
+
+def reverse_complement(dna_sequence, backend: str = "translate"):
+    """
+    Computes the reverse complement of a DNA sequence.
+
+    The default backend complements strings with str.translate and bytes with bytes.translate and
+    reverses them with a slice, all in C. The "numpy" backend gathers the complements from a uint8
+    lookup table instead. IUPAC ambiguity codes are complemented as well, the case of every character
+    is kept and characters without complement are kept unchanged.
+
+    Parameters:
+    - dna_sequence (str or bytes): DNA sequence with IUPAC codes.
+    - backend (str): "translate" or "numpy". Defaults to "translate".
+
+    Returns:
+    str or bytes: The reverse complement of the sequence in the type of the input.
+
+    Raises:
+    ValueError: If the backend is unknown.
+
+    Example:
+    >>> reverse_complement("ATGCRN")
+    'NYGCAT'
+    >>> reverse_complement(b"ATGC")
+    b'GCAT'
+    """
+    if backend == "translate":
+        return complement(dna_sequence)[::-1]
+    if backend == "numpy":
+        is_bytes = isinstance(dna_sequence, (bytes, bytearray))
+        data = dna_sequence if is_bytes else dna_sequence.encode("ascii")
+        result = reverse_complement_array(np.frombuffer(data, dtype=np.uint8)).tobytes()
+        return result if is_bytes else result.decode("ascii")
+    raise ValueError(f"Unknown backend: {backend}")
@@ -1,17 +1,23 @@
 from pathlib import Path
+import sys
+# Import shared graph helpers
+sys.path.append("../Utility")
+from kmer_graph import KmerGraph
 
 class BruijnGraphCollection:
     
     DEFAULT_INPUT_PATH = Path("input.txt")
     DEFAULT_OUTPUT_PATH = Path("output.txt")
     
-    def __init__(self, input_path=None, output_path=None):
+    def __init__(self, input_path=None, output_path=None, encoded=False):
 
 
         self.input_path = Path(input_path) if input_path else self.DEFAULT_INPUT_PATH
         self.output_path = Path(output_path) if output_path else self.DEFAULT_OUTPUT_PATH
         self.sequences = []
         self.k_mer_size = None
+        # Store graph as 2-bit encoded k-mers in CSR arrays instead of dict of lists
+        self.encoded = encoded
         
     def read_sequences(self) -> None:
 
@@ -37,6 +43,10 @@ class BruijnGraphCollection:
         if self.sequences is None:
             raise ValueError("Sequence not initialized")
         
+        # KmerGraph yields the same sorted items as the dictionary
+        if self.encoded:
+            return KmerGraph.from_kmers(self.sequences)
+        
         edges = {}
         for sequence in self.sequences:
             node_1, node_2 = sequence[:-1], sequence[1:]
@@ -12,8 +12,10 @@ def file_paths():
         {
             "input": Path("tests/input.txt"),
             "expected_output": Path("tests/exp_output.txt"),
-            "generated_output": Path("tests/gen_output.txt")
-        },
+            "generated_output": Path("tests/gen_output.txt"),
+            "encoded": encoded
+        }
+        for encoded in (False, True)
     ]
 
 def read_file(path):
@@ -24,7 +26,7 @@ def read_file(path):
 
 @pytest.mark.parametrize("file_data", file_paths())
 def test_bruijn_graph(file_data):
-    de_bruijn_graph = BruijnGraphCollection(input_path=file_data["input"], output_path=file_data["generated_output"])
+    de_bruijn_graph = BruijnGraphCollection(input_path=file_data["input"], output_path=file_data["generated_output"], encoded=file_data["encoded"])
     de_bruijn_graph.read_sequences()
     nodes = de_bruijn_graph.create_edges()
     de_bruijn_graph.output(nodes)
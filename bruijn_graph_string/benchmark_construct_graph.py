@@ -0,0 +1,45 @@
+import random
+import timeit
+from bruijn_graph_string import BruijnGraphString
+
+# Number of k-mers taken from a random sequence and k-mer size
+KMER_COUNTS = [1, 3, 10, 30, 100, 300, 1000, 3000, 10000, 100000, 1000000]
+K_MER_SIZE = 12
+# The quadratic scan is only timed up to this number of k-mers
+SCAN_LIMIT = 10000
+
+def random_kmers(kmer_count: int, k_mer_size: int, seed: int = 0) -> set:
+    """
+    Creates the k-mers of a random sequence with kmer_count + k_mer_size - 1 bases.
+    """
+
+    rng = random.Random(seed)
+    sequence = "".join(rng.choice("ACGT") for _ in range(kmer_count + k_mer_size - 1))
+    return {sequence[pos:pos + k_mer_size] for pos in range(kmer_count)}
+
+def time_construction(de_bruijn_graph: BruijnGraphString, k_mers: set) -> float:
+    """
+    Returns the best runtime of construct_graph in seconds, repeating fast runs.
+    """
+
+    timer = timeit.Timer(lambda: de_bruijn_graph.construct_graph(k_mers))
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=3, number=number)) / number
+
+def main():
+    scan_graph = BruijnGraphString()
+    index_graph = BruijnGraphString(indexed=True)
+    print(f"{'k-mers':>10} {'scan [s]':>12} {'index [s]':>12} {'speedup':>9}")
+    for kmer_count in KMER_COUNTS:
+        k_mers = random_kmers(kmer_count, K_MER_SIZE)
+        index_time = time_construction(index_graph, k_mers)
+        if kmer_count <= SCAN_LIMIT:
+            # Index mode has to produce identical adjacency lists
+            assert scan_graph.construct_graph(k_mers) == index_graph.construct_graph(k_mers)
+            scan_time = time_construction(scan_graph, k_mers)
+            print(f"{kmer_count:>10} {scan_time:>12.6f} {index_time:>12.6f} {scan_time / index_time:>8.1f}x")
+        else:
+            print(f"{kmer_count:>10} {'-':>12} {index_time:>12.6f} {'-':>9}")
+
+if __name__ == "__main__":
+    main()
@@ -1,23 +1,31 @@
 from pathlib import Path
+import sys
+# Import shared graph helpers
+sys.path.append("../Utility")
+from kmer_graph import KmerGraph
 
 class BruijnGraphString:
     
     DEFAULT_INPUT_PATH = Path("input.txt")
     DEFAULT_OUTPUT_PATH = Path("output.txt")
     
-    def __init__(self, input_path=None, output_path=None):
+    def __init__(self, input_path=None, output_path=None, encoded=False, indexed=False):
         """
         Initializes the BruijnGraphString with specified input and output paths.
         
         Args:
             input_path (str, optional): Path to the input file. Defaults to "input.txt".
             output_path (str, optional): Path to the output file. Defaults to "output.txt".
+            encoded (bool, optional): Construct the graph on 2-bit encoded k-mers. Defaults to False.
+            indexed (bool, optional): Look up successors in a prefix index instead of scanning all nodes. Defaults to False.
         """
 
         self.input_path = Path(input_path) if input_path else self.DEFAULT_INPUT_PATH
         self.output_path = Path(output_path) if output_path else self.DEFAULT_OUTPUT_PATH
         self.sequence = None
         self.k_mer_size = None
+        self.encoded = encoded
+        self.indexed = indexed
         
     def read_sequence(self) -> None:
         """
@@ -72,7 +80,8 @@ class BruijnGraphString:
             k_mers (set): A set of k-mers.
         
         Returns:
-            list: The adjacency list representing the De Bruijn graph.
+            list: The adjacency list representing the De Bruijn graph. In encoded mode
+                the tuples are decoded lazily from a KmerGraph while iterating.
         """
         
         # Construct nodes from unique fragments
@@ -81,8 +90,26 @@ class BruijnGraphString:
             nodes.add(k_mer[:-1])
             nodes.add(k_mer[1:])
 
+        # Look up successors in the sorted node codes instead of scanning all nodes
+        if self.encoded:
+            graph = KmerGraph.from_overlaps(nodes)
+            return ((node, *matched_nodes) for node, matched_nodes in graph.items())
+
         # Construct edges
         adjacency_list = []
+        if self.indexed:
+            # Bucket nodes by their (k-2)-prefix so each suffix needs a single lookup
+            prefix_index = {}
+            for node in nodes:
+                prefix_index.setdefault(node[:-1], []).append(node)
+            for matched_nodes in prefix_index.values():
+                matched_nodes.sort()
+            for node in nodes:
+                matched_nodes = prefix_index.get(node[1:])
+                if matched_nodes:
+                    adjacency_list.append(tuple([node] + matched_nodes))
+            return sorted(adjacency_list)
+
         # Loop trough nodes
         for node in nodes:
             # Determine suffix of current node and find matching nodes with suffix = prefix
@@ -106,11 +133,10 @@ class BruijnGraphString:
         with open(self.output_path, "w") as file:
             for counter, edge in enumerate(adjacency_list):
                 node_1, node_2 = edge[0], ",".join(edge[1:])
-                if counter < len(adjacency_list) - 1:
-                    file.write(f"{node_1} -> {node_2}\n")
-                else:
-                    # Write without final line break
-                    file.write(f"{node_1} -> {node_2}")
+                # Separate lines to write without final line break
+                if counter > 0:
+                    file.write("\n")
+                file.write(f"{node_1} -> {node_2}")
                     
 # ------------------------------------------------------------
 
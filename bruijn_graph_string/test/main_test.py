@@ -10,10 +10,13 @@ def file_paths():
 
     return [
         {
-            "input": Path("tests/input.txt"),
-            "expected_output": Path("tests/exp_output.txt"),
-            "generated_output": Path("tests/gen_output.txt")
-        },
+            "input": Path("test/input.txt"),
+            "expected_output": Path("test/exp_output.txt"),
+            "generated_output": Path("test/gen_output.txt"),
+            "encoded": encoded,
+            "indexed": indexed
+        }
+        for encoded, indexed in ((False, False), (True, False), (False, True))
     ]
 
 def read_file(path):
@@ -24,7 +27,7 @@ def read_file(path):
 
 @pytest.mark.parametrize("file_data", file_paths())
 def test_bruijn_graph(file_data):
-    tester = BruijnGraphString(input_path=file_data["input"], output_path=file_data["generated_output"])
+    tester = BruijnGraphString(input_path=file_data["input"], output_path=file_data["generated_output"], encoded=file_data["encoded"], indexed=file_data["indexed"])
     tester.read_sequence()
     k_mers = tester.create_k_mers()
     graph = tester.construct_graph(k_mers=k_mers)
@@ -35,4 +38,12 @@ def test_bruijn_graph(file_data):
     generated_output = read_file(file_data["generated_output"])
     
     # Check if outputs are equal
-    assert expected_output == generated_output
\ No newline at end of file
+    assert expected_output == generated_output
+
+@pytest.mark.parametrize("encoded, indexed", ((False, False), (True, False), (False, True)))
+def test_bruijn_graph_single_base_nodes(encoded, indexed):
+    # k-mers of length 2 have nodes of length 1, which all overlap with the empty suffix
+    tester = BruijnGraphString(encoded=encoded, indexed=indexed)
+    tester.sequence, tester.k_mer_size = "ACGA", 2
+    graph = list(tester.construct_graph(k_mers=tester.create_k_mers()))
+    assert graph == [(node, "A", "C", "G") for node in ("A", "C", "G")]
@@ -1,7 +1,7 @@
 # Import FASTA reading function
 import sys
 sys.path.append("../Utility")
-from fasta_utils import read_fasta
+from fasta_reader import read_fasta
 
 
 class ConsensusFinder:
@@ -1,3 +1,9 @@
+# Import FASTA reading function
+import sys
+sys.path.append("../Utility")
+from fasta_reader import read_fasta
+
+
 class GCMeasurer:
     """
     A class for measuring GC content in DNA sequences.
@@ -22,33 +28,7 @@ class GCMeasurer:
         """
         Read DNA sequences from FASTA file.
         """
-        
-        # Define containers for id and sequence
-        current_id = ""
-        current_seq = ""
-        sequence_dict = {}
-        
-        
-        with open(self.input_path) as file:
-            for line in file:
-                line = line.strip()
-                if line.startswith(">"):
-                    # Check if current_id was filled in iteration before
-                    if current_id:
-                        sequence_dict[current_id] = current_seq.upper()
-                    
-                    # For first iteration
-                    current_id = line.split(">")[-1]
-                    current_seq = ""
-                # If sequence line concatenate sequences of each line
-                else:
-                    current_seq += line
-
-            # After the loop, add the last pair
-            if current_id:
-                sequence_dict[current_id] = current_seq.upper()
-                
-        self.sequences = sequence_dict
+        self.sequences = read_fasta(self.input_path)
     
     def measure_gc(self):
         """
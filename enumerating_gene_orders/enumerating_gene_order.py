@@ -1,5 +1,10 @@
-from typing import List
-import random
+from itertools import permutations
+from math import factorial
+from typing import Iterator, TextIO, Tuple
+import sys
+# Import shared chunked line writer
+sys.path.append("../Utility")
+from line_writer import BUFFER_SIZE, write_lines
 
 class PermutationList:
     """
@@ -8,86 +13,114 @@ class PermutationList:
     Attributes:
     - gene_number: int, the number of genes for permutation.
     - total_perm: int, the total number of permutations.
-    - stock: List[int], the stock of available numbers for permutations.
-    - permutations: List[List[int]], the generated permutations.
+    - permutations: List[Tuple[int]], the generated permutations in "list" mode.
+    - mode: str, "list" to keep all permutations in memory, "stream" to write them to
+      output_path while they are generated or "count" to only calculate their number.
+    - output_path: str, the file permutations are streamed to.
     """
-    
-    def __init__(self):
+
+    # Output modes, only "list" keeps the permutations in memory
+    MODES = ("list", "stream", "count")
+    # Largest gene number for "list" mode
+    LIST_LIMIT = 7
+
+    def __init__(self, mode: str = "list", output_path: str = "result.txt"):
         """
         Initializes a PermutationList object with default values.
+
+        Raises:
+        - ValueError: If the mode is unknown.
         """
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown mode: {mode}, choose one of {', '.join(self.MODES)}")
         self.gene_number = None
         self.total_perm = None
-        self.stock = None
         self.permutations = None
-    
+        self.mode = mode
+        self.output_path = output_path
+
     def input(self) -> None:
         """
         Takes user input for the number of genes for permutation.
-        Ensures the input is between 1 and 7.
+        Ensures the input is between 1 and 7 in "list" mode, "stream" and "count" mode accept any positive number.
         """
-        gene_number =  int(input("Please enter a number of genes for permutation between 0 and 7: "))
-        assert (gene_number <= 7), "Please enter a number less or equal to 7"
+        if self.mode == "list":
+            gene_number = int(input(f"Please enter a number of genes for permutation between 1 and {self.LIST_LIMIT}: "))
+            assert (gene_number <= self.LIST_LIMIT), f"Please enter a number less or equal to {self.LIST_LIMIT}"
+        else:
+            gene_number = int(input("Please enter a number of genes for permutation: "))
         assert (gene_number > 0), "Please enter a number greater or equal to 1"
         self.gene_number = gene_number
-    
+
     def total_permutations(self) -> None:
         """
         Calculates the total number of permutations based on the gene number.
         """
-        # Calculate the factorial
-        factorial = 1
-        for factor in range(2, self.gene_number+1):
-            factorial *= factor
-        self.total_perm = factorial
-    
-    def generate_stock(self) -> None:
+        self.total_perm = factorial(self.gene_number)
+
+    def iterate_permutations(self) -> Iterator[Tuple[int, ...]]:
         """
-        Generates the stock of available numbers for permutations.
+        Lazily yields all permutations of the genes 1 to n in lexicographic order.
+
+        itertools.permutations emits the permutations of a sorted input in lexicographic order and
+        advances from one permutation to the next in C, so memory stays constant for any n.
+
+        Example:
+        For gene_number = 3 the permutations are yielded as
+        (1, 2, 3), (1, 3, 2), (2, 1, 3), (2, 3, 1), (3, 1, 2), (3, 2, 1).
         """
-        self.stock = list(range(1, self.gene_number+1)) * self.total_perm
-    
+        return permutations(range(1, self.gene_number + 1))
+
     def generate_permutations(self) -> None:
         """
-        Generates unique permutations using the available stock.
+        Generates all permutations and keeps them in memory for "list" mode.
         """
-        permutation_list = []
-        while len(self.stock) != 0:
-            current_permutation = []
-            while len(current_permutation) != self.gene_number:
-                # Draw random number from stock
-                current_num = random.choice(self.stock)
-                # Check if current number is already in list
-                if current_num not in current_permutation:
-                    current_permutation.append(current_num)
-                    self.stock.remove(current_num)
-            # Append current permutation to permutation list
-            if current_permutation in permutation_list:
-                for elem in current_permutation:
-                    self.stock.append(elem)
-            else:
-                permutation_list.append(current_permutation)
-        
-        self.permutations = permutation_list
-    
+        self.permutations = list(self.iterate_permutations())
+
+    def write_permutations(self, file: TextIO) -> int:
+        """
+        Writes all permutations to a file object while they are generated.
+
+        The permutations are generated over the gene labels as strings, so each line is a single join,
+        and are written in chunks by the shared write_lines.
+
+        Parameters:
+        - file (TextIO): The text file object to write to.
+
+        Returns:
+        - int: The number of written permutations.
+        """
+        labels = [str(gene) for gene in range(1, self.gene_number + 1)]
+        return write_lines((" ".join(permutation) + "\n" for permutation in permutations(labels)), file)
+
     def output(self) -> None:
         """
         Outputs the total number of permutations and the generated permutations.
+        In "stream" mode both are written to output_path, in "count" mode only the total is printed.
         """
-        print(self.total_perm)
-        for permutation in self.permutations:
-            print(" ".join(map(str, permutation)))
-    
-def main():
+        if self.mode == "count":
+            print(self.total_perm)
+        elif self.mode == "stream":
+            with open(self.output_path, "w", buffering=BUFFER_SIZE) as file:
+                file.write(f"{self.total_perm}\n")
+                self.write_permutations(file)
+            print(f"{self.total_perm} permutations written to '{self.output_path}'.")
+        else:
+            print(self.total_perm)
+            for permutation in self.permutations:
+                print(" ".join(map(str, permutation)))
+
+def main(mode: str = "list"):
     """
     The main function to execute the permutation generation and output.
+    The mode can be passed as first command line argument.
     """
-    permutation_list_instance = PermutationList()
+    permutation_list_instance = PermutationList(mode=mode)
     permutation_list_instance.input()
     permutation_list_instance.total_permutations()
-    permutation_list_instance.generate_stock()
-    permutation_list_instance.generate_permutations()
+    if permutation_list_instance.mode == "list":
+        permutation_list_instance.generate_permutations()
     permutation_list_instance.output()
 
 if __name__ == "__main__":
-    main()
+    main(*sys.argv[1:2])
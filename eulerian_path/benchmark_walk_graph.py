@@ -0,0 +1,71 @@
+import random
+import time
+from eulerian_path import EulerianPath
+
+# Edge counts of the synthetic graphs, 10^7 edges needs several GB of memory
+EDGE_COUNTS = [10**3, 10**4, 10**5, 10**6, 10**7]
+# The former walk restarts with list slicing and is only timed on small graphs
+LEGACY_EDGE_LIMIT = 10**4
+
+def synthetic_graph(edge_count: int, seed: int = 0) -> dict:
+    """
+    Creates a random Eulerian graph by closing a random walk over edge_count / 10 nodes.
+
+    Parameters:
+    ----------
+    edge_count : int
+        Number of edges in the graph.
+    seed : int, optional
+        Seed of the random number generator (default is 0).
+
+    Returns:
+    -------
+    dict
+        Dictionary representing the directed graph.
+    """
+
+    rng = random.Random(seed)
+    node_count = max(edge_count // 10, 2)
+    walk = [str(rng.randrange(node_count)) for _ in range(edge_count)]
+    graph = {}
+    for node_1, node_2 in zip(walk, walk[1:] + walk[:1]):
+        graph.setdefault(node_1, []).append(node_2)
+    return graph
+
+def legacy_walk_graph(eulerian_path: EulerianPath) -> list:
+    """
+    Walks the graph like the former implementation based on new_walk and remove_edge.
+    """
+
+    unused_edges = {node: list(successors) for node, successors in eulerian_path.graph.items()}
+    walked_path = [list(unused_edges.keys())[0]]
+    while len(unused_edges) != 0:
+        next_node = eulerian_path.next_node(unused_edges=unused_edges, current_node=walked_path[-1])
+        if next_node is None:
+            unused_edges, walked_path = eulerian_path.new_walk(unused_edges=unused_edges, walked_path=walked_path)
+        else:
+            walked_path.append(next_node)
+            unused_edges = eulerian_path.remove_edge(unused_edges=unused_edges, walked_path=walked_path)
+    return walked_path
+
+def main():
+    print(f"{'edges':>10} {'hierholzer [s]':>15} {'legacy [s]':>12}")
+    for edge_count in EDGE_COUNTS:
+        eulerian_path = EulerianPath()
+        eulerian_path.graph = synthetic_graph(edge_count)
+
+        start = time.perf_counter()
+        walked_path = eulerian_path.walk_graph()
+        hierholzer_time = time.perf_counter() - start
+        assert len(walked_path) == edge_count + 1
+
+        legacy_time = "-"
+        if edge_count <= LEGACY_EDGE_LIMIT:
+            start = time.perf_counter()
+            legacy_walk_graph(eulerian_path)
+            legacy_time = f"{time.perf_counter() - start:.3f}"
+
+        print(f"{edge_count:>10} {hierholzer_time:>15.3f} {legacy_time:>12}")
+
+if __name__ == "__main__":
+    main()
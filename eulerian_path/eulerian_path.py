@@ -1,8 +1,12 @@
 from pathlib import Path
 import random
-import itertools
+import sys
 import logging
 from configure_logging import setup_logging
+# Import shared graph helpers
+sys.path.append("../Utility")
+from graph_balance import GraphBalance
+from kmer_graph import KmerGraph
 
 class EulerianPath:
     """
@@ -22,6 +26,8 @@ class EulerianPath:
         Dictionary representing the directed graph.
     additional_edge : dict
         Dictionary to keep track of additional edge added to make the graph balanced.
+    encoded : bool
+        If True, the graph is stored as KmerGraph with integer node ids in CSR arrays.
     logger : logging.Logger
         Logger instance for the class.
 
@@ -29,6 +35,8 @@ class EulerianPath:
     -------
     read_input() -> None
         Reads and parses the input file to construct the graph.
+    parse_lines(lines: list) -> Iterator[tuple]
+        Parses adjacency lines of the input file.
     output_path(path: list) -> None
         Writes the Eulerian path to the output file.
     graph_balance() -> dict
@@ -44,7 +52,7 @@ class EulerianPath:
     new_walk(unused_edges: dict, walked_path: list) -> tuple[dict, list]
         Starts a new walk when no further path can be found from the current node.
     walk_graph() -> list
-        Walks through the graph to find an Eulerian path.
+        Walks through the graph to find an Eulerian cycle using Hierholzer's algorithm.
     linearize_path(walked_path: list) -> list
         Linearizes the Eulerian cycle to form the Eulerian path by removing the artificial edge.
     """
@@ -52,7 +60,7 @@ class EulerianPath:
     DEFAULT_INPUT_PATH = Path("input.txt")
     DEFAULT_OUTPUT_PATH = Path("output.txt")
     
-    def __init__(self, input_path=None, output_path=None):
+    def __init__(self, input_path=None, output_path=None, encoded=False):
         """
         Initializes the EulerianPath with input and output paths.
 
@@ -62,12 +70,15 @@ class EulerianPath:
             Path to the input file (default is None).
         output_path : str or Path, optional
             Path to the output file (default is None).
+        encoded : bool, optional
+            Store the graph with integer node ids in CSR arrays (default is False).
         """
         
         self.input_path = Path(input_path) if input_path else self.DEFAULT_INPUT_PATH
         self.output_path = Path(output_path) if output_path else self.DEFAULT_OUTPUT_PATH
         self.graph = {}
         self.additional_edge = {}
+        self.encoded = encoded
         self.logger = logging.getLogger(__name__)
 
     # Input/Output methods
@@ -92,19 +103,39 @@ class EulerianPath:
         # Read sequences from file
         with open(self.input_path, "r") as file:
             lines = file.readlines()
-            for line in lines:
-                line = line.strip()
-                # Line should be in format: Node_1 -> Node_2 (Node_2 can consists of several nodes)
-                # Split string at whitespaces and keep first node and second node(s)
-                node_1, _, node_2 = line.split()
-                # If node_2 has more than 2 elements, split again
-                if len(node_2) > 1:
-                    self.graph[node_1] = node_2.split(",")
-                else:
-                    self.graph[node_1] = [node_2]
+        
+        if self.encoded:
+            edges = ((node_1, node_2) for node_1, node_2s in self.parse_lines(lines) for node_2 in node_2s)
+            self.graph = KmerGraph.from_edges(edges)
+            self.logger.debug(f"Graph loaded with {self.graph.node_count} nodes")
+            return
+        
+        for node_1, node_2s in self.parse_lines(lines):
+            self.graph[node_1] = node_2s
     
         self.logger.debug(f"Graph loaded: {self.graph}")
 
+    def parse_lines(self, lines: list):
+        """
+        Parses adjacency lines of the input file.
+
+        Parameters:
+        ----------
+        lines : list
+            Lines in the format: Node_1 -> Node_2 (Node_2 can consists of several nodes separated by commas).
+
+        Yields:
+        ------
+        tuple
+            The node and the list of its successors.
+        """
+        
+        for line in lines:
+            line = line.strip()
+            # Split string at whitespaces and keep first node and second node(s)
+            node_1, _, node_2 = line.split()
+            yield node_1, node_2.split(",")
+
     def output_result(self, path: list) -> None:
         """
         Writes the Eulerian path to the output file.
@@ -115,6 +146,9 @@ class EulerianPath:
             The Eulerian path to be written to the file.
         """
         
+        # Decode node ids of encoded graph
+        if self.encoded:
+            path = (self.graph.label(node) for node in path)
         joint_string = "->".join(path)
         with open(self.output_path, "w") as file:
             file.write(joint_string)
@@ -132,47 +166,40 @@ class EulerianPath:
         """
         
         self.logger.debug("Calculating graph balance")
-        # Identify all unique nodes in the graph
-        nodes = set(list(self.graph.keys()) + list(itertools.chain(*self.graph.values())))
-        # Setup dictionary to count incoming edges and outgoing edges
-        balance_dict = {node: [0, 0] for node in nodes}
-        
-        # Count incoming edges in concatenated list
-        concatenated_nodes = list(itertools.chain(*self.graph.values()))
-        for node in balance_dict.keys():
-            incoming_nodes = concatenated_nodes.count(node)
-            balance_dict[node][0] = incoming_nodes
-        
-        # Count outgoing edges
-        for node in balance_dict.keys():
-            outgoing_nodes = len(self.graph.get(node, []))
-            balance_dict[node][1] = outgoing_nodes
-        self.logger.debug(f"Balance dictionary: {balance_dict}")
-        return balance_dict
+        if self.encoded:
+            return self.graph.balance_dict()
+        # Count incoming and outgoing edges in one pass over the graph
+        balance = GraphBalance(self.graph)
+        return balance.balance_dict()
     
     def graph_cycle(self) -> None:
         """
         Transforms the graph to a cycle by adding an artificial edge if necessary.
+
+        Raises:
+        ------
+        ValueError
+            If the node balance does not allow an Eulerian path.
         """
         
         self.logger.debug("Transform graph to cycle")
+        # Encoded graphs are walked from the start node directly
+        if self.encoded:
+            return
         # Find first and last node
-        balance_dictionary = self.graph_balance()
-        # Initialize variables
-        first_node = None
-        last_node = None
-        for key, values in balance_dictionary.items():
-            # Determine last node
-            if values[1] < values[0]:
-                last_node = key
-                self.logger.debug(f"Found last_node : {last_node}")
-            # Determine first node
-            elif values[1] > values[0]:
-                first_node = key
-                self.logger.debug(f"Found first_node : {first_node}")
+        balance = GraphBalance(self.graph)
+        if not balance.is_eulerian():
+            raise ValueError(f"Graph has no Eulerian path, unbalanced nodes: {balance.violations}")
+        # Nothing to add if graph is already a cycle
+        if balance.start_node is None:
+            self.logger.debug("Graph is already balanced")
+            return
+        first_node, last_node = balance.start_node, balance.end_node
+        self.logger.debug(f"Found first_node : {first_node}")
+        self.logger.debug(f"Found last_node : {last_node}")
 
         # Add artifical edge to connect last node with first node to create balanced graph
-        self.graph[last_node] = [first_node]
+        self.graph.setdefault(last_node, []).append(first_node)
         self.additional_edge[last_node] = [first_node]
         self.logger.debug(f"Additional edge found: {self.additional_edge}")
         self.logger.debug(f"Graph after adding artificial edge: {self.graph}")   
@@ -295,35 +322,52 @@ class EulerianPath:
     
     def walk_graph(self) -> list:
         """
-        Walks through the graph to find an Eulerian path.
+        Walks through the graph to find an Eulerian cycle using Hierholzer's algorithm.
+
+        Every node keeps an edge cursor into its adjacency list instead of removing
+        walked edges, and detours are spliced in through an explicit stack, so the
+        walk runs in O(E) time without modifying the graph.
 
         Returns:
         -------
         list
-            List of nodes representing the walked Eulerian path.
+            List of nodes representing the walked Eulerian cycle.
+
+        Raises:
+        ------
+        ValueError
+            If not all edges can be reached from the first node of the graph.
         """
         
         self.logger.debug("Walking the graph")
-        # Initialize a dictionary with unused edges
-        unused_edges = self.graph.copy()
-        # Initialize a list to track walked path with first node
-        walked_path = [list(unused_edges.keys())[0]]
-        # Initialize next node as empty string
-        next_node = str()
+        if self.encoded:
+            return self.graph.eulerian_path()
+        # Initialize edge cursors pointing to the next unused edge of every node
+        edge_cursors = dict.fromkeys(self.graph, 0)
+        # Initialize stack with first node in graph and list for finished cycle
+        stack = [next(iter(self.graph))]
+        walked_path = []
         
-        while len(unused_edges) != 0:
-            current_node = walked_path[-1]
-            next_node = self.next_node(unused_edges=unused_edges, current_node=current_node)
-            # If next node = None, then an early stop is reached
-            if next_node is None:
-                # Update unused_edges and walked_path
-                self.logger.debug(f"Early stopp: {walked_path}")
-                unused_edges, walked_path = self.new_walk(unused_edges=unused_edges, walked_path=walked_path)
+        while stack:
+            current_node = stack[-1]
+            successors = self.graph.get(current_node, ())
+            cursor = edge_cursors.get(current_node, 0)
+            if cursor < len(successors):
+                # Walk next unused edge and advance cursor
+                edge_cursors[current_node] = cursor + 1
+                stack.append(successors[cursor])
             else:
-                walked_path.append(next_node)
-                self.logger.debug(f"Walked path: {walked_path}")
-                # Remove edge from unused eges
-                unused_edges = self.remove_edge(unused_edges=unused_edges, walked_path=walked_path)
+                # Early stop reached, backtrack and add node to cycle
+                walked_path.append(stack.pop())
+        
+        # Nodes are collected while backtracking, reverse to get walking order
+        walked_path.reverse()
+        
+        # Raise error if edges could not be reached from the starting node
+        edge_count = sum(len(successors) for successors in self.graph.values())
+        if len(walked_path) != edge_count + 1:
+            raise ValueError("Graph contains edges that cannot be reached!")
+        self.logger.debug(f"Walked {edge_count} edges")
         
         return walked_path
     
@@ -332,26 +376,35 @@ class EulerianPath:
         Linearize a walked path in a graph.
 
         Args:
-            walked_path (list): A list representing the walked path in the graph.
+            walked_path (list): A list representing the walked cycle in the graph.
 
         Returns:
-            list: A linearized path obtained by splitting the walked path at the position of the ending node,
-                and reordering the segments to ensure overlap.
+            list: A linearized path obtained by removing the artificial edge from the cycle and rotating
+                the cycle so that it starts behind this edge. The cycle is returned unchanged if no edge was added.
 
         Raises:
-            ValueError: If the walked path cannot be split into left and right parts due to lack of overlap.
+            ValueError: If the walked path does not contain the artificial edge.
         """
         self.logger.debug(f"Start linearizing graph.")
-        # Split walked path at position of ending node
-        ending_node_position = walked_path.index(str(*list(self.additional_edge.keys())))
+        # Path of encoded graph already starts at the first node
+        if self.encoded:
+            return walked_path
+        # Balanced graph without artificial edge is already a valid path
+        if not self.additional_edge:
+            return walked_path
+        (last_node, (first_node,)), = self.additional_edge.items()
+        # Find the position where the artificial edge last_node -> first_node is walked
+        for ending_node_position in range(len(walked_path) - 1):
+            if walked_path[ending_node_position] == last_node and walked_path[ending_node_position + 1] == first_node:
+                break
+        else:
+            raise ValueError("Walked path cannot be split!")
         self.logger.debug(f"Ending node position: {ending_node_position}")
         left_part = walked_path[:ending_node_position+1]
         right_part = walked_path[ending_node_position+1:]
         self.logger.debug(f"left_part: {left_part}")
         self.logger.debug(f"right_part: {right_part}")
-        # Check that right part and left part overlap
-        if right_part[-1] != left_part[0]:
-            raise ValueError("Walked path cannot be split!")
+        # Cycle starts and ends at the same node, drop it from the left part
         linearized_path = right_part + left_part[1:]
         self.logger.debug(f"Linearized path: {linearized_path}")
         
@@ -31,3 +31,15 @@ def test_graph_cycle(tester):
 
 
 
+def test_graph_cycle_unbalanced(tester):
+    graph = {"0" : ["1", "2", "3"], "1" : ["0"]}
+    tester.graph = graph
+    with pytest.raises(ValueError):
+        tester.graph_cycle()
+
+def test_graph_cycle_balanced(tester):
+    graph = {"0" : ["1"], "1" : ["0"]}
+    tester.graph = graph
+    tester.graph_cycle()
+    assert tester.graph == {"0" : ["1"], "1" : ["0"]}
+    assert tester.additional_edge == {}
@@ -51,3 +51,54 @@ def test_walk_graph_2(tester):
         # Check if 2 cycles are equivalent
         assert are_cycles_equivalent(cycle1=expected_output, cycle2=linear_path) == True
     
+
+def test_walk_graph_large_cycle(tester):
+    # Long cycle with a nested loop at every node, deep enough to break recursive walks
+    node_count = 100000
+    graph = {str(node): [str(node), str((node + 1) % node_count)] for node in range(node_count)}
+    tester.graph = graph
+    walked_path = tester.walk_graph()
+    
+    # Every edge has to be walked exactly once
+    walked_edges = sorted(zip(walked_path, walked_path[1:]))
+    expected_edges = sorted((node, next_node) for node, next_nodes in graph.items() for next_node in next_nodes)
+    assert walked_edges == expected_edges
+    assert walked_path[0] == walked_path[-1]
+
+def test_walk_graph_unreachable_edges(tester):
+    graph = {"0" : ["1"], "1" : ["0"], "2" : ["3"], "3" : ["2"]}
+    tester.graph = graph
+    with pytest.raises(ValueError):
+        tester.walk_graph()
+
+def test_walk_graph_encoded():
+    tester = EulerianPath(encoded=True)
+    tester.input_path = Path("tests/test_graph.txt")
+    tester.read_input()
+    tester.graph_cycle()
+    walked_path = tester.walk_graph()
+    linear_path = [tester.graph.label(node) for node in tester.linearize_path(walked_path=walked_path)]
+    
+    # Path has to walk every edge of the input graph exactly once
+    expected_graph = EulerianPath()
+    expected_graph.input_path = Path("tests/test_graph.txt")
+    expected_graph.read_input()
+    expected_edges = sorted((node, next_node) for node, next_nodes in expected_graph.graph.items() for next_node in next_nodes)
+    assert sorted(zip(linear_path, linear_path[1:])) == expected_edges
+
+def test_linearize_path_revisited_end_node(tester):
+    # End node Y is visited before the artificial edge Y -> X is walked
+    graph = {"X" : ["Y"], "Y" : ["Z"], "Z" : ["Y"]}
+    tester.graph = graph
+    tester.graph_cycle()
+    walked_path = tester.walk_graph()
+    linear_path = tester.linearize_path(walked_path=walked_path)
+    assert linear_path == ["X", "Y", "Z", "Y"]
+
+def test_linearize_path_balanced(tester):
+    # Without artificial edge the walked cycle is returned unchanged
+    graph = {"0" : ["1"], "1" : ["2"], "2" : ["0"]}
+    tester.graph = graph
+    tester.graph_cycle()
+    walked_path = tester.walk_graph()
+    assert tester.linearize_path(walked_path=walked_path) == walked_path
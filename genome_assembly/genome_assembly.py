@@ -1,15 +1,26 @@
-from utility.fasta_reader import read_fasta
+import sys
+# Import shared FASTA reader
+sys.path.append("../Utility")
+from fasta_reader import read_fasta
+from utility.overlap_finder import find_overlaps
+import heapq
 import os
 
 
 class GenomeAssembly:
     
-    def __init__(self, input_path="data.txt"):
+    # Number of best successors kept per read, bounds memory to len(sequences) * MAX_CANDIDATES overlaps
+    MAX_CANDIDATES = 8
+    
+    def __init__(self, input_path="data.txt", min_overlap=1, max_candidates=MAX_CANDIDATES):
 
         self.input_path = input_path
+        self.min_overlap = min_overlap
+        # Number of best successors kept per read, None keeps all
+        self.max_candidates = max_candidates
         self.sequences = None
-        self.matrix = None
-        self.transposed_matrix = None
+        self.candidates = None
+        self.contigs = None
         
     def read_sequences(self) -> None:
             
@@ -28,94 +39,97 @@ class GenomeAssembly:
     
     def suffix_matrix(self) -> None:
         """
-        Calculate the suffix matrix to determine the maximum overlapping substrings between all sequences.
-        The entries are the suffix score, which is the maximum number of overlapping nucleotides from the 
-        3' end of the sequence in the column with the 5' end of the sequence in the row.
+        Build the best-overlap table, which lists the successors of every sequence ordered by decreasing
+        suffix score. The suffix score is the maximum number of overlapping nucleotides from the 3' end
+        of a sequence with the 5' end of its successor. Sequences are identified by their index, only
+        scores of at least min_overlap and only the max_candidates best successors per sequence are
+        enumerated, so the full overlap matrix is never built.
 
-        Returns:
-            dict: A suffix matrix with all sequences as columns and rows and the suffix score indicating the maximum overlapping substring length.
-            
         Example:
-        >>> sequences = ['ATTAGACCTG', 'AGACCTGCCG']
-        >>> suffix_matrix(sequences)
-            {'ATTAGACCTG': [0, 7], 'AGACCTGCCG': [0, 0]}
-            # That means the 2nd sequence has a suffix score of 7 since AGACCTG overlapps with 1st sequence.
+        For the sequences ['ATTAGACCTG', 'AGACCTGCCG'] the table is [[(7, 1)], []],
+        since the suffix AGACCTG of the 1st sequence overlaps the 2nd sequence.
         """
-        # Initialize suffix matrix with 0s
-        suffix_matrix = {sequence: 0 for sequence in self.sequences}
-        
-        # Iterate over sequences
-        for matrix_sequence in suffix_matrix.keys():
-            suffix_score = []
-            for sequence in self.sequences:
-                # If sequences are identical set suffix score to 0
-                if matrix_sequence == sequence:
-                    suffix_score.append(0)
-                else:
-                    for position in range(len(sequence), 0, -1):
-                        current_window = sequence[:position]
-                        # Check if the current window matches the suffix of the matrix sequence
-                        if current_window == matrix_sequence[-position:]:
-                            suffix_score.append(position)
-                            break
-                        # If sequences have no overlap at all, score 0
-                        if position == 1:
-                            suffix_score.append(0)
-            suffix_matrix[matrix_sequence] = suffix_score
-        
-        self.matrix = suffix_matrix
+        overlaps = find_overlaps(sequences=self.sequences, min_overlap=self.min_overlap, max_candidates=self.max_candidates)
+        self.candidates = [
+            [(score, successor_id) for successor_id, score in overlaps.pop(identifier).items()]
+            for identifier in range(len(self.sequences))
+            ]
     
-    def transpose_suffix_matrix(self) -> None:
-        self.transposed_matrix = [list(row) for row in zip(*self.matrix.values())]
-     
-    def find_terminus(self):
-        # First find the read will be placed at the 3' end since it has the lowest sum of passed suffix scores
-        suffix_sums = {sequence: sum(suffix_score) for sequence, suffix_score in self.matrix.items()}
-        terminus = min(suffix_sums, key=lambda seq: suffix_sums[seq])
-        # Determine id of terminus
-        terminus_id = self.sequences.index(terminus)
-        return terminus_id
+    def find_root(self, chain_roots: list, identifier: int) -> int:
+        """
+        Find the representative of the chain containing a sequence and compress the path to it.
+
+        Args:
+            chain_roots (list): Union-find parent of every sequence.
+            identifier (int): Index of the sequence.
+
+        Returns:
+            int: Index of the representative sequence.
+        """
+        root = identifier
+        while chain_roots[root] != root:
+            root = chain_roots[root]
+        while chain_roots[identifier] != root:
+            chain_roots[identifier], identifier = root, chain_roots[identifier]
+        return root
     
-    def next_prefix(self, identifier):
-        max_score = max(self.transposed_matrix[identifier])
-        prefix_id = self.transposed_matrix[identifier].index(max_score)
+    def assemble(self) -> str:
+        """
+        Greedily join sequences by decreasing suffix score.
+
+        A heap holds the best remaining successor of every sequence that has none yet. The top entry
+        is joined unless its successor already has a predecessor or both sequences are in the same
+        chain, in which case the next candidate of that sequence is pushed, so every update costs
+        O(log n).
+
+        Returns:
+            str: The longest assembled contig. All contigs are stored in 'contigs'.
+        """
+        number_sequences = len(self.sequences)
+        successors = [None] * number_sequences
+        has_predecessor = [False] * number_sequences
+        chain_roots = list(range(number_sequences))
         
-        return prefix_id, max_score
-    
-    def assemble(self):
+        # Initialize heap with the best successor of every sequence
+        heap = [
+            (-candidates[0][0], identifier, candidates[0][1], 0)
+            for identifier, candidates in enumerate(self.candidates) if candidates
+            ]
+        heapq.heapify(heap)
         
-        for step in range(len(self.sequences) - 1):
-            if step == 0:
-                # Start with terminus of sequence
-                term_id = self.find_terminus()
-                term_seq = self.sequences[term_id]
-                prefix_id, max_score = self.next_prefix(identifier=term_id)
-                # Trim 3' part of prefix according to score
-                trimmed_prefix = self.sequences[prefix_id][:-max_score]
-                # Fuse sequences
-                fused_seq = trimmed_prefix + term_seq
-            else:
-                # Change prefix_id to suffix_id
-                suffix_id = prefix_id
-                # Determine next prefix
-                prefix_id, max_score = self.next_prefix(identifier=suffix_id)
-                # Trim 3' part of prefix according to score
-                trimmed_prefix = self.sequences[prefix_id][:-max_score]
-                # Fuse sequences
-                fused_seq = trimmed_prefix + fused_seq
+        while heap:
+            negative_score, identifier, successor_id, rank = heapq.heappop(heap)
+            prefix_root = self.find_root(chain_roots, identifier)
+            suffix_root = self.find_root(chain_roots, successor_id)
+            if not has_predecessor[successor_id] and prefix_root != suffix_root:
+                # Join sequences and merge their chains
+                successors[identifier] = (successor_id, -negative_score)
+                has_predecessor[successor_id] = True
+                chain_roots[suffix_root] = prefix_root
+            elif rank + 1 < len(self.candidates[identifier]):
+                # Try next best successor of this sequence
+                score, next_successor_id = self.candidates[identifier][rank + 1]
+                heapq.heappush(heap, (-score, identifier, next_successor_id, rank + 1))
         
-        print(fused_seq)
-                
-                
-
-
+        # Spell contigs from every sequence without predecessor
+        contigs = []
+        for identifier in range(number_sequences):
+            if has_predecessor[identifier]:
+                continue
+            contig_parts = [self.sequences[identifier]]
+            while successors[identifier] is not None:
+                identifier, score = successors[identifier]
+                contig_parts.append(self.sequences[identifier][score:])
+            contigs.append("".join(contig_parts))
+        
+        self.contigs = sorted(contigs, key=len, reverse=True)
+        return self.contigs[0] if self.contigs else ""
 
 def main():
     tester = GenomeAssembly()
     tester.read_sequences()
     tester.suffix_matrix()
-    tester.transpose_suffix_matrix()
-    tester.assemble()
+    print(tester.assemble())
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,31 @@
+import pytest
+from genome_assembly import GenomeAssembly
+
+# Create fixture for instantiating
+@pytest.fixture
+def tester():
+    return GenomeAssembly(input_path="tests/test_reads.txt")
+
+# Test for non-existing file
+def test_read_sequences_file_not_found():
+    with pytest.raises(FileNotFoundError):
+        GenomeAssembly(input_path="no_file.txt").read_sequences()
+
+# Test for reading through the shared FASTA reader
+def test_read_sequences(tester):
+    tester.read_sequences()
+    assert tester.sequences == ["ATTAGACCTG", "CCTGCCGGAA", "AGACCTGCCG", "GCCGGAATAC"]
+
+# Test for assembly of the sample dataset
+def test_assemble(tester):
+    tester.read_sequences()
+    tester.suffix_matrix()
+    assert tester.assemble() == "ATTAGACCTGCCGGAATAC"
+
+# Test for the bounded best-overlap table
+def test_suffix_matrix_bounded(tester):
+    tester.read_sequences()
+    tester.max_candidates = 1
+    tester.suffix_matrix()
+    assert all(len(candidates) <= 1 for candidates in tester.candidates)
+    assert tester.candidates[0] == [(7, 2)]
@@ -0,0 +1,168 @@
+from array import array
+from collections import deque
+from typing import Dict, List, Tuple
+
+def build_prefix_trie(sequences: List[str]) -> Tuple[array, array, array, Dict[str, int]]:
+    """
+    Build a trie of all sequences where every node represents a prefix of at least one sequence.
+
+    Parameters:
+    - sequences (List[str]): The sequences to insert.
+
+    Returns:
+    tuple: The flat child table with len(alphabet) entries per node (-1 for missing children),
+           the depth of every node, the node of every complete sequence and the alphabet mapping
+           characters to child positions.
+    """
+    alphabet = {char: code for code, char in enumerate(sorted(set().union(*sequences)))}
+    alphabet_size = max(len(alphabet), 1)
+    children = array("i", [-1] * alphabet_size)
+    depth = array("i", [0])
+    end_nodes = array("i")
+
+    for sequence in sequences:
+        node = 0
+        for char in sequence:
+            position = node * alphabet_size + alphabet[char]
+            child = children[position]
+            # Append new node if prefix is not in trie yet
+            if child == -1:
+                child = len(depth)
+                children[position] = child
+                children.extend([-1] * alphabet_size)
+                depth.append(depth[node] + 1)
+            node = child
+        end_nodes.append(node)
+
+    return children, depth, end_nodes, alphabet
+
+def subtree_ranges(children: array, node_count: int, alphabet_size: int, end_nodes: array) -> Tuple[array, array, array]:
+    """
+    Order the sequences by a depth-first traversal of the trie, so all sequences starting with
+    the prefix of a node form one contiguous range.
+
+    Parameters:
+    - children (array): Flat child table of the trie.
+    - node_count (int): Number of nodes in the trie.
+    - alphabet_size (int): Number of children per node.
+    - end_nodes (array): Node of every complete sequence.
+
+    Returns:
+    tuple: Sequence indexes in traversal order and the start and end of each node's range in this order.
+    """
+    sequences_at_node = {}
+    for index, node in enumerate(end_nodes):
+        sequences_at_node.setdefault(node, []).append(index)
+
+    order = array("i")
+    range_start = array("i", [0] * node_count)
+    range_end = array("i", [0] * node_count)
+    # Negative entries mark nodes whose subtree is finished
+    stack = [0]
+    while stack:
+        node = stack.pop()
+        if node < 0:
+            range_end[~node] = len(order)
+            continue
+        range_start[node] = len(order)
+        order.extend(sequences_at_node.get(node, ()))
+        stack.append(~node)
+        for position in range(node * alphabet_size + alphabet_size - 1, node * alphabet_size - 1, -1):
+            if children[position] != -1:
+                stack.append(children[position])
+
+    return order, range_start, range_end
+
+def add_failure_links(children: array, node_count: int, alphabet_size: int) -> array:
+    """
+    Turn the trie into an Aho-Corasick automaton. The failure link of a node points to the node
+    of the longest proper suffix of its string that is also a prefix in the trie. Missing children
+    are replaced by the transition of the failure node.
+
+    Parameters:
+    - children (array): Flat child table of the trie, completed in place.
+    - node_count (int): Number of nodes in the trie.
+    - alphabet_size (int): Number of children per node.
+
+    Returns:
+    array: The failure link of every node.
+    """
+    failure = array("i", [0] * node_count)
+    queue = deque()
+    for position in range(alphabet_size):
+        if children[position] == -1:
+            children[position] = 0
+        else:
+            queue.append(children[position])
+
+    # Breadth-first, so failure nodes are always completed before they are used
+    while queue:
+        node = queue.popleft()
+        base = node * alphabet_size
+        failure_base = failure[node] * alphabet_size
+        for code in range(alphabet_size):
+            child = children[base + code]
+            if child == -1:
+                children[base + code] = children[failure_base + code]
+            else:
+                failure[child] = children[failure_base + code]
+                queue.append(child)
+
+    return failure
+
+def find_overlaps(sequences: List[str], min_overlap: int = 1, max_candidates: int = None) -> Dict[int, Dict[int, int]]:
+    """
+    Find the maximal overlap of the suffix of every sequence with the prefix of every other sequence.
+
+    All sequences are inserted into an Aho-Corasick automaton over their prefixes. The node of a
+    complete sequence and its chain of failure links enumerate every suffix that is a prefix of some
+    sequence from longest to shortest, so each overlapping pair is found once with its maximal length.
+    Building the automaton is linear in the total sequence length times the alphabet size. Reporting
+    walks the failure chain of every sequence and scans the subtree range of every node on it, and a
+    sequence is rescanned in the range of every prefix of it that is a suffix of the other sequence,
+    so reporting costs O(sum of failure chain lengths + sum of scanned range sizes). This can exceed
+    the number of reported overlaps for repetitive reads; max_candidates stops the scan of a sequence
+    early.
+
+    Parameters:
+    - sequences (List[str]): The reads, identified by their index.
+    - min_overlap (int): Minimum overlap length to keep. Defaults to 1.
+    - max_candidates (int): Maximum number of overlaps kept per sequence. As overlaps are found from
+      longest to shortest, the walk stops after the max_candidates longest ones, so memory stays
+      bounded by len(sequences) * max_candidates. None keeps all overlaps. Defaults to None.
+
+    Returns:
+    dict: Sparse overlaps where result[i][j] is the length of the longest suffix of sequence i
+          that equals a prefix of sequence j, ordered by decreasing length.
+
+    Example:
+    >>> find_overlaps(['ATTAGACCTG', 'AGACCTGCCG'])
+    {0: {1: 7}, 1: {}}
+    """
+    if min_overlap < 1:
+        raise ValueError("Minimum overlap has to be at least 1")
+    if max_candidates is not None and max_candidates < 1:
+        raise ValueError("Maximum number of candidates has to be at least 1")
+    candidate_limit = len(sequences) if max_candidates is None else max_candidates
+
+    children, depth, end_nodes, alphabet = build_prefix_trie(sequences)
+    node_count = len(depth)
+    alphabet_size = max(len(alphabet), 1)
+    order, range_start, range_end = subtree_ranges(children, node_count, alphabet_size, end_nodes)
+    failure = add_failure_links(children, node_count, alphabet_size)
+
+    overlaps = {}
+    for index, node in enumerate(end_nodes):
+        sequence_overlaps = {}
+        # Walk suffixes that are prefixes of other sequences from longest to shortest
+        while depth[node] >= min_overlap and len(sequence_overlaps) < candidate_limit:
+            for position in range(range_start[node], range_end[node]):
+                other_index = order[position]
+                if other_index != index and other_index not in sequence_overlaps:
+                    sequence_overlaps[other_index] = depth[node]
+                    if len(sequence_overlaps) == candidate_limit:
+                        break
+            node = failure[node]
+        overlaps[index] = sequence_overlaps
+
+    return overlaps
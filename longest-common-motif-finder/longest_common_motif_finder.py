@@ -0,0 +1,286 @@
+# Import FASTA reading function
+import argparse
+import sys
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice, repeat
+sys.path.append("../Utility")
+from fasta_reader import read_fasta
+
+
+class LongestCommonMotifFinder:
+    """
+    LongestCommonMotifFinder is a class designed for finding the longest common motif
+    among a collection of DNA sequences provided in a FASTA file.
+
+    Attributes:
+        DEFAULT_INPUT_PATH (str): Default path to the input file containing DNA sequences.
+        DEFAULT_OUTPUT_PATH (str): Default path to the output file for storing the result.
+
+        input_path (str): Path to the input FASTA file containing DNA sequences.
+        output_path (str): Path to the output file for storing the longest common motif.
+        dna_sequences (list): Contains DNA strings read from FASTA.
+        prefix_hashes (dict): Polynomial hashes of all prefixes of every DNA sequence.
+        longest_motif (str): Longest common motif found among all sequences.
+        longest_motifs (list): All longest common motifs in alphabetical order.
+        quiet (bool): Suppresses the progress messages of the search.
+
+    Methods:
+        __init__(self, input_path=None, output_path=None, quiet=False):
+            Initializes the LongestCommonMotifFinder instance.
+        
+        read_sequence(self):
+            Reads DNA sequences from the input FASTA file.
+
+        window_hashes(self, sequence, motif_length):
+            Computes the rolling hash of every substring of a given length.
+
+        common_motifs(self, motif_length):
+            Finds all motifs of a given length that are present in all DNA sequences.
+
+        common_motifs_by_slices(self, motif_length):
+            Finds all common motifs of a given length by intersecting sets of substrings.
+
+        find_longest_motifs(self):
+            Finds all longest common motifs by a binary search over the motif length.
+
+        write_result(self):
+            Writes the longest common motif to the output file.
+    """
+    # Class constants
+    DEFAULT_INPUT_PATH = "data.txt"
+    DEFAULT_OUTPUT_PATH = "result.txt"
+    # Rolling hash modulo the Mersenne prime 2^61 - 1
+    HASH_BASE = 1000003
+    HASH_MODULUS = (1 << 61) - 1
+    
+    def __init__(self, input_path=None, output_path=None, quiet=False):
+        """
+        Initialize LongestCommonMotifFinder with input and output file paths.
+
+        Parameters:
+        - input_path (str): Path to the input file containing DNA sequences. Default is None.
+        - output_path (str): Path to the output file for storing longest common motif. Default is None.
+        - quiet (bool): Suppress the progress messages of the search. Default is False.
+        """
+        self.input_path = input_path or self.DEFAULT_INPUT_PATH
+        self.output_path = output_path or self.DEFAULT_OUTPUT_PATH
+        self.dna_sequences = []
+        self.prefix_hashes = {}
+        self.longest_motif = ""
+        self.longest_motifs = []
+        self.quiet = quiet
+        
+        
+    def read_sequence(self):
+        """
+        Read DNA sequences from FASTA file.
+        """
+        # Check if file exists
+        if not os.path.exists(self.input_path):
+            raise FileNotFoundError(f"Input file not found: {self.input_path}")
+        
+        # Read all sequences from file
+        seq_dict = read_fasta(self.input_path)
+        # Put sequences in list
+        self.dna_sequences = list(seq_dict.values())
+    
+    def window_hashes(self, sequence, motif_length):
+        """
+        Compute the Rabin-Karp hash of every substring of a given length.
+
+        The hashes of all prefixes are computed once per sequence. The hash of the substring at
+        position i is then hash(prefix i + m) - hash(prefix i) * base^m, so every window costs
+        O(1) for any motif length m.
+
+        Parameters:
+        - sequence (str): DNA sequence.
+        - motif_length (int): Length of the substrings.
+
+        Returns:
+        - list: Hash of the substring at every position.
+        """
+        prefix_hashes = self.prefix_hashes.get(sequence)
+        if prefix_hashes is None:
+            prefix_hashes = [0]
+            for code in sequence.encode():
+                prefix_hashes.append((prefix_hashes[-1] * self.HASH_BASE + code) % self.HASH_MODULUS)
+            self.prefix_hashes[sequence] = prefix_hashes
+        
+        power = pow(self.HASH_BASE, motif_length, self.HASH_MODULUS)
+        modulus = self.HASH_MODULUS
+        return [(end - start * power) % modulus for start, end in zip(prefix_hashes, islice(prefix_hashes, motif_length, None))]
+    
+    def common_motifs(self, motif_length):
+        """
+        Find all motifs of a given length that are present in all DNA sequences.
+
+        The window hashes of the shortest sequence are the candidates. They are intersected with
+        the window hashes of every other sequence, stopping as soon as no candidate is left, so a
+        call takes O(total length) without slicing substrings. The first position of every hash in
+        every sequence is kept, and each remaining candidate is compared with the substrings at
+        these positions. If a hash collision shows up, the motifs are found by slicing instead.
+        Only distinct motifs of the shortest sequence with equal hashes would be merged, which has a
+        probability below L^2 / 2^61 for a shortest sequence of length L.
+
+        Parameters:
+        - motif_length (int): Length of the motifs.
+
+        Returns:
+        - set: Motifs of the given length present in all sequences.
+        """
+        sequences = sorted(self.dna_sequences, key=len)
+        # First position of every hash in every sequence, reversed so the first position is kept
+        positions = []
+        candidates = None
+        for seq in sequences:
+            hashes = self.window_hashes(seq, motif_length)
+            first_positions = dict(zip(reversed(hashes), range(len(hashes) - 1, -1, -1)))
+            if candidates is not None:
+                first_positions = {value: first_positions[value] for value in candidates if value in first_positions}
+            candidates = first_positions
+            positions.append(first_positions)
+            if not candidates:
+                return set()
+        
+        # Check the candidates against the substrings to rule out hash collisions
+        motifs = set()
+        for value in candidates:
+            motif = sequences[0][positions[0][value]:positions[0][value] + motif_length]
+            for seq, first_positions in zip(sequences[1:], positions[1:]):
+                if not seq.startswith(motif, first_positions[value]):
+                    return self.common_motifs_by_slices(motif_length)
+            motifs.add(motif)
+        return motifs
+    
+    def common_motifs_by_slices(self, motif_length):
+        """
+        Find all motifs of a given length that are present in all DNA sequences by intersecting
+        the substrings of the shortest sequence with the substrings of every other sequence.
+        Used by 'common_motifs' if hashes collide.
+
+        Parameters:
+        - motif_length (int): Length of the motifs.
+
+        Returns:
+        - set: Motifs of the given length present in all sequences.
+        """
+        sequences = sorted(self.dna_sequences, key=len)
+        shortest_seq = sequences[0]
+        candidates = {shortest_seq[pos:pos + motif_length] for pos in range(len(shortest_seq) - motif_length + 1)}
+        for seq in sequences[1:]:
+            if not candidates:
+                break
+            slices = map(slice, range(len(seq) - motif_length + 1), range(motif_length, len(seq) + 1))
+            candidates = candidates.intersection(map(seq.__getitem__, slices))
+        return candidates
+    
+    def find_longest_motifs(self):
+        """
+        Find all longest common motifs of the DNA sequences.
+
+        Every substring of a common motif is a common motif as well, so the longest motif length
+        can be found by a binary search, which needs O(log L) calls of 'common_motifs' for a
+        shortest sequence of length L.
+
+        Returns:
+        - list: All longest common motifs in alphabetical order.
+        """
+        if not self.dna_sequences:
+            raise ValueError("No DNA sequences to compare")
+        
+        # Invariant: motifs of length min_length are common, motifs longer than max_length are not
+        min_length, max_length = 0, min(len(seq) for seq in self.dna_sequences)
+        while min_length < max_length:
+            motif_length = (min_length + max_length + 1) // 2
+            common_motif_number = len(self.common_motifs(motif_length))
+            if not self.quiet:
+                print(f"Motif length {motif_length}: {common_motif_number} common motifs")
+            if common_motif_number:
+                min_length = motif_length
+            else:
+                max_length = motif_length - 1
+        
+        self.longest_motifs = sorted(self.common_motifs(min_length)) if min_length else []
+        self.longest_motif = self.longest_motifs[0] if self.longest_motifs else ""
+        return self.longest_motifs
+    
+    def write_result(self):
+        """
+        Write result to the output file.
+        """
+        with open(self.output_path, "w") as file:
+            file.write(f"{self.longest_motif}")
+
+
+def longest_motifs_of_file(input_path, quiet=True):
+    """
+    Find all longest common motifs of the DNA sequences in one FASTA file.
+
+    Parameters:
+    - input_path (str): Path to the FASTA file.
+    - quiet (bool): Suppress the progress messages of the search. Default is True.
+
+    Returns:
+    - list: All longest common motifs in alphabetical order.
+    """
+    motif_finder = LongestCommonMotifFinder(input_path=input_path, quiet=quiet)
+    motif_finder.read_sequence()
+    return motif_finder.find_longest_motifs()
+
+
+def find_longest_motifs_batch(input_paths, workers=None, quiet=True):
+    """
+    Find the longest common motifs of several FASTA files, each a separate collection of sequences.
+
+    The files are independent, so they are processed in parallel in a process pool.
+
+    Parameters:
+    - input_paths (str or list): Path to one multi-FASTA file or list of paths.
+    - workers (int): Number of processes, None uses all CPUs and 1 runs in the current process.
+    - quiet (bool): Suppress the progress messages of the search. Default is True.
+
+    Returns:
+    - list: All longest common motifs in alphabetical order for every input path, in the order of
+      input_paths, so paths given twice get a result each.
+    """
+    if isinstance(input_paths, (str, os.PathLike)):
+        input_paths = [input_paths]
+    input_paths = list(input_paths)
+    
+    if workers == 1 or len(input_paths) <= 1:
+        return list(map(longest_motifs_of_file, input_paths, repeat(quiet)))
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(longest_motifs_of_file, input_paths, repeat(quiet)))
+
+        
+def main(argv=None):
+    """
+    Find the longest common motif of one FASTA file, or of several files in parallel.
+
+    Parameters:
+    - argv (list): Command line arguments. Default is sys.argv.
+    """
+    parser = argparse.ArgumentParser(description="Find the longest common motif of the sequences in FASTA files.")
+    parser.add_argument("input_paths", nargs="*", default=[LongestCommonMotifFinder.DEFAULT_INPUT_PATH],
+                        help="FASTA files, each holding one collection of sequences. Default is data.txt")
+    parser.add_argument("--output", default=LongestCommonMotifFinder.DEFAULT_OUTPUT_PATH,
+                        help="output file with one longest motif per input file. Default is result.txt")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="number of processes for several input files. Default uses all CPUs")
+    args = parser.parse_args(argv)
+
+    if len(args.input_paths) == 1:
+        motif_finder = LongestCommonMotifFinder(input_path=args.input_paths[0], output_path=args.output, quiet=True)
+        motif_finder.read_sequence()
+        motif_finder.find_longest_motifs()
+        motif_finder.write_result()
+        return
+
+    results = find_longest_motifs_batch(args.input_paths, workers=args.workers)
+    with open(args.output, "w") as file:
+        file.write("\n".join(motifs[0] if motifs else "" for motifs in results))
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,38 @@
+import pytest
+from longest_common_motif_finder import LongestCommonMotifFinder, find_longest_motifs_batch, main
+
+# Sample collection of rosalind and its longest common motifs
+sample_sequences = ["GATTACA", "TAGACCA", "ATACA"]
+sample_motifs = ["AC", "CA", "TA"]
+
+@pytest.fixture
+def fasta_paths(tmp_path):
+    first_path = tmp_path / "first.fasta"
+    first_path.write_text("".join(f">Rosalind_{index}\n{sequence}\n" for index, sequence in enumerate(sample_sequences)))
+    second_path = tmp_path / "second.fasta"
+    second_path.write_text(">Rosalind_1\nGGATCCAA\n>Rosalind_2\nTTGGATCC\n")
+    return [str(first_path), str(second_path)]
+
+def test_find_longest_motifs(fasta_paths):
+    motif_finder = LongestCommonMotifFinder(input_path=fasta_paths[0], quiet=True)
+    motif_finder.read_sequence()
+    assert motif_finder.find_longest_motifs() == sample_motifs
+
+def test_batch_parallel(fasta_paths):
+    # Duplicate paths keep one result per input position
+    input_paths = fasta_paths + fasta_paths[:1]
+    results = find_longest_motifs_batch(input_paths, workers=2)
+    assert results == [sample_motifs, ["GGATCC"], sample_motifs]
+
+def test_main_several_files(fasta_paths, tmp_path):
+    output_path = tmp_path / "result.txt"
+    main(fasta_paths + ["--workers", "2", "--output", str(output_path)])
+    assert output_path.read_text().split("\n") == ["AC", "GGATCC"]
+
+def test_common_motifs_hash_collision(monkeypatch):
+    motif_finder = LongestCommonMotifFinder(quiet=True)
+    motif_finder.dna_sequences = sample_sequences
+    # A tiny modulus makes hashes collide, which falls back to sliced substrings
+    monkeypatch.setattr(LongestCommonMotifFinder, "HASH_MODULUS", 7)
+    assert sorted(motif_finder.common_motifs(2)) == sample_motifs
+    assert motif_finder.find_longest_motifs() == sample_motifs
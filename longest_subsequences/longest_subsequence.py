@@ -1,71 +1,75 @@
+import os
+from array import array
+from bisect import bisect_left
+
 class LongestSubsequences:
-    
-    def __init__(self):
+
+    def __init__(self, input_path="data.txt", output_path="result.txt"):
+        self.input_path = input_path
+        self.output_path = output_path
         self.permutation = None
         self.increasing_seq = None
         self.decreasing_seq = None
 
-    def remove_maximum(self, window: list) -> list:
-        window.remove(max(window))
-        return window
+    def read_permutation(self):
+        # Check if file exists
+        if not os.path.exists(self.input_path):
+            raise FileNotFoundError(f"Input file not found: {self.input_path}")
+
+        # First value is the length of the permutation, the permutation follows
+        with open(self.input_path, "r") as file:
+            length, *values = file.read().split()
+        self.permutation = array("i", map(int, values))
+        if len(self.permutation) != int(length):
+            raise ValueError(f"Expected {length} values, found {len(self.permutation)}")
+
+    def longest_subsequence(self, sequence, decreasing=False) -> array:
+        # Patience sorting: tail_values[k] is the smallest last value of all increasing
+        # subsequences of length k + 1 seen so far, tail_indices[k] the position of that value
+        tail_values = array("i")
+        tail_indices = array("i")
+        # Position of the previous element of the subsequence ending at every position
+        predecessors = array("i", bytes(4 * len(sequence)))
+        # Decreasing subsequences are increasing subsequences of the negated values
+        sign = -1 if decreasing else 1
+
+        for index, value in enumerate(sequence):
+            key = sign * value
+            length = bisect_left(tail_values, key)
+            predecessors[index] = tail_indices[length - 1] if length else -1
+            if length == len(tail_values):
+                tail_values.append(key)
+                tail_indices.append(index)
+            else:
+                tail_values[length] = key
+                tail_indices[length] = index
 
-    def increasing_series(self, window: list) -> bool:
-        for step in range(len(window) - 1):
-            number1, number2 = window[step: step + 2]
-            if number1 > number2:
-                return False
-        
-        return True
-    
-    def decreasing_series(self, window: list) -> bool:
-        for step in range(len(window) - 1):
-            number1, number2 = window[step: step + 2]
-            if number1 < number2:
-                return False
-        
-        return True
-      
-    def remove_minimum(self, window: list) -> list:
-        window.remove(min(window))
-        return window
+        # Follow the predecessors back from the end of the longest subsequence
+        subsequence = array("i", bytes(4 * len(tail_indices)))
+        index = tail_indices[-1] if tail_indices else -1
+        for position in range(len(tail_indices) - 1, -1, -1):
+            subsequence[position] = sequence[index]
+            index = predecessors[index]
+
+        return subsequence
 
-        # 1, 2, 3
     def find_increasing_subseq(self):
-        # Initialize current window and longest sequence
-        current_window = self.permutation.copy()
-        
-        while self.increasing_series(current_window) == False:
-            current_window = self.remove_maximum(current_window)
-        
-        self.increasing_seq = current_window
-    
+        self.increasing_seq = self.longest_subsequence(self.permutation)
+
     def find_decreasing_subseq(self):
-        # Initialize current window and longest sequence
-        current_window = self.permutation.copy()
-        
-        while self.decreasing_series(current_window) == False:
-            current_window = self.remove_minimum(current_window)
-        
-        self.decreasing_seq = current_window
+        self.decreasing_seq = self.longest_subsequence(self.permutation, decreasing=True)
+
+    def write_result(self):
+        with open(self.output_path, "w") as file:
+            file.write(" ".join(map(str, self.increasing_seq)) + "\n")
+            file.write(" ".join(map(str, self.decreasing_seq)) + "\n")
 
 def main():
     subsequence_finder = LongestSubsequences()
-    subsequence_finder.permutation = [5, 1, 4, 2, 3]
+    subsequence_finder.read_permutation()
     subsequence_finder.find_increasing_subseq()
     subsequence_finder.find_decreasing_subseq()
-    print(subsequence_finder.increasing_seq)
-    print(subsequence_finder.decreasing_seq)
+    subsequence_finder.write_result()
 
 if __name__ == "__main__":
     main()
-           
-
-        
-            
-            
-                
-    
-    
-
-    
-    
\ No newline at end of file
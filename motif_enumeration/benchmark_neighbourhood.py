@@ -0,0 +1,50 @@
+import random
+import time
+from functions.neighbourhood import generate_direct_neighbours, iterate_d_neighbourhood
+
+# k-mer size and Hamming distance of the benchmark
+K_SIZE = 15
+DISTANCE = 3
+REPEATS = 5
+
+def legacy_d_neighbourhood(sequence: str, distance: int) -> list:
+    """
+    Generates the d-neighbourhood like the former implementation, expanding all direct
+    neighbours of the accumulated neighbourhood in every round and removing duplicates.
+    """
+
+    neighbourhood = [sequence]
+    for _ in range(distance):
+        current_neighbours = []
+        for seq in neighbourhood:
+            current_neighbours += generate_direct_neighbours(sequence=seq)
+        neighbourhood = list(set(neighbourhood + current_neighbours))
+    return neighbourhood
+
+def time_function(function) -> tuple:
+    """
+    Returns the number of neighbours and the best runtime in seconds of REPEATS calls.
+    """
+
+    best_time = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        size = function()
+        best_time = min(best_time, time.perf_counter() - start)
+    return size, best_time
+
+def main():
+    sequence = "".join(random.Random(0).choice("ACGT") for _ in range(K_SIZE))
+    candidates = (
+        ("iterative", lambda: len(legacy_d_neighbourhood(sequence, DISTANCE))),
+        ("generator", lambda: sum(1 for _ in iterate_d_neighbourhood(sequence, DISTANCE))),
+        ("encoded", lambda: sum(1 for _ in iterate_d_neighbourhood(sequence, DISTANCE, encoded=True))),
+    )
+    print(f"k={K_SIZE}, d={DISTANCE}")
+    print(f"{'method':>10} {'neighbours':>11} {'time [s]':>10}")
+    for name, function in candidates:
+        size, runtime = time_function(function)
+        print(f"{name:>10} {size:>11} {runtime:>10.4f}")
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,44 @@
+from itertools import combinations, product
+
+# Two bit code of every nucleotide
+NUCLEOTIDE_CODES = {"A": 0, "C": 1, "G": 2, "T": 3}
+
+def encode_k_mer(k_mer: str) -> int:
+    """
+    Encodes a DNA sequence as an integer with two bits per nucleotide.
+
+    Parameters:
+    - k_mer (str): The input DNA sequence.
+
+    Returns:
+    - int: The code of the sequence.
+
+    Example:
+    >>> encode_k_mer(k_mer="ATG")
+    14
+    """
+    code = 0
+    for nucleotide in k_mer:
+        code = (code << 2) | NUCLEOTIDE_CODES[nucleotide]
+    return code
+
+def decode_k_mer(code: int, k_size: int) -> str:
+    """
+    Decodes an integer code into a DNA sequence of length k_size.
+
+    Parameters:
+    - code (int): The code of the sequence.
+    - k_size (int): The length of the sequence.
+
+    Returns:
+    - str: The decoded DNA sequence.
+
+    Example:
+    >>> decode_k_mer(code=14, k_size=3)
+    'ATG'
+    """
+    return "".join("ACGT"[(code >> 2 * (k_size - 1 - position)) & 3] for position in range(k_size))
+
 def generate_direct_neighbours(sequence: str) -> list:
     """
     Generates direct neighbors of a given DNA sequence.
@@ -30,6 +71,57 @@ def generate_direct_neighbours(sequence: str) -> list:
     
     return direct_neighbours
 
+def iterate_d_neighbourhood(sequence: str, distance: int, encoded: bool = False):
+    """
+    Lazily generates the d-neighbourhood of a given DNA sequence, yielding every neighbour exactly once.
+
+    The neighbours are enumerated by increasing Hamming distance. For every set of mismatch positions,
+    an odometer over the three alternative nucleotides at these positions produces all neighbours with
+    exactly this set of mismatches, so no neighbour is generated twice and no intermediate lists are built.
+
+    Parameters:
+    - sequence (str): The input DNA sequence.
+    - distance (int): The maximum hamming distance of all neighbours relative to the input sequence.
+    - encoded (bool): Yield neighbours as integers with two bits per nucleotide instead of strings.
+
+    Yields:
+    - str or int: The input sequence followed by its d-neighbours.
+
+    Example:
+    >>> list(iterate_d_neighbourhood(sequence="AT", distance=1))
+    ['AT', 'CT', 'GT', 'TT', 'AA', 'AC', 'AG']
+    >>> list(iterate_d_neighbourhood(sequence="AT", distance=1, encoded=True))
+    [3, 7, 11, 15, 0, 1, 2]
+    """
+    k_size = len(sequence)
+    
+    if encoded:
+        code = encode_k_mer(sequence)
+        # XOR masks replacing the nucleotide at each position by each of the other three
+        substitutions = [
+            [(candidate ^ NUCLEOTIDE_CODES[nucleotide]) << 2 * (k_size - 1 - position)
+             for candidate in range(4) if candidate != NUCLEOTIDE_CODES[nucleotide]]
+            for position, nucleotide in enumerate(sequence)
+            ]
+        for current_distance in range(min(distance, k_size) + 1):
+            for positions in combinations(range(k_size), current_distance):
+                for changes in product(*(substitutions[position] for position in positions)):
+                    neighbour = code
+                    for change in changes:
+                        neighbour ^= change
+                    yield neighbour
+        return
+    
+    nucleotide_list = ["A", "C", "G", "T"]
+    alternatives = [[candidate for candidate in nucleotide_list if candidate != nucleotide] for nucleotide in sequence]
+    for current_distance in range(min(distance, k_size) + 1):
+        for positions in combinations(range(k_size), current_distance):
+            split_sequence = list(sequence)
+            for candidates in product(*(alternatives[position] for position in positions)):
+                for position, candidate in zip(positions, candidates):
+                    split_sequence[position] = candidate
+                yield "".join(split_sequence)
+
 def generate_d_neighbourhood(sequence: str, distance: int) -> list:
     """
     Generates a d-neighborhood of a given DNA sequence.
@@ -42,28 +134,10 @@ def generate_d_neighbourhood(sequence: str, distance: int) -> list:
     - list: A list containing the input sequence and its d-neighbors within the specified distance.
     
     Example:
-    >> generate_d_neighbourhood(sequence="AT")
-    ['AG', 'CG', 'GA', 'TC', 'GG', 'AA', 'AT', 'GT', 'CT', 'CC', 'AC', 'GC', 'TG', 'CA', 'TA', 'TT']
+    >>> generate_d_neighbourhood(sequence="AT", distance=1)
+    ['AT', 'CT', 'GT', 'TT', 'AA', 'AC', 'AG']
     """
-    # Initialize neighbourhood
-    neighbourhood = [sequence]
-    if distance == 0:
-        return neighbourhood
-    
-    for _ in range(distance):
-        # Initialize temporary storage
-        current_neighbours = []
-        # Iterrate over sequences in neighbourhood
-        for seq in neighbourhood:
-            direct_neighbours = generate_direct_neighbours(sequence=seq)
-            current_neighbours += direct_neighbours
-        
-        # Add current neighbours to neighbourhood
-        neighbourhood += current_neighbours
-        # Remove duplicates
-        neighbourhood = list(set(neighbourhood))
-    
-    return neighbourhood
+    return list(iterate_d_neighbourhood(sequence=sequence, distance=distance))
 
 def neighbourhood_dictionary(k_mers: list, distance: int) -> dict:
     """
@@ -84,4 +158,24 @@ def neighbourhood_dictionary(k_mers: list, distance: int) -> dict:
     for k_mer in k_mers:
         neighbourhood_dict[k_mer] = generate_d_neighbourhood(sequence=k_mer, distance=distance)
         
-    return neighbourhood_dict
\ No newline at end of file
+    return neighbourhood_dict
+
+def encoded_neighbourhood(k_mers: list, distance: int) -> set:
+    """
+    Generates the union of the d-neighbourhoods of a list of k-mers as a set of encoded k-mers.
+
+    Parameters:
+    - k_mers (list): A list of k-mers.
+    - distance (int): The maximum Hamming distance for generating d-neighbourhoods.
+
+    Returns:
+    - set: The integer codes of all k-mers within the distance of at least one k-mer.
+
+    Example:
+    >>> sorted(encoded_neighbourhood(k_mers=["AA", "AT"], distance=0))
+    [0, 3]
+    """
+    neighbour_set = set()
+    for k_mer in k_mers:
+        neighbour_set.update(iterate_d_neighbourhood(sequence=k_mer, distance=distance, encoded=True))
+    return neighbour_set
@@ -1,6 +1,15 @@
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+from itertools import repeat
 from pathlib import Path
 import os
 from functions.neighbourhood import generate_d_neighbourhood as neighbourhood_func
+from functions.neighbourhood import encoded_neighbourhood, decode_k_mer
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 class MotifEnumeration:
     """
@@ -13,20 +22,40 @@ class MotifEnumeration:
         distance (int): Maximum Hamming distance.
         neighbourhood (dict): Dictionary of sequences and their k-mers.
         motifs (list): List of found motifs.
+        method (str): Motif search method, one of METHODS.
+        workers (int): Number of processes generating neighbourhoods, None uses all CPUs.
     """
     
     DEFAULT_INPUT_PATH = Path("data.txt")
+    # 'count' counts k-mers in a pooled list, 'intersection' intersects sets of encoded k-mers and
+    # 'bitmap' intersects bitmaps over all 4^k k-mers
+    METHODS = ("count", "intersection", "bitmap")
+    # Largest k for the 'bitmap' method, a bitmap over 4^12 k-mers takes 2 MiB per sequence.
+    # Longer k-mers are intersected as sets
+    BITMAP_LIMIT = 12
     
-    def __init__(self, input_path: str = None):
+    def __init__(self, input_path: str = None, method: str = "count", workers: int = 1):
         """
         Initialize the MotifEnumeration class with default or provided input path.
         
         Args:
             input_path (str, optional): Path to the input file. Defaults to None.
+            method (str, optional): Motif search method, one of METHODS. Defaults to "count".
+            workers (int, optional): Number of processes generating neighbourhoods. 1 runs in the
+                current process and None uses all CPUs. Defaults to 1.
+        
+        Raises:
+            ValueError: If the method or the number of workers is invalid.
         """
         
+        if method not in self.METHODS:
+            raise ValueError(f"Unknown method: {method}")
+        if workers is not None and workers < 1:
+            raise ValueError("Number of workers has to be at least 1")
+        self.workers = workers
         # Initialize with default input path for input data
         self.input_path = input_path or self.DEFAULT_INPUT_PATH
+        self.method = method
         self.sequences = []
         self.k_size = None
         self.distance = None
@@ -75,37 +104,179 @@ class MotifEnumeration:
     def create_neighbours(self) -> None:
         """
         Create d-neighbourhood for each k-mer and update the neighbourhood dictionary.
+        
+        The neighbourhood of a sequence is a list of k-mers for the 'count' method, a set of encoded
+        k-mers for 'intersection' and a bitmap over all 4^k encoded k-mers for 'bitmap' up to
+        BITMAP_LIMIT. With more than one worker the sequences are expanded in parallel processes,
+        each returning the set of encoded k-mers of one sequence, which is kept as set for the
+        'count' method as well.
         """
         
-        # Loop trough k-mers and create d-neighbourhood for each k-mer
-        for sequence, k_mers in self.neighbourhood.items():
-                neighbour_pool = []
-                for k_mer in k_mers:
-                    neighbour_pool.extend(neighbourhood_func(sequence=k_mer, distance=self.distance))
+        if self.workers == 1:
+            if self.method == "count":
+                # Loop trough k-mers and create d-neighbourhood for each k-mer
+                for sequence, k_mers in self.neighbourhood.items():
+                    neighbour_pool = []
+                    for k_mer in k_mers:
+                        neighbour_pool.extend(neighbourhood_func(sequence=k_mer, distance=self.distance))
 
-                self.neighbourhood[sequence] = list(set(neighbour_pool))
+                    self.neighbourhood[sequence] = list(set(neighbour_pool))
+                return
+            neighbour_sets = map(encoded_neighbourhood, self.neighbourhood.values(), repeat(self.distance))
+            self.store_neighbour_sets(neighbour_sets)
+            return
+        
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            neighbour_sets = executor.map(encoded_neighbourhood, self.neighbourhood.values(), repeat(self.distance))
+            self.store_neighbour_sets(neighbour_sets)
+    
+    def store_neighbour_sets(self, neighbour_sets) -> None:
+        """
+        Store the encoded neighbourhood sets in the neighbourhood dictionary in the form of the method.
+        
+        Args:
+            neighbour_sets (iterable): Set of encoded k-mers of each sequence in dictionary order.
+        """
+        
+        for sequence, neighbour_set in zip(list(self.neighbourhood), neighbour_sets):
+            if self.uses_bitmaps():
+                neighbour_set = self.create_bitmap(neighbour_set)
+            self.neighbourhood[sequence] = neighbour_set
+    
+    def uses_bitmaps(self) -> bool:
+        """
+        Check if the neighbourhoods are stored as bitmaps, which is the case for the 'bitmap' method
+        up to BITMAP_LIMIT. Above it the bitmaps would not fit into memory and sets are used instead.
+        
+        Returns:
+            bool: True if the neighbourhoods are stored as bitmaps.
+        """
+        
+        return self.method == "bitmap" and self.k_size <= self.BITMAP_LIMIT
+    
+    def create_bitmap(self, codes: set):
+        """
+        Create a bitmap over all 4^k k-mers with the bits of the given codes set.
+        
+        Code c is bit c & 7 of byte c >> 3, so the bitmap takes 4^k / 8 bytes.
+        
+        Args:
+            codes (set): Encoded k-mers.
+        
+        Returns:
+            numpy.ndarray or int: Array of uint8 bytes if NumPy is installed, otherwise an integer bitset.
+        """
+        
+        if np is not None:
+            bitmap = np.zeros((4 ** self.k_size + 7) // 8, dtype=np.uint8)
+            code_array = np.fromiter(codes, dtype=np.int64, count=len(codes))
+            np.bitwise_or.at(bitmap, code_array >> 3, np.left_shift(1, code_array & 7).astype(np.uint8))
+            return bitmap
+        
+        bitmap = bytearray((4 ** self.k_size + 7) // 8)
+        for code in codes:
+            bitmap[code >> 3] |= 1 << (code & 7)
+        return int.from_bytes(bitmap, "little")
     
     def find_motif(self) -> None:
         """
-        Find motifs that appear in all sequences by counting occurrences in the neighbourhood pool.
+        Find motifs that appear in all sequences.
+        
+        The 'count' method counts occurrences in the neighbourhood pool. The 'intersection' and
+        'bitmap' methods intersect the neighbourhoods of all sequences and stop as soon as the
+        intersection is empty. Encoded sets of parallel workers are intersected for every method.
         """
         
-        # Generate pool of k-mers including d-neighbours
-        pool = []
-        for neighbours in self.neighbourhood.values():
-            pool.extend(neighbours)
-        # Loop trough pool and determine which k-mer occured in all sequencces
-        for k_mer in pool:
-            if pool.count(k_mer) == len(self.neighbourhood.keys()):
-                self.motifs.append(k_mer)
-        # Sort motifs alphabetically remove duplicates
-        self.motifs = sorted(set(self.motifs))
+        if self.uses_bitmaps():
+            motif_codes = self.intersect_bitmaps()
+        elif self.method != "count" or self.workers != 1:
+            motif_codes = self.intersect_sets()
+        else:
+            # Generate pool of k-mers including d-neighbours
+            pool = []
+            for neighbours in self.neighbourhood.values():
+                pool.extend(neighbours)
+            # Loop trough pool and determine which k-mer occured in all sequencces
+            for k_mer in pool:
+                if pool.count(k_mer) == len(self.neighbourhood.keys()):
+                    self.motifs.append(k_mer)
+            # Sort motifs alphabetically remove duplicates
+            self.motifs = sorted(set(self.motifs))
+            return
+        
+        # Ascending codes are in alphabetical order
+        self.motifs = [decode_k_mer(code=code, k_size=self.k_size) for code in sorted(motif_codes)]
+    
+    def intersect_sets(self) -> set:
+        """
+        Intersect the encoded neighbourhood sets, starting with the smallest set.
+        
+        Returns:
+            set: Encoded k-mers present in all neighbourhoods.
+        """
+        
+        neighbour_sets = sorted(self.neighbourhood.values(), key=len)
+        if not neighbour_sets:
+            return set()
+        
+        motif_codes = set(neighbour_sets[0])
+        for neighbour_set in neighbour_sets[1:]:
+            motif_codes.intersection_update(neighbour_set)
+            if not motif_codes:
+                break
+        return motif_codes
+    
+    def intersect_bitmaps(self) -> list:
+        """
+        Intersect the neighbourhood bitmaps with a bitwise AND.
+        
+        Returns:
+            list: Encoded k-mers present in all neighbourhoods.
+        """
+        
+        bitmaps = list(self.neighbourhood.values())
+        if not bitmaps:
+            return []
+        
+        if np is not None:
+            motif_bitmap = bitmaps[0].copy()
+            for bitmap in bitmaps[1:]:
+                motif_bitmap &= bitmap
+                if not motif_bitmap.any():
+                    break
+            # Unpack the bits of the non-zero bytes only
+            positions = np.flatnonzero(motif_bitmap)
+            bits = np.unpackbits(motif_bitmap[positions, np.newaxis], axis=1, bitorder="little")
+            rows, columns = np.nonzero(bits)
+            return (positions[rows] * 8 + columns).tolist()
+        
+        motif_bitmap = bitmaps[0]
+        for bitmap in bitmaps[1:]:
+            motif_bitmap &= bitmap
+            if not motif_bitmap:
+                break
+        
+        # Collect set bits from all non-zero bytes
+        motif_codes = []
+        for position, byte in enumerate(motif_bitmap.to_bytes((4 ** self.k_size + 7) // 8, "little")):
+            if byte:
+                motif_codes.extend(position * 8 + bit for bit in range(8) if byte >> bit & 1)
+        return motif_codes
                             
-def main():
+def main(argv: list = None):
     """
     Main function to execute motif enumeration and print the found motifs.
+    
+    Args:
+        argv (list, optional): Command line arguments. Defaults to sys.argv.
     """
-    motif_enumerator = MotifEnumeration()
+    parser = argparse.ArgumentParser(description="Find (k,d)-motifs in a collection of DNA sequences.")
+    parser.add_argument("input_path", nargs="?", default=None, help="input file, defaults to data.txt")
+    parser.add_argument("--method", choices=MotifEnumeration.METHODS, default="count", help="motif search method")
+    parser.add_argument("--workers", type=int, default=1, help="number of processes generating neighbourhoods, 0 uses all CPUs")
+    args = parser.parse_args(argv)
+    
+    motif_enumerator = MotifEnumeration(input_path=args.input_path, method=args.method, workers=args.workers or None)
     motif_enumerator.input()
     motif_enumerator.create_k_mers()
     motif_enumerator.create_neighbours()
@@ -1,4 +1,4 @@
-from motif_enumeration import MotifEnumeration
+from motif_enumeration import MotifEnumeration, main
 import pytest
 
 # Define inputs according to numbering of rosalind
@@ -80,8 +80,9 @@ output_7 = ['AAACT', 'AAATC', 'AACAC', 'AACAT', 'AACCT', 'AACTA', 'AACTC', 'AACT
             'TTGGG', 'TTGTG', 'TTTAA', 'TTTAC', 'TTTAG', 'TTTAT', 'TTTCA', 'TTTCC', 
             'TTTCG', 'TTTGA', 'TTTGG', 'TTTTA', 'TTTTG']
 
-def test_1():
-    motif_enumeration = MotifEnumeration()
+@pytest.mark.parametrize("method", MotifEnumeration.METHODS)
+def test_1(method):
+    motif_enumeration = MotifEnumeration(method=method)
     motif_enumeration.k_size = k_1
     motif_enumeration.distance = distance_1
     motif_enumeration.sequences = sequences_1
@@ -90,8 +91,9 @@ def test_1():
     motif_enumeration.find_motif()
     assert motif_enumeration.motifs == sorted(output_1)
 
-def test_4():
-    motif_enumeration = MotifEnumeration()
+@pytest.mark.parametrize("method", MotifEnumeration.METHODS)
+def test_4(method):
+    motif_enumeration = MotifEnumeration(method=method)
     motif_enumeration.k_size = k_4
     motif_enumeration.distance = distance_4
     motif_enumeration.sequences = sequences_4
@@ -100,12 +102,77 @@ def test_4():
     motif_enumeration.find_motif()
     assert motif_enumeration.motifs == sorted(output_4)
 
-def test_7():
-    motif_enumeration = MotifEnumeration()
+@pytest.mark.parametrize("method", MotifEnumeration.METHODS)
+def test_7(method):
+    motif_enumeration = MotifEnumeration(method=method)
     motif_enumeration.k_size = k_7
     motif_enumeration.distance = distance_7
     motif_enumeration.sequences = sequences_7
     motif_enumeration.create_k_mers()
     motif_enumeration.create_neighbours()
     motif_enumeration.find_motif()
-    assert motif_enumeration.motifs == sorted(output_7)
\ No newline at end of file
+    assert motif_enumeration.motifs == sorted(output_7)
+
+def test_unknown_method():
+    with pytest.raises(ValueError):
+        MotifEnumeration(method="unknown")
+
+
+@pytest.mark.parametrize("method", MotifEnumeration.METHODS)
+def test_7_parallel(method):
+    motif_enumeration = MotifEnumeration(method=method, workers=2)
+    motif_enumeration.k_size = k_7
+    motif_enumeration.distance = distance_7
+    motif_enumeration.sequences = sequences_7
+    motif_enumeration.create_k_mers()
+    motif_enumeration.create_neighbours()
+    motif_enumeration.find_motif()
+    assert motif_enumeration.motifs == sorted(output_7)
+    # Worker results are reduced by set intersection for every method
+    if method != "bitmap":
+        assert all(isinstance(neighbours, set) for neighbours in motif_enumeration.neighbourhood.values())
+
+
+@pytest.mark.parametrize("method", MotifEnumeration.METHODS)
+def test_main_arguments(method, tmp_path, capsys):
+    input_path = tmp_path / "data.txt"
+    input_path.write_text(f"{k_1} {distance_1}\n" + "\n".join(sequences_1) + "\n")
+    main([str(input_path), "--method", method, "--workers", "2"])
+    assert capsys.readouterr().out.split() == output_1
+
+
+@pytest.mark.parametrize("backend", ["numpy", "integer"])
+def test_7_bitmap_backends(backend, monkeypatch):
+    import motif_enumeration as module
+    if backend == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(module, "np", None)
+    motif_enumeration = MotifEnumeration(method="bitmap")
+    motif_enumeration.k_size = k_7
+    motif_enumeration.distance = distance_7
+    motif_enumeration.sequences = sequences_7
+    motif_enumeration.create_k_mers()
+    motif_enumeration.create_neighbours()
+    # One bit per k-mer
+    bitmap = next(iter(motif_enumeration.neighbourhood.values()))
+    if backend == "numpy":
+        assert bitmap.nbytes == 4 ** k_7 // 8
+    else:
+        assert bitmap.bit_length() <= 4 ** k_7
+    motif_enumeration.find_motif()
+    assert motif_enumeration.motifs == sorted(output_7)
+
+
+def test_7_bitmap_limit(monkeypatch):
+    monkeypatch.setattr(MotifEnumeration, "BITMAP_LIMIT", k_7 - 1)
+    motif_enumeration = MotifEnumeration(method="bitmap")
+    motif_enumeration.k_size = k_7
+    motif_enumeration.distance = distance_7
+    motif_enumeration.sequences = sequences_7
+    motif_enumeration.create_k_mers()
+    motif_enumeration.create_neighbours()
+    # Above the limit the neighbourhoods are intersected as sets
+    assert all(isinstance(neighbours, set) for neighbours in motif_enumeration.neighbourhood.values())
+    motif_enumeration.find_motif()
+    assert motif_enumeration.motifs == sorted(output_7)
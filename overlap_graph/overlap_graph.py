@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Iterator, Tuple
 
 class OverlapGraph:
     
@@ -42,37 +43,46 @@ class OverlapGraph:
         # Save overlap length of sequences (k - 1)
         self.overlap_length = len(self.sequences[0]) - 1
     
-    def construct_graph(self) -> list:
+    def build_prefix_index(self) -> dict:
         """
-        Constructs the overlap graph as an adjacency list.
+        Builds an index of all sequences keyed by their first overlap_length bases.
         
         Returns:
-            list: A sorted adjacency list where each element is a tuple (sequence, matching_sequences).
+            dict: Prefixes as keys and the space separated sequences starting with them as values.
         """
         
-        # Initialize adjacency list
-        adjacency_list = []
-        # Loop trough sequences
+        prefix_index = {}
         for sequence in self.sequences:
-            # Determine suffix of current sequence and find matchin sequences with suffix = prefix
-            suffix = sequence[-self.overlap_length:]
-            matched_sequences = [sequence for sequence in self.sequences if sequence.startswith(suffix)]
+            prefix_index.setdefault(sequence[:self.overlap_length], []).append(sequence)
+        # Join every bucket once so sequences sharing a suffix reuse the same string
+        for prefix, matched_sequences in prefix_index.items():
+            prefix_index[prefix] = " ".join(matched_sequences)
+        return prefix_index
+    
+    def construct_graph(self) -> Iterator[Tuple[str, str]]:
+        """
+        Constructs the overlap graph as an adjacency list that is generated while iterating.
+        
+        Returns:
+            Iterator[Tuple[str, str]]: Tuples (sequence, matching_sequences) sorted by sequence.
+        """
+        
+        # Build prefix index once and look up the suffix of each sequence
+        prefix_index = self.build_prefix_index()
+        # Loop trough sequences in sorted order so edges can be written directly
+        for sequence in sorted(self.sequences):
+            matched_sequences = prefix_index.get(sequence[-self.overlap_length:])
             # If current sequence has a matching sequence, add to graph
             if matched_sequences:
-                adjacency_list.append((sequence, " ".join(matched_sequences)))
-            else:
-                continue
-        
-        # Sort adjacency list
-        sorted_adjacency_list = sorted(adjacency_list, key=lambda x: x[0])
-        return sorted_adjacency_list
+                yield sequence, matched_sequences
     
     def output(self, adjacency_list: list) -> None:
         """
         Writes the adjacency list to the output file.
         
         Args:
-            adjacency_list (list): The adjacency list to be written to the output file.
+            adjacency_list (list): The adjacency list to be written to the output file, edges are
+                written one by one so a generator from construct_graph is streamed.
         """
         
         with open(self.output_path, "w") as file:
@@ -1,56 +1,84 @@
-from utility.pattern_frequency import pattern_frequency
-from utility.pattern_count import pattern_count
+import os
 
-def filter_frequencies(frequency_dict: dict, occurence: int) -> dict:
+def find_clumps(sequence: str, pattern_length: int, clump_length: int, occurence: int) -> list:
     """
-    Filter a dictionary of pattern frequencies, keeping only patterns with frequencies equal or greater than a given occurrence.
+    Find patterns forming (clump_length, occurence)-clumps in a DNA sequence in a single pass.
+
+    A window of length clump_length slides over the sequence while a table keeps the counts of all
+    patterns in the current window. Every step adds the pattern entering the window and removes the
+    pattern leaving it, so the runtime is linear in the sequence length.
 
     Parameters:
-    - frequency_dict (dict): Dictionary containing patterns as keys and their frequencies as values.
-    - occurrence (int): The minimum frequency required to include a pattern.
+    - sequence (str): The DNA sequence to analyze.
+    - pattern_length (int): The length of the patterns.
+    - clump_length (int): The length of the window a clump has to fit in.
+    - occurence (int): The minimum frequency of a pattern within a window to form a clump.
 
     Returns:
-    dict: Filtered dictionary with patterns meeting the occurrence criteria.
+    list: List of patterns that form clumps in the sequence, in the order they are found.
+
+    Example:
+    >>> find_clumps("CGGACTCGACAGATGTGAAGAAATGTGAAGACTGAGTGAAGAGAAGAGGAAACACGACACGACATTGCGACATAATGTACGAATGTAATGTGCCTATGGC", 5, 75, 4)
+    ['CGACA', 'GAAGA', 'AATGT']
     """
-    return {pattern: frequency for pattern, frequency in frequency_dict.items() if frequency >= occurence}
+    if pattern_length > clump_length or clump_length > len(sequence):
+        return []
+
+    window_counts = {}
+    clumped_patterns = {}
+    
+    # Count patterns of the first window
+    for pos in range(clump_length - pattern_length + 1):
+        current_pattern = sequence[pos:pos + pattern_length]
+        window_counts[current_pattern] = window_counts.get(current_pattern, 0) + 1
+    for current_pattern, counter in window_counts.items():
+        if counter >= occurence:
+            clumped_patterns[current_pattern] = None
+    
+    # Slide the window, dropping the first and adding the last pattern
+    for pos in range(1, len(sequence) - clump_length + 1):
+        first_pattern = sequence[pos - 1:pos - 1 + pattern_length]
+        window_counts[first_pattern] -= 1
+        last_pos = pos + clump_length - pattern_length
+        last_pattern = sequence[last_pos:last_pos + pattern_length]
+        counter = window_counts.get(last_pattern, 0) + 1
+        window_counts[last_pattern] = counter
+        if counter >= occurence:
+            clumped_patterns[last_pattern] = None
+            
+    return list(clumped_patterns)
 
-def find_clumps(sequence: str, filtered_dict: dict, occurence: int, clump_length: int) -> list:
+def read_input(input_path: str) -> tuple:
     """
-    Find clumped patterns in a DNA sequence based on a filtered dictionary of pattern frequencies.
+    Read the DNA sequence and the integers k, L and t from a file.
+
+    The first line contains the sequence, the second line the pattern length k, the clump length L
+    and the minimum occurence t separated by spaces.
 
     Parameters:
-    - sequence (str): The DNA sequence to analyze.
-    - filtered_dict (dict): Filtered dictionary of pattern frequencies.
-    - occurrence (int): The desired frequency for a pattern to be considered part of a clump.
-    - clump_length (int): The length of the clump.
+    - input_path (str): Path to the input file.
 
     Returns:
-    list: List of patterns that form clumps in the sequence.
+    tuple: The sequence, pattern length, clump length and occurence.
+
+    Raises:
+    FileNotFoundError: If the input file does not exist or is empty.
     """
-    # Initialize pattern list
-    clumped_patterns = []
+    if not os.path.exists(input_path):
+        raise FileNotFoundError(f"Input file not found: {input_path}")
+    with open(input_path, "r") as file:
+        lines = file.read().split()
+    if not lines:
+        raise FileNotFoundError(f"Empty file")
     
-    # Loop trough filtered dictionary
-    for current_pattern in filtered_dict.keys():
-        # Slide over the sequence with a given window size and count all occurences of pattern
-        for pos in range(len(sequence) - clump_length):
-            current_window = sequence[pos:pos + clump_length + 1]
-            counter = pattern_count(sequence=current_window, pattern=current_pattern)
-            if counter == occurence:
-                clumped_patterns.append(current_pattern)
-                # Exit the inner loop
-                break
-            
-    return clumped_patterns
-
-def main():
-    seq = "CGGACTCGACAGATGTGAAGAAATGTGAAGACTGAGTGAAGAGAAGAGGAAACACGACACGACATTGCGACATAATGTACGAATGTAATGTGCCTATGGC"
-    pattern_len = 5
-    clump_len = 75
-    occurence = 4
-    freq_dict = pattern_frequency(sequence=test_seq, pattern_length=pattern_len)
-    filtered = filter_frequencies(frequency_dict=freq_dict, occurence=occ)
-    clumps = find_clumps(sequence=test_seq, filtered_dict=filtered, occurence=occ, clump_length=window)
-
+    sequence = lines[0]
+    pattern_length, clump_length, occurence = (int(value) for value in lines[1:4])
+    return sequence, pattern_length, clump_length, occurence
 
+def main(input_path: str = "data.txt"):
+    sequence, pattern_length, clump_length, occurence = read_input(input_path)
+    clumps = find_clumps(sequence=sequence, pattern_length=pattern_length, clump_length=clump_length, occurence=occurence)
+    print(" ".join(clumps))
 
+if __name__ == "__main__":
+    main()
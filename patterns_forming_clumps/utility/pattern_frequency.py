@@ -1,3 +1,18 @@
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Two bit code of every nucleotide
+NUCLEOTIDE_CODES = {"A": 0, "C": 1, "G": 2, "T": 3}
+# Largest pattern length counted into a dense table with 4^k entries, the table is only used if
+# it has at most as many entries as the sequence has patterns
+DENSE_LIMIT = 10
+# Largest pattern length whose codes fit into unsigned 64 bit integers
+NUMPY_LIMIT = 32
+
 def pattern_frequency(sequence: str, pattern_length: int) -> dict:
     """
     Calculate the frequency of patterns of a given length in a DNA sequence.
@@ -11,7 +26,7 @@ def pattern_frequency(sequence: str, pattern_length: int) -> dict:
 
     Example:
     >>> pattern_frequency("ATGATGCTAGTAGT", 3)
-    {'ATG': 2, 'TGA': 1, 'GAT': 1, 'ATC': 1, 'GCT': 1, 'CTA': 1, 'TAG': 2, 'AGT': 1, 'GTA': 1}
+    {'ATG': 2, 'TGA': 1, 'GAT': 1, 'TGC': 1, 'GCT': 1, 'CTA': 1, 'TAG': 2, 'AGT': 2, 'GTA': 1}
     """
     # Initialize frequency dictionary
     frequency_dict = {}
@@ -30,3 +45,240 @@ def pattern_frequency(sequence: str, pattern_length: int) -> dict:
         frequency_dict[current_window] += 1
 
     return frequency_dict
+
+
+def encode_pattern(pattern: str) -> int:
+    """
+    Encode a DNA pattern as an integer with two bits per nucleotide.
+
+    Parameters:
+    - pattern (str): The DNA pattern.
+
+    Returns:
+    int: The code of the pattern.
+
+    Example:
+    >>> encode_pattern("ATG")
+    14
+    """
+    code = 0
+    for nucleotide in pattern:
+        if nucleotide not in NUCLEOTIDE_CODES:
+            raise ValueError(f"Invalid nucleotide: {nucleotide}")
+        code = (code << 2) | NUCLEOTIDE_CODES[nucleotide]
+    return code
+
+def decode_pattern(code: int, pattern_length: int) -> str:
+    """
+    Decode an integer code back into a DNA pattern of a given length.
+
+    Parameters:
+    - code (int): The code of the pattern.
+    - pattern_length (int): The length of the pattern.
+
+    Returns:
+    str: The DNA pattern.
+
+    Example:
+    >>> decode_pattern(14, 3)
+    'ATG'
+    """
+    return "".join("ACGT"[(code >> 2 * pos) & 3] for pos in range(pattern_length - 1, -1, -1))
+
+def nucleotide_array(sequence: str):
+    """
+    Convert a DNA sequence into a NumPy array of two bit nucleotide codes.
+
+    Parameters:
+    - sequence (str): The DNA sequence.
+
+    Returns:
+    np.ndarray: One code per nucleotide as unsigned 64 bit integers.
+    """
+    lookup = np.full(256, 255, dtype=np.uint8)
+    for nucleotide, code in NUCLEOTIDE_CODES.items():
+        lookup[ord(nucleotide)] = code
+    values = lookup[np.frombuffer(sequence.encode("ascii"), dtype=np.uint8)]
+    if (values == 255).any():
+        raise ValueError("Sequence contains characters other than A, C, G and T")
+    return values.astype(np.uint64)
+
+def pattern_codes(values, pattern_length: int):
+    """
+    Compute the codes of all patterns of a given length from an array of nucleotide codes.
+
+    Parameters:
+    - values (np.ndarray): Two bit nucleotide codes as returned by nucleotide_array.
+    - pattern_length (int): The length of the patterns.
+
+    Returns:
+    np.ndarray: The code of the pattern starting at every position.
+    """
+    pattern_number = len(values) - pattern_length + 1
+    if pattern_number <= 0:
+        return np.zeros(0, dtype=np.uint64)
+    codes = np.zeros(pattern_number, dtype=np.uint64)
+    for offset in range(pattern_length):
+        codes <<= np.uint64(2)
+        codes |= values[offset:offset + pattern_number]
+    return codes
+
+def rolling_codes(sequence: str, pattern_length: int):
+    """
+    Yield the codes of all patterns of a given length by rolling a two bit hash over the sequence.
+
+    Parameters:
+    - sequence (str): The DNA sequence.
+    - pattern_length (int): The length of the patterns.
+
+    Yields:
+    int: The code of the pattern starting at every position.
+
+    Example:
+    >>> list(rolling_codes("ATGA", 3))
+    [14, 56]
+    """
+    mask = (1 << 2 * pattern_length) - 1
+    code = 0
+    for pos, nucleotide in enumerate(sequence):
+        if nucleotide not in NUCLEOTIDE_CODES:
+            raise ValueError(f"Invalid nucleotide: {nucleotide}")
+        code = ((code << 2) | NUCLEOTIDE_CODES[nucleotide]) & mask
+        if pos >= pattern_length - 1:
+            yield code
+
+def new_count_table(pattern_length: int, sequence_length: int):
+    """
+    Create an empty count table, dense for pattern lengths up to DENSE_LIMIT if the sequence has at
+    least 4^k patterns and a dictionary otherwise.
+    """
+    if pattern_length <= DENSE_LIMIT and 4 ** pattern_length <= sequence_length - pattern_length + 1:
+        if np is not None:
+            return np.zeros(4 ** pattern_length, dtype=np.int64)
+        return array("q", bytes(8 * 4 ** pattern_length))
+    return {}
+
+def code_frequencies(sequence: str, pattern_length: int):
+    """
+    Count all patterns of a given length by their two bit codes.
+
+    For pattern lengths up to DENSE_LIMIT the counts are stored in a table with 4^k entries indexed
+    by code, a NumPy array if NumPy is installed, as long as the sequence has at least 4^k patterns.
+    Otherwise patterns are counted in a dictionary mapping codes to counts, so memory only grows
+    with the number of distinct patterns.
+
+    Parameters:
+    - sequence (str): The DNA sequence to analyze.
+    - pattern_length (int): The length of patterns to count.
+
+    Returns:
+    np.ndarray, array or dict: Counts indexed by pattern code.
+
+    Example:
+    >>> counts = code_frequencies("ATGATGCTAGTAGT", 3)
+    >>> int(counts[encode_pattern("ATG")])
+    2
+    """
+    return batch_code_frequencies(sequence, [pattern_length])[pattern_length]
+
+def batch_code_frequencies(sequence: str, pattern_lengths: list) -> dict:
+    """
+    Count the patterns of several lengths in one pass over the sequence.
+
+    The sequence is encoded once. With NumPy the codes of every length are computed from the shared
+    nucleotide array, otherwise a single rolling code of the largest length is kept and the pattern
+    of every smaller length ending at the current position is its lowest bits.
+
+    Parameters:
+    - sequence (str): The DNA sequence to analyze.
+    - pattern_lengths (list): The lengths of patterns to count.
+
+    Returns:
+    dict: Count table of every pattern length, see code_frequencies.
+
+    Example:
+    >>> counts = batch_code_frequencies("ATGATG", [1, 3])
+    >>> int(counts[1][encode_pattern("G")]), int(counts[3][encode_pattern("ATG")])
+    (2, 2)
+    """
+    pattern_lengths = sorted(set(pattern_lengths))
+    if not pattern_lengths or pattern_lengths[0] < 1:
+        raise ValueError("Pattern lengths have to be at least 1")
+    tables = {pattern_length: new_count_table(pattern_length, len(sequence)) for pattern_length in pattern_lengths}
+
+    if np is not None and pattern_lengths[-1] <= NUMPY_LIMIT:
+        values = nucleotide_array(sequence)
+        for pattern_length, table in tables.items():
+            codes = pattern_codes(values, pattern_length)
+            if isinstance(table, dict):
+                unique_codes, counts = np.unique(codes, return_counts=True)
+                table.update(zip(unique_codes.tolist(), counts.tolist()))
+            else:
+                table += np.bincount(codes.astype(np.int64), minlength=len(table))
+        return tables
+
+    masks = [(pattern_length, (1 << 2 * pattern_length) - 1, tables[pattern_length]) for pattern_length in pattern_lengths]
+    longest_mask = masks[-1][1]
+    code = 0
+    for pos, nucleotide in enumerate(sequence):
+        if nucleotide not in NUCLEOTIDE_CODES:
+            raise ValueError(f"Invalid nucleotide: {nucleotide}")
+        code = ((code << 2) | NUCLEOTIDE_CODES[nucleotide]) & longest_mask
+        for pattern_length, mask, table in masks:
+            if pos < pattern_length - 1:
+                break
+            if isinstance(table, dict):
+                table[code & mask] = table.get(code & mask, 0) + 1
+            else:
+                table[code & mask] += 1
+    return tables
+
+def count_pattern(sequence: str, pattern: str) -> int:
+    """
+    Count the occurrences of a pattern in a sequence by comparing two bit codes, the vectorized
+    equivalent of pattern_count. Overlapping occurrences are counted.
+
+    Parameters:
+    - sequence (str): The DNA sequence to search.
+    - pattern (str): The pattern to count.
+
+    Returns:
+    int: The count of occurrences of the pattern in the sequence.
+
+    Example:
+    >>> count_pattern("ATATAT", "AT")
+    3
+    """
+    pattern_length = len(pattern)
+    if pattern_length > len(sequence):
+        return 0
+    pattern_code = encode_pattern(pattern)
+    if np is not None and pattern_length <= NUMPY_LIMIT:
+        codes = pattern_codes(nucleotide_array(sequence), pattern_length)
+        return int(np.count_nonzero(codes == np.uint64(pattern_code)))
+    return sum(1 for code in rolling_codes(sequence, pattern_length) if code == pattern_code)
+
+def decode_frequencies(counts, pattern_length: int) -> dict:
+    """
+    Convert a count table of pattern codes into a dictionary of patterns and their frequencies.
+
+    Parameters:
+    - counts (np.ndarray, array or dict): Counts indexed by pattern code.
+    - pattern_length (int): The length of the patterns.
+
+    Returns:
+    dict: A dictionary where keys are patterns and values are their frequencies, ordered by pattern.
+
+    Example:
+    >>> decode_frequencies(code_frequencies("ATGATG", 3), 3)
+    {'ATG': 2, 'GAT': 1, 'TGA': 1}
+    """
+    if isinstance(counts, dict):
+        items = sorted(counts.items())
+    elif np is not None and isinstance(counts, np.ndarray):
+        # Only visit the occupied slots of the dense table
+        codes = np.flatnonzero(counts)
+        items = zip(codes.tolist(), counts[codes].tolist())
+    else:
+        items = ((code, count) for code, count in enumerate(counts) if count)
+    return {decode_pattern(code, pattern_length): int(count) for code, count in items if count}
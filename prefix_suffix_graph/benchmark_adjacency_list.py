@@ -0,0 +1,56 @@
+import random
+import time
+from prefix_suffix_graph import PrefixSuffixGraph
+
+# Number of FASTA records, their length and the k-mer length of the benchmark
+RECORD_COUNTS = [10**3, 10**4, 10**5, 10**6]
+SEQUENCE_LENGTH = 50
+K_MER_LENGTH = 10
+# The former nested loop is only timed up to this number of records
+NESTED_LOOP_LIMIT = 10**4
+
+def random_records(record_count: int, seed: int = 0) -> dict:
+    """
+    Creates a dictionary of random DNA sequences with FASTA like IDs.
+    """
+
+    rng = random.Random(seed)
+    return {
+        f"Rosalind_{record}": "".join(rng.choice("ACGT") for _ in range(SEQUENCE_LENGTH))
+        for record in range(record_count)
+    }
+
+def nested_loop_adjacency_list(prefix_dict: dict, suffix_dict: dict) -> dict:
+    """
+    Creates the adjacency list like the former nested loop over both dictionaries.
+    """
+
+    adjacency_list = {}
+    for seq_id_suf, suffix in suffix_dict.items():
+        adjacent_ids = [seq_id_pre for seq_id_pre, prefix in prefix_dict.items()
+                        if seq_id_suf != seq_id_pre and suffix == prefix]
+        if adjacent_ids:
+            adjacency_list[seq_id_suf] = adjacent_ids
+    return adjacency_list
+
+def main():
+    overlap_graphs = PrefixSuffixGraph()
+    print(f"{'records':>10} {'edges':>8} {'hash join [s]':>14} {'nested loop [s]':>16}")
+    for record_count in RECORD_COUNTS:
+        seq_dict = random_records(record_count)
+        prefix_dict, suffix_dict = overlap_graphs.create_k_mers(seq_dict, k_mer_length=K_MER_LENGTH)
+
+        start = time.perf_counter()
+        edge_count = sum(1 for _ in overlap_graphs.create_adjacency_list(prefix_dict, suffix_dict))
+        join_time = time.perf_counter() - start
+
+        nested_time = "-"
+        if record_count <= NESTED_LOOP_LIMIT:
+            start = time.perf_counter()
+            nested_loop_adjacency_list(prefix_dict, suffix_dict)
+            nested_time = f"{time.perf_counter() - start:.3f}"
+
+        print(f"{record_count:>10} {edge_count:>8} {join_time:>14.3f} {nested_time:>16}")
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,6 @@
-from Utility. fasta_reader import read_fasta
+from Utility.fasta_reader import read_fasta
 import os
-from typing import Dict, Tuple
+from typing import Dict, Iterator, Tuple
 
 class PrefixSuffixGraph:
     """Class to represent a Prefix-Suffix Graph for a collection of DNA strings."""
@@ -41,60 +41,66 @@ class PrefixSuffixGraph:
         
         return seq_dict
     
-    def create_k_mers(self, seq_dict: Dict[str, str]) -> Tuple[Dict[str, str], Dict[str, str]]:
+    def create_k_mers(self, seq_dict: Dict[str, str], k_mer_length: int = None) -> Tuple[Dict[str, str], Dict[str, str]]:
         """
         Create k-mers (prefixes and suffixes) for each DNA sequence.
 
         Parameters:
         - seq_dict (Dict[str, str]): A dictionary mapping sequence IDs to their respective DNA sequences.
+        - k_mer_length (int): Length of the k-mers. Defaults to K_MER_LENGTH.
 
         Returns:
         - Tuple[Dict[str, str], Dict[str, str]]: Tuple containing dictionaries of prefixes and suffixes.
         """
-        suffix_dict = {seq_id: seq[:self.K_MER_LENGTH] for seq_id, seq in seq_dict.items()}
-        prefix_dict = {seq_id: seq[-self.K_MER_LENGTH:] for seq_id, seq in seq_dict.items()}
+        k_mer_length = k_mer_length or self.K_MER_LENGTH
+        suffix_dict = {seq_id: seq[:k_mer_length] for seq_id, seq in seq_dict.items()}
+        prefix_dict = {seq_id: seq[-k_mer_length:] for seq_id, seq in seq_dict.items()}
         
         return prefix_dict, suffix_dict
     
-    def create_adjacency_list(self, prefix_dict: Dict[str, str], suffix_dict: Dict[str, str]) -> Dict[str, list]:
+    def create_adjacency_list(self, prefix_dict: Dict[str, str], suffix_dict: Dict[str, str]) -> Iterator[Tuple[str, str]]:
         """
-        Create an adjacency list representing the overlap relationships between DNA sequences.
+        Create the edges representing the overlap relationships between DNA sequences.
+
+        Sequence IDs are grouped by their k-mer on both sides, so only IDs within the same
+        bucket are joined. Edges are generated bucket by bucket while iterating.
 
         Parameters:
         - prefix_dict (Dict[str, str]): A dictionary mapping sequence IDs to their respective prefixes.
         - suffix_dict (Dict[str, str]): A dictionary mapping sequence IDs to their respective suffixes.
 
         Returns:
-        - Dict[str, list]: A dictionary mapping sequence IDs to a list of IDs of sequences that overlap.
+        - Iterator[Tuple[str, str]]: Pairs of sequence IDs whose suffix and prefix overlap.
         """
-        adjacency_list = {}
-        # Iterate over suffixes
+        # Group sequence ids by k-mer
+        prefix_buckets = {}
+        for seq_id_pre, prefix in prefix_dict.items():
+            prefix_buckets.setdefault(prefix, []).append(seq_id_pre)
+        suffix_buckets = {}
         for seq_id_suf, suffix in suffix_dict.items():
-            # Initialize empty list for seq_ids
-            adjacent_ids = []
-            for seq_id_pre, prefix in prefix_dict.items():
-                # Check if seq_id is not the same
-                if seq_id_suf != seq_id_pre:
-                    if suffix == prefix:
-                        adjacent_ids.append(seq_id_pre)
-                        
-            # Append only hits           
-            if adjacent_ids:            
-                adjacency_list[seq_id_suf] = adjacent_ids
+            suffix_buckets.setdefault(suffix, []).append(seq_id_suf)
         
-        return adjacency_list
+        # Join buckets with the same k-mer
+        for k_mer, seq_ids_suf in suffix_buckets.items():
+            seq_ids_pre = prefix_buckets.get(k_mer)
+            if seq_ids_pre is None:
+                continue
+            for seq_id_suf in seq_ids_suf:
+                for seq_id_pre in seq_ids_pre:
+                    # Check if seq_id is not the same
+                    if seq_id_suf != seq_id_pre:
+                        yield seq_id_suf, seq_id_pre
     
-    def write_results(self, adj_list: Dict[str, list]) -> None:
+    def write_results(self, adj_list: Iterator[Tuple[str, str]]) -> None:
         """
-        Write the adjacency list to the output file.
+        Write the edges of the adjacency list to the output file as they are generated.
 
         Parameters:
-        - adj_list (Dict[str, list]): A dictionary mapping sequence IDs to a list of IDs of sequences that overlap.
+        - adj_list (Iterator[Tuple[str, str]]): Pairs of sequence IDs whose suffix and prefix overlap.
         """
         with open(self.output_path, "w") as file:
-            for key in adj_list.keys():
-                for value in adj_list[key]:
-                    file.write(f"{key} {value}\n")
+            for seq_id_1, seq_id_2 in adj_list:
+                file.write(f"{seq_id_1} {seq_id_2}\n")
 
 def main():
     """
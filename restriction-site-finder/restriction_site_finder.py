@@ -1,11 +1,12 @@
 import sys
 import os
-from typing import Tuple
+from typing import Tuple, Iterator
 
 # Import helper functions
 # Can be found in my GitHub repository "Codetoolbox".
 sys.path.append("../Utility")
 from fasta_reader import read_fasta
+from reverse_complement import complement, reverse_complement as shared_reverse_complement
 
 class RestrictionSiteFinder:
     """
@@ -36,7 +37,7 @@ class RestrictionSiteFinder:
         self.output_path = output_path or self.DEFAULT_OUTPUT_PATH
         self.dna_sequence = [] # Initialize an empty list for the DNA sequence
         self.window_range = window_range
-        self.results = {} # Initialize an empty dictionary for results
+        self.results = [] # Initialize an empty list for (position, length) results
         
         
     def read_sequence(self) -> None:
@@ -62,44 +63,7 @@ class RestrictionSiteFinder:
         # Put sequences in string
         self.dna_sequence = "".join(seq_dict.values())
     
-    def create_substrings(self) -> None:
-        """
-        Generates substrings from the DNA sequence and stores them as nested dictionaries.
-
-        Creates substrings of varying window sizes from the DNA sequence. The substrings are
-        stored in a nested dictionary structure:
-        {
-            window_size_1: {position_1: substring_1, position_2: substring_2, ...},
-            window_size_2: {position_1: substring_1, position_2: substring_2, ...},
-            ...
-        }
-
-        The generated substrings are stored in the 'substrings' attribute of the object.
-
-        Returns:
-            None
-        """
-        # Determine lenght of sequence
-        sequence_length = len(self.dna_sequence)
-        # Generate empty dictionary to store window size and nested dictionary
-        window_dict = {}
-        # Unpack window_size tuple to get minimum and maximum window size
-        min_window, max_window = self.window_range
-        # Loop trough different window sizes
-        for window_size in range(min_window, max_window + 1):
-            # Determine how many steps for given window size
-            step_size = sequence_length - (window_size - 1)
-            # Generate empty dictionary to store positions and substrings
-            pos_substrings = {}
-            # Iterate over whole sequence and store positions and substrings
-            for step in range(step_size):
-                substring = self.dna_sequence[step:step + window_size]
-                pos_substrings[step + 1] = substring
-            # Store values in dictionary
-            window_dict[window_size] = pos_substrings
-        self.substrings = window_dict
-    
-    def reverse_complement(self, sequence: str) -> None:
+    def reverse_complement(self, sequence: str) -> str:
         """
         Compute the reverse complement of a DNA sequence.
 
@@ -109,55 +73,82 @@ class RestrictionSiteFinder:
         Returns:
             str: The reverse complement of the input DNA sequence.
 
-        Takes a DNA sequence as input and computes its reverse complement.
-        The reverse complement is obtained by reversing the input sequence and mapping
-        each nucleotide to its complement (A to T, T to A, G to C, and C to G).
+        Uses the shared reverse complement module, which complements the sequence
+        with str.translate and reverses it with a slice.
 
         Example:
             If the input sequence is 'ATGC', the reverse complement will be 'GCAT'.
         """
-        # Reverse DNA sequence
-        rev_seq = sequence[::-1]
-        # Define mapping dictionary
-        mapping_dict = {"A": "T",
-                        "T": "A",
-                        "G": "C",
-                        "C": "G"}
-        # Map characters in sequence
-        complement_seq = [mapping_dict[char] for char in rev_seq]
-        return "".join(complement_seq)
+        return shared_reverse_complement(sequence)
     
-    def find_palindrom(self) -> None:
+    def palindrome_radii(self) -> bytearray:
+        """
+        Compute the radius of the longest reverse palindrome around every center of the DNA sequence.
+
+        Reverse palindromes have an even length, so their center lies between two nucleotides. Center
+        i lies between position i - 1 and i and its radius is expanded while the nucleotide left of
+        the palindrome is the complement of the nucleotide right of it, up to half the maximum window
+        size. This takes O(N·W) time without creating any substrings.
+
+        Returns:
+            bytearray: The radius of every center.
+
+        Raises:
+            ValueError: If the maximum window size exceeds 511, as radii are stored in bytes.
         """
-        Check for palindromic DNA substrings and store results in the 'results' attribute.
+        if self.window_range[1] > 511:
+            raise ValueError("Maximum window size must not exceed 511")
+        sequence = self.dna_sequence
+        complement_sequence = complement(sequence)
+        sequence_length = len(sequence)
+        max_radius = self.window_range[1] // 2
+        radii = bytearray(sequence_length + 1)
+        for center in range(1, sequence_length):
+            radius = 0
+            while (radius < max_radius and radius < center and center + radius < sequence_length
+                   and sequence[center - radius - 1] == complement_sequence[center + radius]):
+                radius += 1
+            radii[center] = radius
+        return radii
+    
+    def iterate_palindromes(self) -> Iterator[Tuple[int, int]]:
+        """
+        Lazily yield every reverse palindrome with a length within 'window_range'.
+
+        A substring of length L starting at position p is a reverse palindrome if the radius of its
+        center p + L / 2 is at least L / 2. The palindromes are yielded sorted by position and length.
 
-        Iterates through the generated DNA substrings of different window sizes
-        and checks if each substring is equal to its reverse complement. If a palindromic
-        sequence is found, the window size and position are stored in the 'results'
-        attribute as key-value pairs.
+        Yields:
+            Tuple[int, int]: The 1-based position and the length of every palindrome.
+        """
+        min_window, max_window = self.window_range
+        radii = self.palindrome_radii()
+        sequence_length = len(self.dna_sequence)
+        # Only even lengths can form reverse palindromes
+        half_lengths = range(max(min_window + 1, 2) // 2, max_window // 2 + 1)
+        for pos in range(sequence_length):
+            for half_length in half_lengths:
+                center = pos + half_length
+                if center + half_length > sequence_length:
+                    break
+                if radii[center] >= half_length:
+                    yield pos + 1, 2 * half_length
+    
+    def find_palindrom(self) -> None:
+        """
+        Find reverse palindromic DNA substrings and store results in the 'results' attribute.
 
         The 'results' attribute has the following format:
-        {
-            position_1: window_size_1,
-            position_2: window_size_2,
+        [
+            (position_1, window_size_1),
+            (position_2, window_size_2),
             ...
-        }
-
-        The method uses the 'reverse_complement' method internally to compute the reverse
-        complement of each DNA substring.
+        ]
 
         Returns:
             None
         """
-        for window_size in self.substrings:
-            for pos in self.substrings[window_size]:
-                # Take one subsequence
-                forward_seq = self.substrings[window_size][pos]
-                # Reverse complement that sequence
-                rev_seq = self.reverse_complement(sequence=forward_seq)
-                # Check if forward sequence matches reverse complement
-                if forward_seq == rev_seq:
-                    self.results[pos] = window_size
+        self.results = list(self.iterate_palindromes())
                     
     def write_result(self) -> None:
         """
@@ -165,7 +156,7 @@ class RestrictionSiteFinder:
 
         First sorts the palindromic results based on their positions. The sorted
         results are then written to the specified output file. Each line in the output file
-        contains a position and its corresponding palindromic window size.
+        contains a position and a palindromic window size.
 
         The 'results' attribute, containing positions and window sizes, is expected to be
         populated by the 'find_palindrom' method before calling this method.
@@ -181,18 +172,30 @@ class RestrictionSiteFinder:
             None
         """
         # First sort results based on positions
-        self.results = dict(sorted(self.results.items()))
+        self.results = sorted(self.results)
+        with open(self.output_path, "w") as file:
+            for pos, size in self.results:
+                file.write(f"{pos} {size}\n")
+    
+    def stream_result(self) -> None:
+        """
+        Write palindromic DNA substrings to the output file while they are found.
+
+        Uses 'iterate_palindromes', so the results are already sorted and never stored.
+
+        Returns:
+            None
+        """
         with open(self.output_path, "w") as file:
-            for pos, size in self.results.items():
-                file.write(f"{pos} {size}\n")      
+            for pos, size in self.iterate_palindromes():
+                file.write(f"{pos} {size}\n")
 
 def main():
     """
     Execute the main workflow for finding palindromic DNA substrings.
 
     This function initializes a RestrictionSiteFinder, reads a DNA sequence from a file,
-    generates substrings, checks for palindromic sequences, and writes the results to an
-    output file.
+    and streams all palindromic sequences to an output file.
 
     Usage:
         python restriction-site-finder.py
@@ -202,9 +205,7 @@ def main():
     """
     restriction_finder = RestrictionSiteFinder()
     restriction_finder.read_sequence()
-    restriction_finder.create_substrings()
-    restriction_finder.find_palindrom()
-    restriction_finder.write_result()
+    restriction_finder.stream_result()
 
 if __name__ == "__main__":
     main()
@@ -1,3 +1,8 @@
+import sys
+# Import shared translation engine
+sys.path.append("../Utility")
+from condon_mapper import translate_sequence, STOP_SYMBOL, UNKNOWN_SYMBOL
+
 class RNATranslator():
     """
     Class for translating mRNA sequences into protein sequences.
@@ -8,22 +13,6 @@ class RNATranslator():
         rna_sequence (str): The mRNA sequence read from the input file.
         protein_sequence (str): The resulting protein sequence after translation.
    """
-    # Define dictionary with codons for mapping
-    CODON_TABLE = {
-        "UUU": "F", "UUC": "F", "UUA": "L", "UUG": "L", "CUU": "L",
-        "CUC": "L", "CUA": "L", "CUG": "L", "AUU": "I", "AUC": "I",
-        "AUA": "I", "AUG": "M", "GUU": "V", "GUC": "V", "GUA": "V",
-        "GUG": "V", "UCU": "S", "UCC": "S", "UCA": "S", "UCG": "S",
-        "CCU": "P", "CCC": "P", "CCA": "P", "CCG": "P", "ACU": "T",
-        "ACC": "T", "ACA": "T", "ACG": "T", "GCU": "A", "GCC": "A",
-        "GCA": "A", "GCG": "A", "UAU": "Y", "UAC": "Y", "UAA": "Stop",
-        "UAG": "Stop", "CAU": "H", "CAC": "H", "CAA": "Q", "CAG": "Q",
-        "AAU": "N", "AAC": "N", "AAA": "K", "AAG": "K", "GAU": "D",
-        "GAC": "D", "GAA": "E", "GAG": "E", "UGU": "C", "UGC": "C", 
-        "UGA": "Stop", "UGG": "W", "CGU": "R", "CGC": "R", "CGA": "R",
-        "CGG": "R", "AGU": "S", "AGC": "S", "AGA": "R", "AGG": "R", 
-        "GGU": "G", "GGC": "G", "GGA": "G", "GGG": "G"
-        }
     
     def __init__(self,input_path="data.txt", output_path="result.txt"):
         """
@@ -48,27 +37,18 @@ class RNATranslator():
     
     def translate(self):
         """
-        Translates the mRNA sequence into a protein sequence using the codon table.
+        Translates the mRNA sequence into a protein sequence using the shared codon table.
+        Stop codons are skipped.
         """
-        # Define list for storage of amino acids
-        amino_acid_seq = []
-        # Loop trough the rna sequence and map each codon to an amino acid
-        num_codons = len(self.rna_sequence) // 3
-        for i in range(num_codons):
-            current_codon = self.rna_sequence[3 * i: 3 * i + 3]
-            current_amino = self.CODON_TABLE.get(current_codon, None)
-            # Print a message when unknown codon is in sequence
-            if current_amino is None:
-                print(f"Unknown codon at position: {3 * i}-{3 * i + 3}")
-            # Check for stop codon
-            if current_amino != "Stop":
-                amino_acid_seq.append(current_amino)
-            
-        # Combine list to string
-        amino_acid_seq = "".join(amino_acid_seq)
+        amino_acid_seq = translate_sequence(self.rna_sequence, mode="RNA")
+        # Print a message when unknown codon is in sequence
+        position = amino_acid_seq.find(UNKNOWN_SYMBOL)
+        while position != -1:
+            print(f"Unknown codon at position: {3 * position}-{3 * position + 3}")
+            position = amino_acid_seq.find(UNKNOWN_SYMBOL, position + 1)
         
-        # Write amino acid sequence in instance variable
-        self.protein_sequence = amino_acid_seq
+        # Write amino acid sequence without stop codons in instance variable
+        self.protein_sequence = amino_acid_seq.replace(STOP_SYMBOL, "")
     
     def write_sequence(self):
         """
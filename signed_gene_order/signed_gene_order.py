@@ -1,134 +1,185 @@
+from concurrent.futures import ProcessPoolExecutor
+from itertools import permutations, product
+from math import factorial
+from typing import Iterator, TextIO
+import os
+import shutil
+import sys
+# Import shared chunked line writer
+sys.path.append("../Utility")
+from line_writer import BUFFER_SIZE, write_lines
+
+
+def signed_permutation_lines(gene_number: int, first_gene: int = None) -> Iterator[str]:
+    """
+    Lazily yields all signed permutations of the genes 1 to n as output lines.
+
+    Every unsigned permutation is combined with all 2^n sign masks. The masks are enumerated by
+    itertools.product over the positive and negative label of every gene, so each signed
+    permutation is a single join of precomputed strings.
+
+    Args:
+    - gene_number (int): The number of genes n.
+    - first_gene (int, optional): Only yield permutations starting with +/- this gene.
+
+    Returns:
+    - Iterator[str]: The signed permutations, space separated and newline terminated.
+
+    Example:
+    >>> list(signed_permutation_lines(2))
+    ['1 2\\n', '1 -2\\n', '-1 2\\n', '-1 -2\\n', '2 1\\n', '2 -1\\n', '-2 1\\n', '-2 -1\\n']
+    """
+    signs = {gene: (str(gene), f"-{gene}") for gene in range(1, gene_number + 1)}
+    if first_gene is None:
+        orders = permutations(signs)
+    else:
+        orders = ((first_gene,) + rest for rest in permutations(gene for gene in signs if gene != first_gene))
+    for order in orders:
+        for signed in product(*[signs[gene] for gene in order]):
+            yield " ".join(signed) + "\n"
+
+
+def write_shard(gene_number: int, first_gene: int, shard_path: str) -> int:
+    """
+    Writes all signed permutations starting with +/- first_gene to a shard file.
+    Runs in a worker process.
+
+    Returns:
+    - int: The number of written permutations.
+    """
+    with open(shard_path, "w", buffering=BUFFER_SIZE) as file:
+        return write_lines(signed_permutation_lines(gene_number, first_gene), file)
+
+
 class PermutationList:
     """
     A class to represent a permutation list.
 
     Attributes:
     - input_n: int, the number of genes for permutation.
-    - genes: List[int], the stock of available numbers for permutations.
-    - results: List[List[int]], the generated permutations.
+    - output_path: str, the file the permutations are written to.
+    - workers: int, the number of processes writing shards, None uses all CPUs.
+    - total: int, the number of signed permutations.
     """
-    
-    def __init__(self) -> None:
+
+    def __init__(self, output_path: str = "results.txt", workers: int = 1) -> None:
         """
         Initializes a PermutationList object with default values.
+
+        Args:
+        - output_path (str): The file the permutations are written to. Defaults to "results.txt".
+        - workers (int): Number of processes, each writing all permutations with one first gene.
+          1 writes in the current process and None uses all CPUs. Defaults to 1.
+
+        Raises:
+        - ValueError: If the number of workers is less than 1.
         """
+        if workers is not None and workers < 1:
+            raise ValueError("Number of workers has to be at least 1")
         self.input_n = None
-        self.genes = None
-        self.results = None
-       
+        self.output_path = output_path
+        self.workers = workers
+        self.total = None
+
     def input(self) -> None:
         """
         Takes user input for the number of genes for permutation.
-        Ensures the input is between 1 and 6.
 
         Raises:
-        - AssertionError: If the input is not between 1 and 6.
+        - AssertionError: If the input is less than 1.
         """
-        
-        self.input_n =  int(input("Please enter a number of genes for permutation between 0 and 6: "))
-        assert (self.input_n <= 6), "Please enter a number less or equal to 6"
+        self.input_n = int(input("Please enter a number of genes for permutation: "))
         assert (self.input_n > 0), "Please enter a number greater or equal to 1"
-        
-        # Generate possible integers for input n
-        self.genes = list(range(self.input_n, 0, -1)) + list(range(-self.input_n, 0))
 
-    def next_gene(self, partial_sequence: list) -> list:
+    def count_permutations(self) -> int:
         """
-        Generates possible next gene sequences based on the given partial sequence.
-
-        Args:
-        - partial_sequence (list): The partial sequence of genes.
+        Calculates the number of signed permutations 2^n * n! without generating them.
 
         Returns:
-        - completed_sequence (list): A list of possible next gene sequences.
+        - int: The number of signed permutations.
 
-        Example:
-        If partial_sequence = [1, -2], and self.genes = [4, 3, 2, 1, -4, -3, -2, -1],
-        this method will return [[1, -2, 3], [1, -2, -3], [1, -2, 4], [1, -2, -4]].
+        Raises:
+        - ValueError: If input_n is not initialized.
         """
-        completed_sequence = []
-        # Create lookup array
-        absolute_values = [abs(value) for value in partial_sequence]
-        # Filter possible next values based on absolute values
-        for next_gene in self.genes:
-            if abs(next_gene) not in absolute_values:
-                completed_sequence.append(partial_sequence + [next_gene])
-                
-        return completed_sequence
-    
-    def generate_permuations(self) -> None:
+        if self.input_n is None:
+            raise ValueError("input_n is not initialized")
+        self.total = factorial(self.input_n) << self.input_n
+        return self.total
+
+    def iterate_permutations(self) -> Iterator[str]:
         """
-        Generates all possible permutations of genes based on the number of genes specified.
+        Lazily yields all signed permutations as output lines.
 
         Returns:
-        - None
+        - Iterator[str]: The signed permutations, space separated and newline terminated.
 
-        Example:
-        If self.input_n = 3 and self.genes = [3, 2, 1, -3, -2, -1],
-        this method will generate all possible permutations of length 3,
-        such as [[3, 2, 1], [2, 3, 1], [-1, 3, -2], ...].
+        Raises:
+        - ValueError: If input_n is not initialized.
         """
-        # Check for necessary instance variables
         if self.input_n is None:
             raise ValueError("input_n is not initialized")
-        if not self.genes:
-            raise ValueError("genes list is empty")
-        
-        # Initialize sequences
-        sequences = self.genes
-        
-        # Iterate n - 1 times
-        for _ in range(self.input_n - 1):
-            # Initialize added sequence with empy list
-            add_seq = []
-            # Iterate over partial sequences
-            for seq in sequences:
-                # Check if seq is a list
-                if type(seq) != list:
-                    seq = [seq]
-                # Add filled up sequences to list
-                add_seq = add_seq + self.next_gene(partial_sequence=seq)
-            # Update sequences to fill up also newly generated sequences
-            sequences = add_seq
-        # Save complete permutations
-        self.results = sequences
-    
+        return signed_permutation_lines(self.input_n)
+
+    def write_sharded(self, file: TextIO) -> None:
+        """
+        Writes all signed permutations in shards by first gene. Every worker process writes the
+        permutations starting with one gene to a part file, the parts are appended to the output in order.
+
+        Args:
+        - file (TextIO): The output file object.
+        """
+        shard_paths = [f"{self.output_path}.part{gene}" for gene in range(1, self.input_n + 1)]
+        try:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                list(executor.map(write_shard, [self.input_n] * self.input_n, range(1, self.input_n + 1), shard_paths))
+            for shard_path in shard_paths:
+                with open(shard_path, "r") as shard:
+                    shutil.copyfileobj(shard, file, BUFFER_SIZE)
+        finally:
+            for shard_path in shard_paths:
+                if os.path.exists(shard_path):
+                    os.remove(shard_path)
+
     def print_results(self) -> None:
         """
-        Prints the generated permutations to a file named "results.txt".
+        Writes the number of signed permutations and all permutations to output_path while they are generated.
 
         Returns:
         - None
         """
-        # Check for absence of results
-        if not self.results:
-            print("No results to print.")
-            return 
-
+        self.count_permutations()
         try:
-            with open("results.txt", "w") as file:
-                file.write(f"{len(self.results)}\n")
-                for result in self.results:
-                    file.write(' '.join(map(str, result)) + '\n')
-                    
-            print("Results printed to 'results.txt'.")
-            
+            with open(self.output_path, "w", buffering=BUFFER_SIZE) as file:
+                file.write(f"{self.total}\n")
+                if self.workers == 1 or self.input_n == 1:
+                    write_lines(self.iterate_permutations(), file)
+                else:
+                    file.flush()
+                    self.write_sharded(file)
+
+            print(f"Results printed to '{self.output_path}'.")
+
         except IOError as e:
             print(f"Error writing to file: {e}")
-        
-def main() -> None:
+
+def main(mode: str = "stream", workers: str = "1") -> None:
     """
     Orchestrates the process of generating permutations and printing results.
+    "count" mode only prints the number of signed permutations.
 
     Returns:
     - None
     """
-    
-    permutation_list = PermutationList()
+
+    permutation_list = PermutationList(workers=int(workers) if workers != "all" else None)
     permutation_list.input()
-    permutation_list.generate_permuations()
-    permutation_list.print_results()
-    
+    if mode == "count":
+        print(permutation_list.count_permutations())
+    elif mode == "stream":
+        permutation_list.print_results()
+    else:
+        raise ValueError(f"Unknown mode: {mode}, choose stream or count")
+
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main(*sys.argv[1:3])
@@ -1,5 +1,7 @@
 import os
-from typing import List
+from array import array
+from bisect import bisect_right
+from typing import Iterable, Iterator, List, Optional, Tuple
 
 # Import helper functions
 # Can be found in my GitHub repository "Codetoolbox".
@@ -15,7 +17,8 @@ class SplicedMotifFinder:
         input_path (str): Path to the input data file.
         output_path (str): Path to the output result file.
         sequence (str): The input sequence.
-        motif (str): The motif to be found in the sequence.
+        motif (str): The motif to be found in the sequence, replaced by its positions once found.
+        position_index (Dict[str, array]): Sorted 1-based positions of every symbol in the sequence.
     """
     
     # Class constants
@@ -37,6 +40,7 @@ class SplicedMotifFinder:
         self.output_path = output_path or self.DEFAULT_OUTPUT_PATH
         self.sequence = None
         self.motif = None
+        self.position_index = None
     
     def read_sequence(self) -> None:
         """
@@ -63,57 +67,85 @@ class SplicedMotifFinder:
         # Output first sequence as sequence and second sequence as motif
         self.sequence, self.motif = seq_dict.values()
     
-    def generate_positions(self) -> List[List[int]]:
+    def build_index(self) -> None:
         """
-        Generates a list of position lists for each character in the motif.
+        Builds the next-occurrence index of the sequence in one pass.
+
+        For every symbol the sorted 1-based positions of its occurrences are stored in a compact
+        integer array, so the next occurrence after any position is found by a binary search.
 
         Returns:
-            List with positions as values.
+            None
         """
-        # Generate empty list to store position lists
-        position_list = []
-        
-        # Iterate over each character of the motif
-        for char_mot in self.motif:
-            character_list = []
-            # Iterate over each character of the sequence
-            for pos, char_seq in enumerate(self.sequence):
-                # Check if characters are equal and append position in sequence
-                if char_mot == char_seq:
-                    character_list.append(pos+1)
-            # Append complete list for each character in motif
-            position_list.append(character_list)
+        position_index = {}
+        for pos, char_seq in enumerate(self.sequence, start=1):
+            positions = position_index.get(char_seq)
+            if positions is None:
+                positions = position_index[char_seq] = array("i")
+            positions.append(pos)
+        self.position_index = position_index
     
-        return position_list
-    
-    def find_spliced_motif(self, pos_lists: List[List[int]]) -> None:
+    def query(self, motif: str) -> Optional[List[int]]:
         """
-        Finds the spliced motif based on the generated position lists.
+        Finds the first occurrence of a motif as subsequence of the indexed sequence.
+
+        Every motif character is matched greedily to its next occurrence after the position of the
+        previous character, which takes O(|motif| log N).
 
         Args:
-            pos_lists (List[List[int]]): List of position lists for each character in the motif.
+            motif (str): The motif to be found.
 
         Returns:
-            None
+            Optional[List[int]]: 1-based positions of the motif characters, None if the motif is
+                not a subsequence of the sequence.
         """
-        # Define empty list for storage of firs spliced motif
-        motif = []
-        # Compute how many lists are in pos_lists
-        length_lists = len(pos_lists)
-        # Iterate over nested lists
-        for i in range(length_lists):
-            # Special case for first element
-            if i == 0:
-                motif.append(pos_lists[i][0])
-            else:
-                # Filter for all positions that are greater than last position
-                pos_lists_filtered = [pos for pos in pos_lists[i] if pos > motif[i-1]]
-                # Append first position that is greater than last position of last motif character
-                motif.append(pos_lists_filtered[0])
+        if self.position_index is None:
+            self.build_index()
         
-        self.motif = motif
+        motif_positions = []
+        last_pos = 0
+        for char_mot in motif:
+            positions = self.position_index.get(char_mot)
+            if positions is None:
+                return None
+            next_index = bisect_right(positions, last_pos)
+            if next_index == len(positions):
+                return None
+            last_pos = positions[next_index]
+            motif_positions.append(last_pos)
         
+        return motif_positions
+    
+    def query_batch(self, motifs: Iterable[str]) -> Iterator[Tuple[str, Optional[List[int]]]]:
+        """
+        Lazily queries many motifs against the indexed sequence, which is indexed only once.
+
+        Args:
+            motifs (Iterable[str]): The motifs to be found.
+
+        Yields:
+            Tuple[str, Optional[List[int]]]: Each motif with its positions, see 'query'.
+        """
+        if self.position_index is None:
+            self.build_index()
+        for motif in motifs:
+            yield motif, self.query(motif)
     
+    def find_spliced_motif(self) -> None:
+        """
+        Finds the spliced motif with the next-occurrence index and stores its positions in 'motif'.
+
+        Raises:
+            ValueError: If the motif is not a subsequence of the sequence.
+
+        Returns:
+            None
+        """
+        motif_positions = self.query(self.motif)
+        if motif_positions is None:
+            raise ValueError("Motif is not a subsequence of the sequence")
+        
+        self.motif = motif_positions
     
     def write_result(self) -> None:
         """
@@ -137,8 +169,8 @@ def main():
     """
     spliced_motif_finder = SplicedMotifFinder()
     spliced_motif_finder.read_sequence()
-    pos_lists = spliced_motif_finder.generate_positions()
-    spliced_motif_finder.find_spliced_motif(pos_lists=pos_lists)
+    spliced_motif_finder.build_index()
+    spliced_motif_finder.find_spliced_motif()
     spliced_motif_finder.write_result()
     
 if __name__ == "__main__":
@@ -1,8 +1,12 @@
 from pathlib import Path
 import random
-import itertools
+import sys
 import logging
 from log_files.configure_logging import setup_logging
+# Import shared graph helpers
+sys.path.append("../Utility")
+from graph_balance import GraphBalance
+from kmer_graph import KmerGraph
 
 class StringReconstruction:
     
@@ -10,7 +14,7 @@ class StringReconstruction:
     DEFAULT_INPUT_PATH = Path("input.txt")
     DEFAULT_OUTPUT_PATH = Path("output.txt")
     
-    def __init__(self, input_path=None, output_path=None):
+    def __init__(self, input_path=None, output_path=None, encoded=False):
         """
         Initialize the StringReconstruction object with input and output file paths.
 
@@ -20,6 +24,8 @@ class StringReconstruction:
             Path to the input file containing sequences (default is "input.txt").
         output_path : str or Path, optional
             Path to the output file to write the reconstructed string (default is "output.txt").
+        encoded : bool, optional
+            Store the graph as 2-bit encoded k-mers in CSR arrays (default is False).
         """
         
         # Setup logging
@@ -30,6 +36,7 @@ class StringReconstruction:
         self.sequences = []
         self.graph = {}
         self.additional_edge = {}
+        self.encoded = encoded
         self.logger = logging.getLogger(__name__)
 
     def read_sequences(self) -> None:
@@ -72,6 +79,10 @@ class StringReconstruction:
         if self.sequences is None:
             raise ValueError("Sequence not initialized")
         
+        if self.encoded:
+            self.graph = KmerGraph.from_kmers(self.sequences)
+            return
+        
         edges = {}
         for sequence in self.sequences:
             prefix, suffix = sequence[:-1], sequence[1:]
@@ -93,47 +104,40 @@ class StringReconstruction:
         """
         
         self.logger.debug("Calculating graph balance")
-        # Identify all unique nodes in the graph
-        nodes = set(list(self.graph.keys()) + list(itertools.chain(*self.graph.values())))
-        # Setup dictionary to count incoming edges and outgoing edges
-        balance_dict = {node: [0, 0] for node in nodes}
-        
-        # Count incoming edges in concatenated list
-        concatenated_nodes = list(itertools.chain(*self.graph.values()))
-        for node in balance_dict.keys():
-            incoming_nodes = concatenated_nodes.count(node)
-            balance_dict[node][0] = incoming_nodes
-        
-        # Count outgoing edges
-        for node in balance_dict.keys():
-            outgoing_nodes = len(self.graph.get(node, []))
-            balance_dict[node][1] = outgoing_nodes
-        self.logger.debug(f"Balance dictionary: {balance_dict}")
-        return balance_dict
+        if self.encoded:
+            return self.graph.balance_dict()
+        # Count incoming and outgoing edges in one pass over the graph
+        balance = GraphBalance(self.graph)
+        return balance.balance_dict()
     
     def graph_cycle(self) -> None:
         """
         Transforms the graph to a cycle by adding an artificial edge if necessary.
+
+        Raises:
+        ------
+        ValueError
+            If the node balance does not allow an Eulerian path.
         """
         
         self.logger.debug("Transform graph to cycle")
+        # Encoded graphs are walked from the start node directly
+        if self.encoded:
+            return
         # Find first and last node
-        balance_dictionary = self.graph_balance()
-        # Initialize variables
-        first_node = None
-        last_node = None
-        for key, values in balance_dictionary.items():
-            # Determine last node
-            if values[1] < values[0]:
-                last_node = key
-                self.logger.debug(f"Found last_node : {last_node}")
-            # Determine first node
-            elif values[1] > values[0]:
-                first_node = key
-                self.logger.debug(f"Found first_node : {first_node}")
+        balance = GraphBalance(self.graph)
+        if not balance.is_eulerian():
+            raise ValueError(f"Graph has no Eulerian path, unbalanced nodes: {balance.violations}")
+        # Nothing to add if graph is already a cycle
+        if balance.start_node is None:
+            self.logger.debug("Graph is already balanced")
+            return
+        first_node, last_node = balance.start_node, balance.end_node
+        self.logger.debug(f"Found first_node : {first_node}")
+        self.logger.debug(f"Found last_node : {last_node}")
 
         # Add artifical edge to connect last node with first node to create balanced graph
-        self.graph[last_node] = [first_node]
+        self.graph.setdefault(last_node, []).append(first_node)
         self.additional_edge[last_node] = [first_node]
         self.logger.debug(f"Additional edge found: {self.additional_edge}")
         self.logger.debug(f"Graph after adding artificial edge: {self.graph}")   
@@ -265,6 +269,8 @@ class StringReconstruction:
         """
         
         self.logger.debug("Walking the graph")
+        if self.encoded:
+            return self.graph.eulerian_path()
         # Initialize a dictionary with unused edges
         unused_edges = self.graph.copy()
         # Initialize a list to track walked path with first node
@@ -293,26 +299,35 @@ class StringReconstruction:
         Linearize a walked path in a graph.
 
         Args:
-            walked_path (list): A list representing the walked path in the graph.
+            walked_path (list): A list representing the walked cycle in the graph.
 
         Returns:
-            list: A linearized path obtained by splitting the walked path at the position of the ending node,
-                and reordering the segments to ensure overlap.
+            list: A linearized path obtained by removing the artificial edge from the cycle and rotating
+                the cycle so that it starts behind this edge. The cycle is returned unchanged if no edge was added.
 
         Raises:
-            ValueError: If the walked path cannot be split into left and right parts due to lack of overlap.
+            ValueError: If the walked path does not contain the artificial edge.
         """
         self.logger.debug(f"Start linearizing graph.")
-        # Split walked path at position of ending node
-        ending_node_position = walked_path.index(str(*list(self.additional_edge.keys())))
+        # Path of encoded graph already starts at the first node
+        if self.encoded:
+            return walked_path
+        # Balanced graph without artificial edge is already a valid path
+        if not self.additional_edge:
+            return walked_path
+        (last_node, (first_node,)), = self.additional_edge.items()
+        # Find the position where the artificial edge last_node -> first_node is walked
+        for ending_node_position in range(len(walked_path) - 1):
+            if walked_path[ending_node_position] == last_node and walked_path[ending_node_position + 1] == first_node:
+                break
+        else:
+            raise ValueError("Walked path cannot be split!")
         self.logger.debug(f"Ending node position: {ending_node_position}")
         left_part = walked_path[:ending_node_position+1]
         right_part = walked_path[ending_node_position+1:]
         self.logger.debug(f"left_part: {left_part}")
         self.logger.debug(f"right_part: {right_part}")
-        # Check that right part and left part overlap
-        if right_part[-1] != left_part[0]:
-            raise ValueError("Walked path cannot be split!")
+        # Cycle starts and ends at the same node, drop it from the left part
         linearized_path = right_part + left_part[1:]
         self.logger.debug(f"Linearized path: {linearized_path}")
         
@@ -333,6 +348,10 @@ class StringReconstruction:
             The reconstructed sequence.
         """
         
+        # Spell encoded path from the last base of each node code
+        if self.encoded:
+            return self.graph.spell_path(linearized_path)
+        
         reconstruction_list = []
         for counter, node in enumerate(linearized_path):
             if counter == 0: